@@ -10,6 +10,12 @@ core.lib.third.spellchecker is thin wrappers around the pyspellchecker module
 core.lib are modules that contain code that is about (but does not modify) the library. somewhat referential to core.functor and core.types.
 
 Updates:
+    2026-10-17 - core.lib.third.spellchecker - dictionary_version no longer needs the SpellChecker built, added merge_spellchecks for spellchecking in chunks
+    2026-10-17 - core.lib.third.spellchecker - the word lists, their variants, and the trie are compiled into a pickle in TEMP_DIRPATH, rebuilt when a list changes
+    2026-10-17 - core.lib.third.spellchecker - corrections go through a bounded LRU keyed by dictionary version and token, optionally persisted
+    2026-10-17 - core.lib.third.spellchecker - one shared SpellChecker per process via get_spell_checker, project words in its frequency list
+    2026-10-17 - core.lib.third.spellchecker - dictionary words are masked in one tokenizing pass with a trie instead of a regex per word
+    2026-10-17 - core.lib.third.spellchecker - pyspellchecker is imported on first spellcheck, not on import
     2026-02-01 - core.lib.third.spellchecker - FIX: wasnt auto-loading the dictionary
     2026-01-25 - core.lib.third.spellchecker - initial commit
 '''
@@ -20,13 +26,19 @@ import os
 import sys
 import logging
 import re
-from typing import Dict, Tuple, List
+import threading
+import collections
+import json
+import hashlib
+import pickle
+from typing import Dict, Tuple, List, Iterable, Any, Optional
 
 # third party imports
-import spellchecker
+# NOTE: pyspellchecker is imported in spellcheck, importing this module should be cheap
 
 # project imports
-from chriscarl.core.lib.stdlib.io import read_text_file
+from chriscarl.core.constants import TEMP_DIRPATH
+from chriscarl.core.lib.stdlib.io import read_text_file, write_text_file
 from chriscarl.files import manifest_documents
 
 SCRIPT_RELPATH = 'chriscarl/core/lib/third/spellchecker.py'
@@ -45,28 +57,344 @@ DICTIONARY = set()
 ACRONYMS = set()
 NAMES = set()
 DICTIONARY_LOW = set()
+DICTIONARY_TRIE = {}  # type: Dict[Any, Any]
 
+SPELL_CHECKER = None  # type: Any
+DICTIONARY_VERSION = ''  # md5 of pyspellcheckers version and the word lists, see dictionary_version
+LOCK = threading.RLock()  # NOTE: reentrant, get_spell_checker loads the dictionary while holding it
 
-def load_dictionary():
-    # type: () -> None
-    if NON_WORDS:
-        return
-    NON_WORDS.update(set(ele for ele in read_text_file(manifest_documents.FILEPATH_NON_WORDS).splitlines() if ele and not ele.startswith('#')))
-    DICTIONARY.update(set(ele for ele in read_text_file(manifest_documents.FILEPATH_DICTIONARY).splitlines() if ele and not ele.startswith('#')))
-    ACRONYMS.update(set(ele for ele in read_text_file(manifest_documents.FILEPATH_ACRONYMS).splitlines() if ele and not ele.startswith('#')))
-    NAMES.update(set(ele for ele in read_text_file(manifest_documents.FILEPATH_NAMES).splitlines() if ele and not ele.startswith('#')))
-    for acronym in list(ACRONYMS):
+REGEX_WORD_ATOM = re.compile(r'\w+')
+TRIE_END = ''  # no atom is empty, so this key can only ever mean "a dictionary entry ends here"
+
+
+def build_dictionary_trie(words):
+    # type: (Iterable[str]) -> Dict[Any, Any]
+    '''
+    Description:
+        entries split into word atoms and the exact text between them, "wi-fi" is wi -> ("-", fi), "du bois" is du -> (" ", bois).
+        leading and trailing punctuation is dropped, \b...\b could never match across it anyway.
+    Arguments:
+        words: Iterable[str]
+            already lowercased
+    Returns:
+        Dict[Any, Any]
+            {first atom: {(separator, next atom): {...}, TRIE_END: True}}
+    '''
+    trie = {}  # type: Dict[Any, Any]
+    for word in words:
+        atoms = list(REGEX_WORD_ATOM.finditer(word))
+        if not atoms:
+            continue
+        node = trie.setdefault(atoms[0].group(0), {})
+        for prev, atom in zip(atoms, atoms[1:]):
+            node = node.setdefault((word[prev.end():atom.start()], atom.group(0)), {})
+        node[TRIE_END] = True
+    return trie
+
+
+def mask_dictionary_words(content, trie):
+    # type: (str, Dict[Any, Any]) -> str
+    '''
+    Description:
+        remove every whole-word dictionary entry from the content in a single pass, longest entry wins.
+        "EDU" is in the dictionary but "scheduled" is untouched, atoms are whole \w+ runs.
+        entries never span a newline, so line numbers survive.
+    Arguments:
+        content: str
+        trie: Dict[Any, Any]
+            from build_dictionary_trie
+    Returns:
+        str
+    '''
+    low_content = content.lower()
+    if len(low_content) != len(content):  # NOTE: a handful of characters lowercase to 2, offsets wouldnt line up
+        low_content = ''.join(ch.lower()[:1] for ch in content)
+    atoms = [(mo.start(), mo.end(), mo.group(0)) for mo in REGEX_WORD_ATOM.finditer(low_content)]
+    pieces = []
+    cursor = 0
+    a = 0
+    while a < len(atoms):
+        node = trie.get(atoms[a][2])
+        if node is None:
+            a += 1
+            continue
+        last = a if TRIE_END in node else -1
+        b = a
+        while b + 1 < len(atoms):
+            node = node.get((low_content[atoms[b][1]:atoms[b + 1][0]], atoms[b + 1][2]))
+            if node is None:
+                break
+            b += 1
+            if TRIE_END in node:
+                last = b
+        if last == -1:
+            a += 1
+            continue
+        pieces.append(content[cursor:atoms[a][0]])
+        cursor = atoms[last][1]
+        a = last + 1
+    pieces.append(content[cursor:])
+    return ''.join(pieces)
+
+
+COMPILED_DICTIONARY_VERSION = 1
+DEFAULT_COMPILED_DICTIONARY_FILEPATH = os.path.join(TEMP_DIRPATH, 'core.lib.third.spellchecker.dictionary.pickle')
+
+
+def dictionary_sources():
+    # type: () -> Dict[str, str]
+    return {
+        'non_words': manifest_documents.FILEPATH_NON_WORDS,
+        'dictionary': manifest_documents.FILEPATH_DICTIONARY,
+        'acronyms': manifest_documents.FILEPATH_ACRONYMS,
+        'names': manifest_documents.FILEPATH_NAMES,
+    }
+
+
+def read_word_list(filepath):
+    # type: (str) -> set
+    return set(ele for ele in read_text_file(filepath).splitlines() if ele and not ele.startswith('#'))
+
+
+def compile_dictionary(sources):
+    # type: (Dict[str, str]) -> Dict[str, Any]
+    '''
+    Description:
+        the word lists, the possessive/plural variants of acronyms and names, the lowercased union, and its trie
+    Arguments:
+        sources: Dict[str, str]
+            like dictionary_sources()
+    Returns:
+        Dict[str, Any]
+            {non_words, dictionary, acronyms, names, dictionary_low, trie}
+    '''
+    non_words, dictionary = read_word_list(sources['non_words']), read_word_list(sources['dictionary'])
+    acronyms, names = read_word_list(sources['acronyms']), read_word_list(sources['names'])
+    for acronym in list(acronyms):
         if acronym[-1] == 's':
-            ACRONYMS.add(f"{acronym}'")
+            acronyms.add(f"{acronym}'")
         else:
-            ACRONYMS.add(f"{acronym}'s")
-            ACRONYMS.add(f"{acronym}s")
-    for name in list(NAMES):
+            acronyms.add(f"{acronym}'s")
+            acronyms.add(f"{acronym}s")
+    for name in list(names):
         if name[-1] == 's':
-            NAMES.add(f"{name}'")
+            names.add(f"{name}'")
         else:
-            NAMES.add(f"{name}'s")
-    DICTIONARY_LOW.update(set(ele.lower() for ele in DICTIONARY.union(NAMES).union(ACRONYMS)))
+            names.add(f"{name}'s")
+    dictionary_low = set(ele.lower() for ele in dictionary.union(names).union(acronyms))
+    return {
+        'non_words': non_words,
+        'dictionary': dictionary,
+        'acronyms': acronyms,
+        'names': names,
+        'dictionary_low': dictionary_low,
+        'trie': build_dictionary_trie(dictionary_low),
+    }
+
+
+def load_compiled_dictionary(sources=None, filepath=DEFAULT_COMPILED_DICTIONARY_FILEPATH):
+    # type: (Optional[Dict[str, str]], str) -> Dict[str, Any]
+    '''
+    Description:
+        compile_dictionary, but from the pickle at filepath when none of the sources changed since it was written.
+        the pickle is a header (version and the mtime/size of every source) then the compiled dictionary,
+        a stale header means the body is never even unpickled.
+    Arguments:
+        sources: Optional[Dict[str, str]]
+            defaults to dictionary_sources()
+        filepath: str
+            the compiled artifact, its only ever written by this process, its a cache, delete it whenever
+    Returns:
+        Dict[str, Any]
+    '''
+    sources = sources or dictionary_sources()
+    header = [COMPILED_DICTIONARY_VERSION, {key: [os.stat(value).st_mtime_ns, os.stat(value).st_size] for key, value in sorted(sources.items())}]
+    try:
+        with open(filepath, 'rb') as rb:
+            if pickle.load(rb) == header:
+                return pickle.load(rb)
+        LOGGER.debug('word lists changed since "%s" was compiled', filepath)
+    except FileNotFoundError:
+        pass
+    except Exception as ex:  # NOTE: truncated, older python, whatever it is, recompiling fixes it
+        LOGGER.debug('ignoring unreadable compiled dictionary "%s": %s', filepath, ex)
+
+    compiled = compile_dictionary(sources)
+    try:
+        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+        tmp_filepath = f'{filepath}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_filepath, 'wb') as wb:
+            pickle.dump(header, wb, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(compiled, wb, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_filepath, filepath)
+    except OSError as ex:
+        LOGGER.warning('could not write the compiled dictionary "%s": %s', filepath, ex)
+    return compiled
+
+
+def load_dictionary():
+    # type: () -> None
+    # NOTE: the trie is filled last, so once its there everything else is too
+    if DICTIONARY_TRIE:
+        return
+    with LOCK:
+        if DICTIONARY_TRIE:
+            return
+        _load_dictionary()
+
+
+def _load_dictionary():
+    # type: () -> None
+    compiled = load_compiled_dictionary()
+    NON_WORDS.update(compiled['non_words'])
+    DICTIONARY.update(compiled['dictionary'])
+    ACRONYMS.update(compiled['acronyms'])
+    NAMES.update(compiled['names'])
+    DICTIONARY_LOW.update(compiled['dictionary_low'])
+    DICTIONARY_TRIE.update(compiled['trie'])
+
+
+def get_spell_checker():
+    # type: () -> Any
+    '''
+    Description:
+        pyspellchecker decompresses and loads its whole english frequency list per SpellChecker(),
+        so every spellcheck in the process shares one, built on first use.
+        the project dictionary is loaded into its frequency list so corrections can land on our words too.
+        lookups and corrections only read it, so sharing across threads is fine once its built.
+    Returns:
+        spellchecker.SpellChecker
+    '''
+    global SPELL_CHECKER
+    if SPELL_CHECKER is not None:
+        return SPELL_CHECKER
+    with LOCK:
+        if SPELL_CHECKER is None:
+            import spellchecker
+
+            load_dictionary()
+            spell = spellchecker.SpellChecker()
+            spell.word_frequency.load_words(sorted(ele for ele in DICTIONARY_LOW if not re.search(r'\s', ele)))
+            SPELL_CHECKER = spell
+    return SPELL_CHECKER
+
+
+def dictionary_version():
+    # type: () -> str
+    '''
+    Description:
+        changes whenever a spellcheck of the same text could come out differently: pyspellchecker or any of our word lists.
+        cheap enough to key caches on, it reads the installed version from package metadata instead of building the SpellChecker.
+    Returns:
+        str
+    '''
+    global DICTIONARY_VERSION
+    if DICTIONARY_VERSION:
+        return DICTIONARY_VERSION
+    with LOCK:
+        if not DICTIONARY_VERSION:
+            import importlib.metadata
+
+            load_dictionary()
+            try:
+                pyspellchecker_version = importlib.metadata.version('pyspellchecker')
+            except importlib.metadata.PackageNotFoundError:
+                pyspellchecker_version = ''
+            blob = json.dumps([pyspellchecker_version, sorted(NON_WORDS), sorted(DICTIONARY), sorted(DICTIONARY_LOW)])
+            DICTIONARY_VERSION = hashlib.md5(blob.encode('utf-8')).hexdigest()
+    return DICTIONARY_VERSION
+
+
+DEFAULT_CORRECTION_CACHE_SIZE = 10000
+
+
+class CorrectionCache(object):
+    '''
+    Description:
+        least recently used {(dictionary version, token): correction}, None is a valid correction (there isnt one).
+        the version is in the key so a dictionary change just stops hitting the old entries, they age out on their own.
+        safe to share across threads, save/load persist it as json in lru order.
+    Arguments:
+        maxsize: int
+    '''
+
+    def __init__(self, maxsize=DEFAULT_CORRECTION_CACHE_SIZE):
+        # type: (int) -> None
+        self.maxsize = maxsize
+        self.corrections = collections.OrderedDict()  # type: collections.OrderedDict[Tuple[str, str], Optional[str]]
+        self.lock = threading.Lock()
+        self.loaded = set()  # type: set
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, version, token):
+        # type: (str, str) -> Tuple[bool, Optional[str]]
+        key = (version, token)
+        with self.lock:
+            if key not in self.corrections:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            self.corrections.move_to_end(key)
+            return True, self.corrections[key]
+
+    def put(self, version, token, correction):
+        # type: (str, str, Optional[str]) -> None
+        with self.lock:
+            self.corrections[(version, token)] = correction
+            self.corrections.move_to_end((version, token))
+            while len(self.corrections) > self.maxsize:
+                self.corrections.popitem(last=False)
+            self.dirty = True
+
+    def load(self, filepath):
+        # type: (str) -> None
+        '''merge what was saved at filepath under whats already here, once per filepath per process'''
+        if filepath in self.loaded or not os.path.isfile(filepath):
+            return
+        try:
+            entries = json.loads(read_text_file(filepath))
+        except (OSError, ValueError) as ex:
+            LOGGER.warning('ignoring unreadable correction cache "%s": %s', filepath, ex)
+            return
+        with self.lock:
+            self.loaded.add(filepath)
+            merged = collections.OrderedDict(((version, token), correction) for version, token, correction in entries)
+            merged.update(self.corrections)
+            while len(merged) > self.maxsize:
+                merged.popitem(last=False)
+            self.corrections = merged
+
+    def save(self, filepath):
+        # type: (str) -> None
+        with self.lock:
+            if not self.dirty and filepath in self.loaded:
+                return
+            entries = [[version, token, correction] for (version, token), correction in self.corrections.items()]
+            self.dirty = False
+            self.loaded.add(filepath)
+        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+        # NOTE: whole file or nothing, parallel builds share this file and the last one in wins
+        tmp_filepath = f'{filepath}.{os.getpid()}.{threading.get_ident()}.tmp'
+        write_text_file(tmp_filepath, json.dumps(entries))
+        os.replace(tmp_filepath, filepath)
+        LOGGER.debug('correction cache %d hits, %d misses, wrote "%s"', self.hits, self.misses, filepath)
+
+
+CORRECTIONS = CorrectionCache()
+
+
+def correction(token_low):
+    # type: (str) -> Optional[str]
+    '''spell.correction is edit distance 2 candidate generation, by far the slowest thing in spellcheck, ask it once per token'''
+    spell = get_spell_checker()
+    version = dictionary_version()
+    hit, corrected = CORRECTIONS.get(version, token_low)
+    if not hit:
+        corrected = spell.correction(token_low)
+        CORRECTIONS.put(version, token_low, corrected)
+    return corrected
 
 
 def clean_line(line):
@@ -100,21 +428,13 @@ def spellcheck(content):
             warning_words - dict of lists {mispelling: [(lineno, line text)]}
             word_count
     '''
-    load_dictionary()
-    spell = spellchecker.SpellChecker()
-    low_content = content.lower()
+    spell = get_spell_checker()
     visited = set()
     error_words = {}
     warning_words = {}
     word_count = 0
 
-    for word in DICTIONARY_LOW:
-        # find each word but EXACTLY that word that stops and ends
-        #   for example, EDU is inside of scheduled, can't have that...
-        for mo in reversed(list(re.finditer(r'\b' + re.escape(word) + r'\b', low_content))):
-            start, end = mo.start(), mo.end()
-            low_content = f'{low_content[:start]}{low_content[end:]}'
-            content = f'{content[:start]}{content[end:]}'
+    content = mask_dictionary_words(content, DICTIONARY_TRIE)
 
     for lineno, line in enumerate(content.splitlines()):
         if not line.strip():
@@ -144,7 +464,7 @@ def spellcheck(content):
                 continue
 
             # this a word not recognized by spell checker OR by dictionary
-            correctwords = spell.correction(token_low)
+            correctwords = correction(token_low)
             if correctwords:
                 # a correction was found
                 if token not in error_words:
@@ -156,3 +476,33 @@ def spellcheck(content):
                 warning_words[token].append((lineno, line))
 
     return error_words, warning_words, word_count
+
+
+def merge_spellchecks(contents, results):
+    # type: (List[str], List[Tuple[T_SPELLCHECK_ERROR, T_SPELLCHECK_WARN, int]]) -> Tuple[T_SPELLCHECK_ERROR, T_SPELLCHECK_WARN, int]
+    '''
+    Description:
+        stitch spellchecks of consecutive chunks back into what spellcheck(''.join(contents)) reports:
+        line numbers shift by the lines before each chunk, and a word only counts where it first shows up, like visited in spellcheck.
+    Arguments:
+        contents: List[str]
+            the chunks, in order
+        results: List[Tuple[T_SPELLCHECK_ERROR, T_SPELLCHECK_WARN, int]]
+            spellcheck(content) of each
+    Returns:
+        Tuple[T_SPELLCHECK_ERROR, T_SPELLCHECK_WARN, int]
+    '''
+    error_words = {}  # type: T_SPELLCHECK_ERROR
+    warning_words = {}  # type: T_SPELLCHECK_WARN
+    word_count = 0
+    visited = set()
+    offset = 0
+    for content, (errors, warnings, count) in zip(contents, results):
+        word_count += count
+        for words, merged in [(errors, error_words), (warnings, warning_words)]:
+            for word, occurrences in words.items():
+                if word.lower() not in visited:
+                    merged[word] = [(lineno + offset, *rest) for lineno, *rest in occurrences]  # type: ignore
+        visited.update(word.lower() for word in list(errors) + list(warnings))
+        offset += content.count('\n')
+    return error_words, warning_words, word_count
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+Author:         Chris Carl
+Email:          chrisbcarl@outlook.com
+Date:           2026-10-17
+Description:
+
+tools.doc_server is a tool which keeps md2latex and md2pdf warm in a long-lived process
+so the edit-build loop only pays for the conversion, not python startup, imports, and the spellcheck dictionary.
+
+Examples:
+    # in one terminal, or in the background
+    $ doc-server serve
+
+    # same arguments as the real tools, relative paths are relative to where you run this
+    $ doc-server md2pdf tests/collateral/md2latex/paper.md -b tests/collateral/md2latex/bibliography.md -o files/examples/md2latex/ieee -t ieee
+    $ doc-server md2latex tests/collateral/md2latex/paper.md -ss
+
+    $ doc-server status
+    $ doc-server stop
+
+Updates:
+    2026-10-17 - tools.doc_server - initial commit
+'''
+
+# stdlib imports
+from __future__ import absolute_import, print_function, division, with_statement  # , unicode_literals
+import os
+import sys
+import logging
+import argparse
+from typing import List, Optional
+from dataclasses import dataclass, field, fields
+from argparse import ArgumentParser
+
+# third party imports
+
+# project imports
+from chriscarl.core.constants import TEMP_DIRPATH
+from chriscarl.core.lib.stdlib.logging import NAME_TO_LEVEL, configure_ez
+from chriscarl.core.lib.stdlib.argparse import ArgparseNiceFormat
+from chriscarl.core.lib.stdlib.os import abspath
+from chriscarl.tools.shed import doc_server
+
+SCRIPT_RELPATH = 'chriscarl/tools/doc_server.py'
+if not hasattr(sys, '_MEIPASS'):
+    SCRIPT_FILEPATH = os.path.abspath(__file__)
+else:
+    SCRIPT_FILEPATH = os.path.abspath(os.path.join(sys._MEIPASS, SCRIPT_RELPATH))  # pylint: disable=no-member
+SCRIPT_DIRPATH = os.path.dirname(SCRIPT_FILEPATH)
+SCRIPT_NAME = os.path.splitext(os.path.basename(__file__))[0]
+THIS_MODULE = sys.modules[__name__]
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(logging.NullHandler())
+
+# argument defaults
+DEFAULT_LOG_FILEPATH = abspath(TEMP_DIRPATH, 'tools.doc_server.log')
+
+# tool constants
+MODES = ['serve', 'status', 'stop'] + list(doc_server.TOOLS)
+
+
+def parse_address(address):
+    # type: (str) -> doc_server.T_ADDRESS
+    '''host:port is tcp, anything else is a unix socket path'''
+    host, _, port = address.rpartition(':')
+    if host and port.isdigit():
+        return (host, int(port))
+    return address
+
+
+@dataclass
+class Arguments:
+    '''
+    Document this class with any specifics for the process function.
+    '''
+    mode: str = ''
+    argv: List[str] = field(default_factory=lambda: [])
+    address: str = ''
+    authkey_filepath: str = doc_server.DEFAULT_AUTHKEY_FILEPATH
+    no_warm: bool = False
+    no_fallback: bool = False
+    # non-app
+    debug: bool = False
+    log_level: str = 'INFO'
+    log_filepath: str = DEFAULT_LOG_FILEPATH
+
+    @classmethod
+    def argparser(cls):
+        # type: () -> ArgumentParser
+        parser = ArgumentParser(prog=SCRIPT_NAME, description=__doc__, formatter_class=ArgparseNiceFormat)
+        app = parser.add_argument_group('doc-server')
+        app.add_argument('mode', type=str, choices=MODES, help='run the server, ask about it, or send it a tool invocation')
+        app.add_argument('argv', nargs=argparse.REMAINDER, help='arguments for the tool, exactly like the console script')
+        app.add_argument(
+            '--address', type=str, default='', help=f'unix socket path or host:port, default {doc_server.DEFAULT_ADDRESS!r}'
+        )
+        app.add_argument('--authkey-filepath', type=str, default=doc_server.DEFAULT_AUTHKEY_FILEPATH, help='shared secret between server and clients')
+        app.add_argument('--no-warm', action='store_true', help='serve without importing the tools and dictionary up front?')
+        app.add_argument('--no-fallback', action='store_true', help='fail if no server is running instead of running the tool here?')
+
+        misc = parser.add_argument_group('misc')
+        misc.add_argument('--debug', action='store_true', help='chose to print debug info')
+        misc.add_argument('--log-level', type=str, default='INFO', choices=NAME_TO_LEVEL, help='log level?')
+        misc.add_argument('--log-filepath', type=str, default=DEFAULT_LOG_FILEPATH, help='log filepath?')
+        return parser
+
+    def process(self):
+        if self.debug:
+            self.log_level = 'DEBUG'
+        configure_ez(level=self.log_level, filepath=self.log_filepath)
+
+    @classmethod
+    def parse(cls, parser=None, argv=None):
+        # type: (Optional[ArgumentParser], Optional[List[str]]) -> Arguments
+        parser = parser or cls.argparser()
+        ns = parser.parse_args(argv)
+        arguments = cls(**(vars(ns)))
+        arguments.process()
+        return arguments
+
+    def to_dict(self):
+        return {fie.name: getattr(self, fie.name) for fie in fields(self)}
+
+
+def main():
+    # type: () -> int
+    parser = Arguments.argparser()
+    if len(sys.argv) == 1:
+        parser.print_help()
+        sys.exit(1)
+
+    args = Arguments.parse(parser=parser)
+    address = parse_address(args.address) if args.address else doc_server.DEFAULT_ADDRESS
+
+    if args.mode == 'serve':
+        try:
+            served = doc_server.serve(address, authkey_filepath=args.authkey_filepath, warm=not args.no_warm)
+        except KeyboardInterrupt:
+            LOGGER.info('ctrl+c detected')
+            return 0
+        LOGGER.info('stopped after serving %d requests', served)
+        return 0
+
+    if args.mode in ('status', 'stop'):
+        tool = doc_server.PING if args.mode == 'status' else doc_server.STOP
+        response = doc_server.send(doc_server.Request(tool), address=address, authkey_filepath=args.authkey_filepath)
+        if response is None:
+            LOGGER.error('no server at %r', address)
+            return 1
+        print(response.output, end='')
+        return response.returncode
+
+    request = doc_server.Request(args.mode, argv=args.argv, cwd=os.getcwd())
+    response = doc_server.send(request, address=address, authkey_filepath=args.authkey_filepath)
+    if response is None:
+        if args.no_fallback:
+            LOGGER.error('no server at %r', address)
+            return 1
+        LOGGER.info('no server at %r, running %r here', address, args.mode)
+        response = doc_server.run_tool(request)
+    print(response.output, end='')
+    LOGGER.debug('%s finished with %d in %0.3f sec', args.mode, response.returncode, response.elapsed)
+    return response.returncode
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -14,6 +14,18 @@ Examples:
     $ doc-watch files   table.md    --md-tables-to-csvs  # leaves behind csvs for each md table
 
 Updates:
+    2026-10-17 - tools.doc_watch - FIX: a markdown file that cant be read leaves its csvs alone, a sibling <name>-tblNN.md keeps its csv
+    2026-10-17 - tools.doc_watch - FIX: startup catch-up only seeds the cache with files it has never seen instead of rewriting the whole tree
+    2026-10-17 - tools.doc_watch - md_tables_to_csvs only rewrites csvs whose table changed, deletes csvs of deleted tables
+    2026-10-17 - tools.doc_watch - changes that are just our own writes coming back around are ignored
+    2026-10-17 - tools.doc_watch - bursts of saves are debounced with --quiet and --max-latency so each burst is processed once
+    2026-10-17 - tools.doc_watch - FIX: finding tables EXACTLY, REGEX_MARKDOWN_TABLE and the "plz" padding replaced by a line based scanner
+    2026-10-17 - tools.doc_watch - transform_md_tables splices in one pass, linear in the number of tables
+    2026-10-17 - tools.doc_watch - table funcs are fused into a single read/scan/write per file, --no-fuse to run them separately
+    2026-10-17 - tools.doc_watch - files are fanned out to a process pool with --jobs, results are aggregated in order
+    2026-10-17 - tools.doc_watch - files already processed cleanly are skipped across restarts via a content cache, --no-cache to force
+    2026-10-17 - tools.doc_watch - dirs scanning is incremental with a persisted directory-mtime index in --cache-dirpath
+    2026-10-17 - tools.doc_watch - dirs mode is event driven now, inotify on linux, polling everywhere else via --watcher
     2026-08-21 09:23 - tools.doc_watch - added resiliance to file deletion, addition, and by side effect, rename
     2026-07-02 12:54 - tools.doc_watch - added md_tables_to_csvs
                        tools.doc_watch - csvs are now sent to a /csvs directory
@@ -26,7 +38,6 @@ Updates:
     2026-02-15 20:45 - tools.doc_watch - started
 
 TODO:
-    - BUG: finding tables EXACTLY still isn't working...
     - the service autoload or something?
     - deal with files that arent matcing the regex?
 '''
@@ -40,8 +51,8 @@ from typing import List, Generator, Optional, Tuple, Dict, Callable
 from dataclasses import dataclass, field, fields
 from argparse import ArgumentParser
 import re
-import time
 import enum
+import concurrent.futures
 
 # third party imports
 
@@ -49,11 +60,12 @@ import enum
 from chriscarl.core.constants import TEMP_DIRPATH
 from chriscarl.core.lib.stdlib.logging import NAME_TO_LEVEL, configure_ez
 from chriscarl.core.lib.stdlib.argparse import ArgparseNiceFormat
-from chriscarl.core.lib.stdlib.os import abspath, walk_regex, relpath, make_dirpath, dirname_filename_ext
+from chriscarl.core.lib.stdlib.os import abspath, relpath, make_dirpath, dirname_filename_ext
 from chriscarl.core.lib.stdlib.io import read_text_file, write_text_file
 from chriscarl.core.lib.stdlib.hashlib import md5
 from chriscarl.core.functors.parse import markdown as md
-from chriscarl.core.types.str import indent, find_lineno_index
+from chriscarl.core.types.str import indent
+from chriscarl.tools.shed import doc_watch
 
 SCRIPT_RELPATH = 'chriscarl/tools/doc_watch.py'
 if not hasattr(sys, '_MEIPASS'):
@@ -70,6 +82,7 @@ LOGGER.addHandler(logging.NullHandler())
 DEFAULT_FIB_INIT = [0, 1]
 DEFAULT_OUTPUT_DIRPATH = abspath(TEMP_DIRPATH, 'tools.doc_watch')
 DEFAULT_LOG_FILEPATH = abspath(TEMP_DIRPATH, 'tools.doc_watch.log')
+DEFAULT_JOBS = min(8, os.cpu_count() or 1)
 
 
 # tool constants
@@ -97,6 +110,14 @@ class Arguments:
     # modes - dirs
     dirpaths: List[str] = field(default_factory=lambda: [])
     exclude: List[str] = field(default_factory=lambda: [])
+    watcher: str = doc_watch.DEFAULT_WATCHER
+    interval: float = doc_watch.DEFAULT_POLL_INTERVAL
+    quiet: float = doc_watch.DEFAULT_QUIET
+    max_latency: float = doc_watch.DEFAULT_MAX_LATENCY
+    cache_dirpath: str = DEFAULT_OUTPUT_DIRPATH
+    no_cache: bool = False
+    jobs: int = DEFAULT_JOBS
+    no_fuse: bool = False
     # modes - files
     filepaths: List[str] = field(default_factory=lambda: [])
     # common
@@ -123,8 +144,16 @@ class Arguments:
         funcs.add_argument('--md-table-pretty', action='store_true', help='auto-format markdown tables?')
         funcs.add_argument('--md-table-pivot', action='store_true', help='pivot and auto-format markdown tables?')
         funcs.add_argument('--md-tables-to-csvs', action='store_true', help='find and extract the tables to csvs?')
+        funcs.add_argument('--jobs', '-j', type=int, default=DEFAULT_JOBS, help='how many files to process at once?')
+        funcs.add_argument('--no-fuse', action='store_true', help='run each func with its own read and write instead of one pass per file?')
         # funcs.add_argument('--md-auto-latex', action='store_true', help='auto-wrap latex looking stuff?')
 
+    @classmethod
+    def add_common_cache(cls, parser):
+        cache = parser.add_argument_group('cache')
+        cache.add_argument('--cache-dirpath', type=str, default=DEFAULT_OUTPUT_DIRPATH, help='where to keep indexes and caches between runs?')
+        cache.add_argument('--no-cache', action='store_true', help='process every file even if it was already processed?')
+
     @classmethod
     def argparser(cls):
         # type: () -> ArgumentParser
@@ -138,7 +167,14 @@ class Arguments:
         group = dirs.add_argument_group('core')
         group.add_argument('dirpaths', type=str, nargs='*', help='where do you want to monitor?')
         group.add_argument('--exclude', type=str, nargs='*', default=[], help='auto-wrap latex looking stuff?')
+        group.add_argument(
+            '--watcher', type=str, default=doc_watch.DEFAULT_WATCHER, choices=[doc_watch.DEFAULT_WATCHER] + list(doc_watch.WATCHERS), help='how to notice changes?'
+        )
+        group.add_argument('--interval', type=float, default=doc_watch.DEFAULT_POLL_INTERVAL, help='seconds between polls if polling')
+        group.add_argument('--quiet', type=float, default=doc_watch.DEFAULT_QUIET, help='seconds a file must be left alone before processing it')
+        group.add_argument('--max-latency', type=float, default=doc_watch.DEFAULT_MAX_LATENCY, help='seconds a busy file waits at most before processing it anyway')
         cls.add_common_funcs(dirs)
+        cls.add_common_cache(dirs)
         cls.add_common_arguments(dirs)
 
         # files
@@ -149,6 +185,7 @@ class Arguments:
         group = files.add_argument_group('core')
         group.add_argument('filepaths', type=str, nargs='*', help='which files do you want to process?')
         cls.add_common_funcs(files)
+        cls.add_common_cache(files)
         cls.add_common_arguments(files)
 
         return parser
@@ -172,84 +209,169 @@ class Arguments:
         return {fie.name: getattr(self, fie.name) for fie in fields(self)}  # escaped for template reasons
 
 
-# NOTE: markdown-processing a little janky, requires prepending a clean table with garbage first like "plz\n<table>\n\nplz"
-REGEX_MARKDOWN_TABLE = re.compile(r'\n(?P<indent>[ \t]*)\|(?P<table>.+?)\|\n\n', flags=re.DOTALL | re.MULTILINE)
+def transform_md_tables(markdown, funcs, extract=False):
+    # type: (str, List[Callable[[str], str]], bool) -> Tuple[str, List[str], List[Tuple[Callable[[str], str], Exception, int]], List[Callable[[str], str]]]
+    '''
+    Description:
+        find the tables once and run every func over each of them in order, the output of one is the input of the next
+    Arguments:
+        markdown: str
+        funcs: List[Callable[[str], str]]
+            table text in, table text out
+        extract: bool
+            collect the final table texts too
+    Returns:
+        Tuple[str, List[str], List[Tuple[Callable[[str], str], Exception, int]], List[Callable[[str], str]]]
+            new markdown, extracted tables, (func, exception, lineno) errors, funcs that actually changed something
+    '''
+    tables = []
+    errors = []
+    changers = []
+    lines = markdown.splitlines(keepends=True)
+    segments = []  # NOTE: assembled once at the end, splicing the string per table is quadratic on big files
+    cursor = 0
+    for md_table in doc_watch.iter_md_tables(lines):
+        table = md_table.text
+
+        replace = False
+        for func in funcs:
+            try:
+                transformed = func(table)
+            except Exception as ex:
+                errors.append((func, ex, md_table.start + 1))
+                continue
+            if transformed != table and func not in changers:
+                changers.append(func)
+            table = transformed
+            replace = True
+
+        if replace:
+            last_line = lines[md_table.end - 1]
+            newline = last_line[len(last_line.rstrip('\r\n')):]
+            replacement = indent(table.rstrip('\r\n'), indent=md_table.indentation)
+            if newline == '\r\n':
+                replacement = replacement.replace('\r\n', '\n').replace('\n', '\r\n')
+            segments.extend(lines[cursor:md_table.start])
+            segments.append(f'{replacement}{newline}')
+            cursor = md_table.end
+        if extract:
+            tables.append(table)
+    segments.extend(lines[cursor:])
+
+    return ''.join(segments), tables, errors, changers
 
 
 def find_md_tables_and(filepaths, func, replace=True, extract=False):
-    # type: (List[str], Callable[[str], str], bool, bool) -> Tuple[List[str], List[Tuple[str, str]], list]
-    '''return a list, list of successfully, errored modified files'''
+    # type: (List[str], Callable[[str], str], bool, bool) -> Tuple[List[str], List[Tuple[str, str]], list, List[str]]
+    '''return a list, list of successfully, errored modified files, what was extracted, and the files that couldnt be read'''
     modifieds = []
     error_file_msgs = []
     returns = []
+    unreadables = []
     for filepath in filepaths:
         LOGGER.debug('%s - "%s"', func, filepath)
+        if not replace:
+            # nothing to write back, stream it
+            try:
+                with open(filepath, 'r', encoding='utf-8') as r:
+                    returns.extend(md_table.text for md_table in doc_watch.iter_md_tables(r))
+            except Exception as ex:
+                LOGGER.info('could not read "%s" bc %s, just ignoring, we might get them on the next pass', filepath, ex)
+                unreadables.append(filepath)
+            continue
         try:
             markdown = read_text_file(filepath)
         except Exception as ex:
             LOGGER.info('could not read "%s" bc %s, just ignoring, we might get them on the next pass', filepath, ex)
+            unreadables.append(filepath)
             continue
         prior_hash = md5(markdown)
-        markdown = f'plz\n{markdown}\n\nplz'  # NOTE: markdown-processing a little janky
-        mos = list(REGEX_MARKDOWN_TABLE.finditer(markdown))
-        for mo in reversed(mos):
-            start, end = mo.span()
-            start += 1  # the prepending \n
-            groups = mo.groupdict()
-            indentation = len(groups['indent'])
-            table = f'|{groups["table"]}|'
-
-            if replace:
-                try:
-                    pretty = func(table)
-                    replacement = indent(pretty, indent=' ' * indentation)
-                except Exception as ex:
-                    lineno = list(find_lineno_index(table, markdown))[0][0] + 1
-                    error_file_msgs.append((filepath, f'{func.__name__!r} failed! {ex}, "{filepath}", line {lineno}'))
-                    continue
-
-                markdown = f'{markdown[:start]}{replacement}\n\n{markdown[end:]}'
-            if extract:
-                returns.insert(0, table)
-
-        markdown = markdown[4:-5]  # NOTE: markdown-processing a little janky
+        markdown, tables, errors, _ = transform_md_tables(markdown, [func], extract=extract)
+        for _, ex, lineno in errors:
+            error_file_msgs.append((filepath, f'{func.__name__!r} failed! {ex}, "{filepath}", line {lineno}'))
+        returns.extend(tables)
+
         replaced_hash = md5(markdown)
         if prior_hash != replaced_hash:
             write_text_file(filepath, markdown)
             modifieds.append(filepath)
-    return modifieds, error_file_msgs, returns
+    return modifieds, error_file_msgs, returns, unreadables
 
 
 def md_table_pretty(filepaths):
-    modifieds, error_file_msgs, _ = find_md_tables_and(filepaths, md.table_prettify, replace=True)
+    modifieds, error_file_msgs, _, _ = find_md_tables_and(filepaths, md.table_prettify, replace=True)
     return modifieds, error_file_msgs
 
 
 def md_table_pivot(filepaths):
-    modifieds, error_file_msgs, _ = find_md_tables_and(filepaths, md.table_pivot, replace=True)
+    modifieds, error_file_msgs, _, _ = find_md_tables_and(filepaths, md.table_pivot, replace=True)
     return modifieds, error_file_msgs
 
 
+def write_table_csvs(filepath, table_texts):
+    # type: (str, List[str]) -> Tuple[List[str], List[str], List[str]]
+    '''
+    Description:
+        csvs go next to the markdown in a /csvs directory, one per table.
+        a csv whose content wouldnt change is left alone so downstream readers dont reload it for nothing,
+        csvs for tables that no longer exist are deleted, unless theyre the csv of a sibling <filename>-tblNN.md.
+        only call this with tables from a successful read, an empty list deletes every csv of the file.
+    Returns:
+        Tuple[List[str], List[str], List[str]]
+            written, skipped, deleted csv filepaths
+    '''
+    dirname, filename, _ = dirname_filename_ext(filepath)
+    new_dirpath = f'{dirname}/csvs'
+    written, skipped, deleted = [], [], []
+    new_filepaths = set()
+    for t, table_text in enumerate(table_texts):
+        if len(table_texts) == 1:
+            new_filepath = f'{new_dirpath}/{filename}.csv'
+        else:
+            new_filepath = f'{new_dirpath}/{filename}-tbl{t:02d}.csv'
+        new_filepaths.add(new_filepath)
+        csv_text = md.table_to_csv(table_text, delimiter=',')
+        if os.path.isfile(new_filepath) and md5(read_text_file(new_filepath)) == md5(csv_text):
+            skipped.append(new_filepath)
+            continue
+        make_dirpath(new_dirpath)
+        write_text_file(new_filepath, csv_text)
+        written.append(new_filepath)
+
+    if os.path.isdir(new_dirpath):
+        regex = re.compile(rf'^{re.escape(filename)}(?P<tbl>-tbl\d{{2,}})?\.csv$')
+        for csv_filename in sorted(os.listdir(new_dirpath)):
+            csv_filepath = f'{new_dirpath}/{csv_filename}'
+            mo = regex.match(csv_filename)
+            if not mo or csv_filepath in new_filepaths:
+                continue
+            if mo.group('tbl') and os.path.isfile(f'{dirname}/{filename}{mo.group("tbl")}.md'):
+                continue  # table-tbl01.md's one and only csv, not table.md's second
+            os.remove(csv_filepath)
+            deleted.append(csv_filepath)
+
+    return written, skipped, deleted
+
+
+def log_table_csvs(filepath, written, skipped, deleted):
+    # type: (str, List[str], List[str], List[str]) -> None
+    if written or deleted:
+        LOGGER.info('csvs for "%s" - %d written, %d unchanged, %d deleted', filepath, len(written), len(skipped), len(deleted))
+
+
 def md_tables_to_csvs(filepaths):
     modifieds_all = []
     error_file_msgs_all = []
-    returns = []
     for f, filepath in enumerate(filepaths):
         # does not modify, just extracts
-        dirname, filename, _ = dirname_filename_ext(filepath)
-        new_dirpath = f'{dirname}/csvs'
-        make_dirpath(new_dirpath)
-        modifieds, error_file_msgs, table_texts = find_md_tables_and([filepath], md.table_pivot, replace=False, extract=True)
+        modifieds, error_file_msgs, table_texts, unreadables = find_md_tables_and([filepath], md.table_pivot, replace=False, extract=True)
         modifieds_all.extend(modifieds)
         error_file_msgs_all.extend(error_file_msgs)
-        returns.extend(table_texts)
-        for t, table_text in enumerate(table_texts):
-            if len(table_texts) == 1:
-                new_filepath = f'{new_dirpath}/{filename}.csv'
-            else:
-                new_filepath = f'{new_dirpath}/{filename}-tbl{t:02d}.csv'
-            csv_text = md.table_to_csv(table_text, delimiter=',')
-            write_text_file(new_filepath, csv_text)
+        if unreadables:
+            # NOTE: as an error the cache wont call it done, it gets another go on the next change
+            error_file_msgs_all.append((filepath, f"'md_tables_to_csvs' could not read \"{filepath}\", csvs left as they were"))
+            continue
+        log_table_csvs(filepath, *write_table_csvs(filepath, table_texts))
     return modifieds_all, error_file_msgs_all
 
 
@@ -258,17 +380,144 @@ KNOWN_FUNCS = {
     md_table_pivot: r'.*\.md$',
     md_tables_to_csvs: r'.*\.md$',
 }
+# what the table funcs actually do to each table, so they can share a single read/scan/write
+TABLE_TRANSFORMS = {
+    md_table_pretty: md.table_prettify,
+    md_table_pivot: md.table_pivot,
+}
+TABLE_EXTRACTORS = {
+    md_tables_to_csvs: write_table_csvs,
+}
 ERROR_PRINTED = {}  # type: Dict[str, str]
 FILEPATHS_MODIFIED = {}  # type: Dict[str, float]
+SELF_WRITTEN = {}  # type: Dict[str, str]
+PARALLEL_THRESHOLD = 4  # fewer files than this arent worth the trip to the pool
+EXECUTOR = None  # type: Optional[concurrent.futures.ProcessPoolExecutor]
+T_FUNC_RESULT = Tuple[List[str], List[Tuple[str, str]]]
 
 
-def process_files(filepaths, used_funcs, cwd=os.getcwd()):
-    # type: (List[str], List[Callable[[List[str]], Tuple[List[str], List[Tuple[str, str]]]]], str) -> Tuple[List[str], List[Tuple[str, str]]]
+def process_file_fused(filepath, used_funcs):
+    # type: (str, List[Callable[[List[str]], T_FUNC_RESULT]]) -> List[T_FUNC_RESULT]
+    '''
+    Description:
+        every used table func on one file with a single read, a single table scan, and at most a single write.
+        same results as running them one after the other, funcs that arent table funcs are run separately after.
+    '''
+    results = {func: ([], []) for func in used_funcs}  # type: Dict[Callable, T_FUNC_RESULT]
+    transforms = [TABLE_TRANSFORMS[func] for func in used_funcs if func in TABLE_TRANSFORMS]
+    extractors = [func for func in used_funcs if func in TABLE_EXTRACTORS]
+    others = [func for func in used_funcs if func not in TABLE_TRANSFORMS and func not in TABLE_EXTRACTORS]
+    transform_to_func = {TABLE_TRANSFORMS[func]: func for func in used_funcs if func in TABLE_TRANSFORMS}
+
+    if transforms or extractors:
+        LOGGER.debug('fused %s - "%s"', [func.__name__ for func in used_funcs], filepath)
+        try:
+            markdown = read_text_file(filepath)
+        except Exception as ex:
+            LOGGER.info('could not read "%s" bc %s, just ignoring, we might get them on the next pass', filepath, ex)
+            markdown = None
+            for func in extractors:
+                results[func][1].append((filepath, f'{func.__name__!r} could not read "{filepath}", csvs left as they were'))
+        if markdown is not None:
+            transformed, tables, errors, changers = transform_md_tables(markdown, transforms, extract=bool(extractors))
+            for transform, ex, lineno in errors:
+                func = transform_to_func[transform]
+                results[func][1].append((filepath, f'{func.__name__!r} failed! {ex}, "{filepath}", line {lineno}'))
+            try:
+                if transformed != markdown:
+                    write_text_file(filepath, transformed)
+                    for transform in changers:
+                        results[transform_to_func[transform]][0].append(filepath)
+                for func in extractors:
+                    log_table_csvs(filepath, *TABLE_EXTRACTORS[func](filepath, tables))
+            except Exception as ex:
+                for func in used_funcs:
+                    results[func][1].append((filepath, f'{func.__name__!r} crashed! {ex}, "{filepath}"'))
+
+    for func, result in zip(others, process_file(filepath, others, fuse=False)):
+        results[func] = result
+    return [results[func] for func in used_funcs]
+
+
+def process_file(filepath, used_funcs, fuse=True):
+    # type: (str, List[Callable[[List[str]], T_FUNC_RESULT]], bool) -> List[T_FUNC_RESULT]
+    '''every used func on one file, in order, since some of them rewrite the file the next one reads'''
+    if fuse:
+        return process_file_fused(filepath, used_funcs)
+    results = []
+    for func in used_funcs:
+        try:
+            results.append(func([filepath]))
+        except Exception as ex:
+            results.append(([], [(filepath, f'{func.__name__!r} crashed! {ex}, "{filepath}"')]))
+    return results
+
+
+def map_files(filepaths, used_funcs, jobs=1, fuse=True):
+    # type: (List[str], List[Callable[[List[str]], T_FUNC_RESULT]], int, bool) -> List[T_FUNC_RESULT]
+    '''
+    Description:
+        run process_file over every file, in a process pool if there are enough files to make it worth it
+    Returns:
+        List[T_FUNC_RESULT]
+            one (successes, failures) per used func, aggregated over all files in the order they were given
+    '''
+    global EXECUTOR
+    if jobs > 1 and len(filepaths) >= PARALLEL_THRESHOLD:
+        if EXECUTOR is None:
+            EXECUTOR = concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+        chunksize = max(1, len(filepaths) // (jobs * 4))
+        per_file = list(EXECUTOR.map(process_file, filepaths, [used_funcs] * len(filepaths), [fuse] * len(filepaths), chunksize=chunksize))
+    else:
+        per_file = [process_file(filepath, used_funcs, fuse=fuse) for filepath in filepaths]
+
+    aggregated = [([], []) for _ in used_funcs]  # type: List[T_FUNC_RESULT]
+    seens = [set() for _ in used_funcs]
+    for results in per_file:
+        for f, (successes, failures) in enumerate(results):
+            aggregated[f][0].extend(success for success in successes if success not in seens[f])
+            seens[f].update(successes)
+            aggregated[f][1].extend(failures)
+    return aggregated
+
+
+def is_self_write(filepath):
+    # type: (str) -> bool
+    '''is the file on disk still exactly what we last wrote to it? then the change is ours and there is nothing to do'''
+    digest = SELF_WRITTEN.get(filepath)
+    if digest is None:
+        return False
+    try:
+        if doc_watch.md5_file(filepath) == digest:
+            return True
+    except OSError:
+        pass
+    del SELF_WRITTEN[filepath]
+    return False
+
+
+def shutdown_executor():
+    # type: () -> None
+    global EXECUTOR
+    if EXECUTOR is not None:
+        EXECUTOR.shutdown()
+        EXECUTOR = None
+
+
+def process_files(filepaths, used_funcs, cwd=os.getcwd(), cache=None, jobs=1, fuse=True):
+    # type: (List[str], List[Callable[[List[str]], T_FUNC_RESULT]], str, Optional[doc_watch.ContentCache], int, bool) -> Tuple[List[str], List[Tuple[str, str]]]
+    filepaths = list(dict.fromkeys(filepaths))  # dedupe, keep order
+    if cache is not None:
+        fresh = set(filepath for filepath in filepaths if cache.is_fresh(filepath))
+        if fresh:
+            LOGGER.debug('skipping %d files unchanged since they were last processed', len(fresh))
+            filepaths = [filepath for filepath in filepaths if filepath not in fresh]
     actually_modified = set()
+    errored = set()
     all_successes, all_errors = [], []
-    for func in used_funcs:
-        successes, failures = func(filepaths)
-        error_file_msgs = [(relpath(tpl[0], cwd=cwd, posix=True), tpl[1]) for tpl in failures]
+    for func, (successes, failures) in zip(used_funcs, map_files(filepaths, used_funcs, jobs=jobs, fuse=fuse)):
+        errored.update(tpl[0] for tpl in failures)
+        error_file_msgs = failures
         if successes:
             LOGGER.info('%r succeeded on %d files', func.__name__, len(successes))
             for success in successes:
@@ -296,13 +545,44 @@ def process_files(filepaths, used_funcs, cwd=os.getcwd()):
     for filepath in actually_modified:
         try:
             update[filepath] = os.path.getmtime(filepath)
+            SELF_WRITTEN[filepath] = doc_watch.md5_file(filepath)
         except FileNotFoundError:
             LOGGER.warning('previously scanned file "%s" was deleted!', filepath)
             continue
     FILEPATHS_MODIFIED.update(update)
+
+    if cache is not None:
+        for filepath in filepaths:
+            if filepath in errored:
+                cache.discard(filepath)  # try again next time
+            else:
+                cache.update(filepath)
+        cache.save()
     return all_successes, all_errors
 
 
+def catch_up(filepaths, used_funcs, cwd=os.getcwd(), cache=None, jobs=1, fuse=True):
+    # type: (List[str], List[Callable[[List[str]], T_FUNC_RESULT]], str, Optional[doc_watch.ContentCache], int, bool) -> Tuple[List[str], List[Tuple[str, str]]]
+    '''
+    Description:
+        dirs mode startup, process the files that changed while we werent watching.
+        files the cache has never seen (first run, new version, different funcs) are only recorded, not processed,
+        same as before there was a cache, theyre picked up the next time they change.
+    '''
+    if cache is None:
+        return [], []
+    seen = [filepath for filepath in filepaths if filepath in cache]
+    unseen = [filepath for filepath in filepaths if filepath not in cache]
+    if unseen:
+        LOGGER.info('seeding the cache with %d files it has never seen, they get processed when they change', len(unseen))
+        for filepath in unseen:
+            cache.update(filepath)
+        cache.save()
+    if not seen:
+        return [], []
+    return process_files(seen, used_funcs, cwd=cwd, cache=cache, jobs=jobs, fuse=fuse)
+
+
 def main():
     # type: () -> int
     parser = Arguments.argparser()
@@ -322,56 +602,68 @@ def main():
     if not used_funcs:
         raise RuntimeError('no functions passed!')
 
-    # scan for files
-    LOGGER.debug('getting mtimes')
-    def scan_dirs():  # for re-use later
-        for dirpath in args.dirpaths:
-            for key in used_patterns:
-                for filepath in walk_regex(dirpath, key, ignore=args.exclude, relpath=False):
-                    if filepath not in FILEPATHS_MODIFIED:
-                        LOGGER.debug('adding file %d - "%s"', filepath)
-                        FILEPATHS_MODIFIED[filepath] = os.path.getmtime(filepath)
+    cache = None
+    if not args.no_cache:
+        cache = doc_watch.ContentCache(abspath(args.cache_dirpath, 'cache.json'), [func.__name__ for func in used_funcs])
+        LOGGER.debug('cache has %d files', len(cache))
 
     if args.mode == Modes.files:
         for filepath in args.filepaths:
             if not any(regex.search(filepath) for regex in used_regexes):
                 raise RuntimeError(f'passed file {filepath!r} does not match any known')
             FILEPATHS_MODIFIED[filepath] = os.path.getmtime(filepath)
-    elif args.mode == Modes.dirs:
-        scan_dirs()
-
-    LOGGER.debug('FILEPATHS_MODIFIED: %s', FILEPATHS_MODIFIED)
-
-    if not FILEPATHS_MODIFIED:
-        raise RuntimeError('not enough files or dirpaths to actually run anything!')
-
+        if not FILEPATHS_MODIFIED:
+            raise RuntimeError('not enough files or dirpaths to actually run anything!')
+        try:
+            process_files(list(FILEPATHS_MODIFIED), used_funcs, cwd=cwd, cache=cache, jobs=args.jobs, fuse=not args.no_fuse)
+        finally:
+            shutdown_executor()
+        return 0
+
+    # NOTE: watcher goes up before the scan so nothing slips through the cracks in between
+    watcher = doc_watch.get_watcher(
+        args.dirpaths, sorted(used_patterns), exclude=args.exclude, mtimes=FILEPATHS_MODIFIED, watcher=args.watcher, interval=args.interval
+    )
+    index_filepath = abspath(args.cache_dirpath, f'index-{watcher.config_hash()}.json')
     try:
-        if args.mode == Modes.files:
-            process_files(list(FILEPATHS_MODIFIED), used_funcs, cwd=cwd)
-        elif args.mode == Modes.dirs:
-            while True:
-                modified_since_last = []
-                filepaths = list(FILEPATHS_MODIFIED)  # since this can get modified during runtime
-                for filepath in filepaths:
-                    try:
-                        modified = os.path.getmtime(filepath)
-                    except FileNotFoundError:
-                        LOGGER.warning('previously scanned file "%s" was deleted!', filepath)
-                        del FILEPATHS_MODIFIED[filepath]
-                        continue
-
-                    if (filepath not in FILEPATHS_MODIFIED  # new file created
-                        or modified > FILEPATHS_MODIFIED[filepath]  # modified more recently
-                        ):
-                        modified_since_last.append(filepath)
-                if modified_since_last:
-                    LOGGER.debug('FILEPATHS_MODIFIED: %s', FILEPATHS_MODIFIED)
-                    process_files(modified_since_last, used_funcs, cwd=cwd)
-                time.sleep(0.33)
-                scan_dirs()
+        LOGGER.debug('getting mtimes')
+        if watcher.load_index(index_filepath):
+            LOGGER.debug('loaded index of %d dirs from "%s"', len(watcher.dirs), index_filepath)
+        watcher.scan()
+        watcher.save_index(index_filepath)
+        LOGGER.debug('FILEPATHS_MODIFIED: %s', FILEPATHS_MODIFIED)
+        if not FILEPATHS_MODIFIED:
+            raise RuntimeError('not enough files or dirpaths to actually run anything!')
+        catch_up(list(FILEPATHS_MODIFIED), used_funcs, cwd=cwd, cache=cache, jobs=args.jobs, fuse=not args.no_fuse)
+
+        LOGGER.info('watching %d files with %r', len(FILEPATHS_MODIFIED), watcher.name)
+        debouncer = doc_watch.Debouncer(quiet=args.quiet, max_latency=args.max_latency)
+        while True:
+            events = watcher.read(timeout=debouncer.timeout())
+            for event in events:
+                LOGGER.debug('%s - "%s"', event.event, event.filepath)
+                if event.event == doc_watch.Events.deleted:
+                    LOGGER.warning('previously scanned file "%s" was deleted!', event.filepath)
+                    debouncer.discard(event.filepath)
+                else:
+                    if event.src_filepath:
+                        debouncer.discard(event.src_filepath)
+                    debouncer.add(event.filepath)
+            modified_since_last = []
+            for filepath in debouncer.pop_due():
+                if is_self_write(filepath):
+                    LOGGER.debug('ignoring our own write to "%s"', filepath)
+                else:
+                    modified_since_last.append(filepath)
+            if modified_since_last:
+                process_files(modified_since_last, used_funcs, cwd=cwd, cache=cache, jobs=args.jobs, fuse=not args.no_fuse)
 
     except KeyboardInterrupt:
         LOGGER.info('ctrl+c detected')
+    finally:
+        watcher.save_index(index_filepath)
+        watcher.close()
+        shutdown_executor()
 
     return 0
 
@@ -13,6 +13,7 @@ Well here you go.
 Was `ipynb-toc-export-execute-html.py` in a former life...
 
 Updates:
+    2026-10-17 - tools.ipynb - selenium is imported only when printing to pdf
     2026-02-26 - tools.ipynb - LaTeX renders correctly now so long as we wait for MathJax to insert DOM elements
     2026-02-23 - tools.ipynb - created chriscarl.tools.documents as 'ipynb'
     2025-07-19 - tools.ipynb - selenium print, shifted toc description to this script rather than embedded somehow in the template.
@@ -58,7 +59,6 @@ from chriscarl.core.lib.stdlib.os import abspath, make_dirpath, is_file, dirpath
 from chriscarl.core.lib.stdlib.io import ReadWriteText, read_text_file
 from chriscarl.core.lib.stdlib.json import ReadWriteJson
 from chriscarl.core.lib.stdlib.subprocess import launch_editor
-from chriscarl.core.lib.third import selenium
 
 SCRIPT_RELPATH = 'chriscarl/tools/ipynb.py'
 if not hasattr(sys, '_MEIPASS'):
@@ -546,6 +546,8 @@ def ipynb(
                 # let MathJax javascript insert dom elements
                 wait_for_by = ('XPATH', '//script[contains(@id, "MathJax-Element")]')
 
+            from chriscarl.core.lib.third import selenium
+
             new_pdf_filepath = selenium.print_pdf(html_filepath, dirpath=output_dirpath, margins=False, wait_for_by_value=wait_for_by)
 
             shutil.move(new_pdf_filepath, pdf_filepath)
@@ -14,6 +14,7 @@ Examples:
     $ mathml2latex /temp/mathml.xml
 
 Updates:
+    2026-10-17 - tools.mathml2latex - mathml-to-latex is only required once we convert, --help works without it
     2026-01-28 - tools.mathml2latex - initial commit
 
 TODO:
@@ -32,11 +33,7 @@ from argparse import ArgumentParser
 import re
 
 # third party imports
-try:
-    from mathml_to_latex.converter import MathMLToLaTeX
-except ImportError:
-    print('pip install mathml-to-latex', file=sys.stderr)
-    sys.exit(1)
+# NOTE: mathml-to-latex is imported in main once the arguments are good, keeps --help fast
 
 # project imports
 from chriscarl.core.constants import TEMP_DIRPATH
@@ -126,6 +123,12 @@ def main():
 
     args = Arguments.parse(parser=parser)
 
+    try:
+        from mathml_to_latex.converter import MathMLToLaTeX
+    except ImportError:
+        print('pip install mathml-to-latex', file=sys.stderr)
+        sys.exit(1)
+
     converter = MathMLToLaTeX()
     content = read_text_file(args.input_filepath)
     latexes = []
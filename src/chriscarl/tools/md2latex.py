@@ -21,6 +21,12 @@ Examples:
         -ss  # skip spellcheck
 
 Updates:
+    2026-10-17 - tools.md2latex - FIX: --spellcheck-jobs defaults to 1, the shared SpellChecker only stays shared in-process
+    2026-10-17 - tools.md2latex - main is parse + run, run(args) is what doc-server calls, Arguments.parse can leave logging alone
+    2026-10-17 - tools.md2latex - spellchecks are cached per doclet next to the .tex unless --no-cache, added --spellcheck-jobs
+    2026-10-17 - tools.md2latex - spelling corrections are remembered in TEMP_DIRPATH between runs unless --no-cache
+    2026-10-17 - tools.md2latex - added --profile and --cprofile, every phase is timed and counted into a json report next to the .tex
+    2026-10-17 - tools.md2latex - doclets are rendered through a per-doclet cache next to the .tex, --no-cache to render everything
     2026-02-20 - tools.md2latex - supporting markdown specific function movement
     2026-02-15 - tools.md2latex - added --auto-label-caption
     2026-02-10 - tools.md2latex - FIX: template was not being passed along from md2latex to md2pdf
@@ -69,8 +75,11 @@ LOGGER.addHandler(logging.NullHandler())
 DEFAULT_FIB_INIT = [0, 1]
 DEFAULT_OUTPUT_DIRPATH = abspath(TEMP_DIRPATH, 'tools.md2latex')
 DEFAULT_LOG_FILEPATH = abspath(TEMP_DIRPATH, 'tools.md2latex.log')
+DEFAULT_CORRECTIONS_FILEPATH = abspath(TEMP_DIRPATH, 'tools.md2latex.corrections.json')
+DEFAULT_SPELLCHECK_JOBS = 1  # NOTE: every worker builds its own SpellChecker, only worth it for a paper's worth of changed doclets
 
 # tool constants
+T_MARKDOWN_TO_LATEX = Tuple[str, str, List[Tuple[str, str]], Dict[str, str]]  # .bib, .tex, downloads, headers
 
 
 @dataclass
@@ -85,6 +94,10 @@ class Arguments:
     spellcheck_fatal: bool = False
     skip_spellcheck: bool = False
     auto_label_caption: bool = False
+    no_cache: bool = False
+    spellcheck_jobs: int = DEFAULT_SPELLCHECK_JOBS
+    profile: bool = False
+    cprofile: bool = False
     # wc-applet
     word_count: bool = False
     # non-app
@@ -104,6 +117,12 @@ class Arguments:
         app.add_argument('--spellcheck-fatal', '-sf', action='store_true', help='spellcheck fail is fatal')
         app.add_argument('--skip-spellcheck', '-ss', action='store_true', help='skip-spellcheck entirely')
         app.add_argument('--auto-label-caption', '-alc', action='store_true', help='auto label and auto caption if stuff is missing?')
+        app.add_argument('--no-cache', action='store_true', help='render and spellcheck every doclet and re-correct every misspelling even if nothing changed since the last run?')
+        app.add_argument('--spellcheck-jobs', '-sj', type=int, default=DEFAULT_SPELLCHECK_JOBS, help='processes for spellchecking changed doclets, >1 pays off for many')
+
+        profile = parser.add_argument_group('profile')
+        profile.add_argument('--profile', action='store_true', help='write per-phase wall/cpu time and counts to .<name>.profile.json next to the .tex?')
+        profile.add_argument('--cprofile', action='store_true', help='--profile, plus a cProfile .prof per phase in .<name>.profile/?')
 
         wc = parser.add_argument_group('word-count')
         wc.add_argument('--word-count', '-wc', action='store_true', help='get the word count, exit')
@@ -114,7 +133,7 @@ class Arguments:
         misc.add_argument('--log-filepath', type=str, default=DEFAULT_LOG_FILEPATH, help='log filepath?')
         return parser
 
-    def process(self):
+    def process(self, configure_logging=True):
         if not is_file(self.markdown_filepath):
             raise OSError(f'markdown filepath "{self.markdown_filepath}" does not exist')
         for i, bibliography_filepath in enumerate(self.bibliography_filepaths):
@@ -124,21 +143,36 @@ class Arguments:
             make_dirpath(self.output_dirpath)
         if self.debug:
             self.log_level = 'DEBUG'
-        configure_ez(level=self.log_level, filepath=self.log_filepath)
+        if configure_logging:
+            configure_ez(level=self.log_level, filepath=self.log_filepath)
 
     @classmethod
-    def parse(cls, parser=None, argv=None):
-        # type: (Optional[ArgumentParser], Optional[List[str]]) -> Arguments
+    def parse(cls, parser=None, argv=None, configure_logging=True):
+        # type: (Optional[ArgumentParser], Optional[List[str]], bool) -> Arguments
+        '''configure_logging=False when something long-lived already owns the logging, like doc-server'''
         parser = parser or cls.argparser()
         ns = parser.parse_args(argv)
         arguments = cls(**(vars(ns)))
-        arguments.process()
+        arguments.process(configure_logging=configure_logging)
         return arguments
 
     def to_dict(self):
         return {fie.name: getattr(self, fie.name) for fie in fields(self)}
 
 
+def make_profiler(md_filepath, output_dirpath='', cprofile=False):
+    # type: (str, str, bool) -> Tuple[md2latex.PhaseProfiler, str]
+    '''
+    Returns:
+        Tuple[md2latex.PhaseProfiler, str]
+            the profiler and where its report goes, next to the .tex
+    '''
+    output_dirpath = abspath(output_dirpath or dirpath(md_filepath))
+    md_filename = filename(md_filepath)
+    cprofile_dirpath = abspath(output_dirpath, f'.{md_filename}.profile') if cprofile else ''
+    return md2latex.PhaseProfiler(cprofile_dirpath=cprofile_dirpath), abspath(output_dirpath, f'.{md_filename}.profile.json')
+
+
 def log_error_warnings(phase, errors, warnings):
     # type: (str, List[str], List[str]) -> None
     if warnings:
@@ -167,8 +201,18 @@ def markdown_to_latex(
     skip_spellcheck=False,
     auto_label_caption=False,
     debug=False,
+    no_cache=False,
+    profiler=None,
+    spellcheck_jobs=1,
 ):
-    # type: (str, str, Optional[List[str]], str, bool, bool, bool, bool, bool) -> Tuple[str, str, List[Tuple[str, str]], Dict[str, str]]
+    # type: (str, str, Optional[List[str]], str, bool, bool, bool, bool, bool, bool, Optional[md2latex.PhaseProfiler], int) -> T_MARKDOWN_TO_LATEX
+    '''
+    Arguments:
+        spellcheck_jobs: int
+            processes for spellchecking uncached doclets, batch builds leave it at 1 since theyre already one process per document
+        profiler: Optional[md2latex.PhaseProfiler]
+            pass one in to get the phase timings back out, the caller saves the report
+    '''
     if template not in md2latex.TEMPLATES:
         raise ValueError(f'template {template!r} not in {list(md2latex.TEMPLATES)}')
     md2latex.assert_executables_exist()
@@ -181,43 +225,56 @@ def markdown_to_latex(
     os.makedirs(output_dirpath, exist_ok=True)
     tex_output_filepath = abspath(output_dirpath, f'{md_filename}.tex')
     bibliography_output_filepath = abspath(output_dirpath, f'{md_filename}.bib')  # f'{latex.latex_remove(md_filename)}.bib'
+    doclet_cache_filepath = abspath(output_dirpath, f'.{md_filename}.doclets.json')
+    spellcheck_cache_filepath = abspath(output_dirpath, f'.{md_filename}.spellcheck.json')
     bibliography_filepaths = bibliography_filepaths or []
+    profiler = profiler or md2latex.PhaseProfiler()
 
     # right off the rip
-    md_content = read_text_file(md_filepath)
-    if not md_content.endswith('\n'):
-        md_content = f'{md_content}\n'
-    md_content = md2latex.REGEX_MARKDOWN_EMPTY_LITERAL.sub('', md_content)
+    with profiler.phase('read') as stats:
+        md_content = read_text_file(md_filepath)
+        if not md_content.endswith('\n'):
+            md_content = f'{md_content}\n'
+        md_content = md2latex.REGEX_MARKDOWN_EMPTY_LITERAL.sub('', md_content)
 
-    word_count = md2latex.word_count(md_content)
-    LOGGER.info('wc: %d', word_count)
+        word_count = md2latex.word_count(md_content)
+        LOGGER.info('wc: %d', word_count)
+        stats.update(bytes=len(md_content.encode('utf-8')), words=word_count)
     if wc:
         return '', '', [], {}
 
     # bibliographies
     phase, errors, warnings = 'bibtex', [], []
     LOGGER.info('running %r', phase)
-    bibtex_labels, errors, warnings = md2latex.bibliographies_to_bibtex([md_filepath] + bibliography_filepaths, bibliography_output_filepath)
+    with profiler.phase(phase) as stats:
+        bibtex_labels, errors, warnings = md2latex.bibliographies_to_bibtex([md_filepath] + bibliography_filepaths, bibliography_output_filepath)
+        stats.update(labels=len(bibtex_labels), bytes=os.path.getsize(bibliography_output_filepath) if is_file(bibliography_output_filepath) else 0)
     log_error_warnings(phase, errors, warnings)
 
     # sections
     phase, errors, warnings = 'sections', [], []
     LOGGER.info('running %r', phase)
-    sections, md_content = markdown.analyze_extract_sections(md_content)
-    sections += markdown.analyze_large_sections(md_content)
+    with profiler.phase(phase) as stats:
+        sections, md_content = markdown.analyze_extract_sections(md_content)
+        sections += markdown.analyze_large_sections(md_content)
+        stats.update(sections=len(sections))
     log_error_warnings(phase, errors, warnings)
 
     # doclets
     phase, errors, warnings = 'sections2doclets', [], []
     LOGGER.info('running %r', phase)
-    doclets, interdoc_labels, download_url_filepaths, errors, warnings = markdown.sections_to_doclets(
-        sections, md_filepath, output_dirpath=output_dirpath, auto_label_caption=auto_label_caption, use_angle_citations=True
-    )
+    with profiler.phase(phase) as stats:
+        doclets, interdoc_labels, download_url_filepaths, errors, warnings = markdown.sections_to_doclets(
+            sections, md_filepath, output_dirpath=output_dirpath, auto_label_caption=auto_label_caption, use_angle_citations=True
+        )
+        stats.update(doclets=len(doclets), bytes=sum(len(doclet.content.encode('utf-8')) for doclet in doclets), downloads=len(download_url_filepaths))
     log_error_warnings(phase, errors, warnings)
 
     phase, errors, warnings = 'labels', [], []
     LOGGER.info('running %r', phase)
-    labels, errors, warnings = md2latex.process_labels(bibtex_labels, interdoc_labels)
+    with profiler.phase(phase) as stats:
+        labels, errors, warnings = md2latex.process_labels(bibtex_labels, interdoc_labels)
+        stats.update(labels=len(labels))
     log_error_warnings(phase, errors, warnings)
     if debug:
         LOGGER.debug('labels: %s', pprint.pformat(labels, indent=2, width=160))
@@ -228,7 +285,13 @@ def markdown_to_latex(
         LOGGER.warning('skipping %r', phase)
     else:
         LOGGER.info('running %r', phase)
-        word_count, errors, warnings = md2latex.doclets_spellcheck(doclets, md_filepath)
+        with profiler.phase(phase) as stats:
+            corrections_filepath = '' if no_cache else DEFAULT_CORRECTIONS_FILEPATH
+            cache_filepath = '' if no_cache else spellcheck_cache_filepath
+            word_count, errors, warnings = md2latex.doclets_spellcheck(
+                doclets, md_filepath, corrections_filepath=corrections_filepath, cache_filepath=cache_filepath, jobs=spellcheck_jobs
+            )
+            stats.update(doclets=len(doclets), words=word_count, errors=len(errors), warnings=len(warnings))
         LOGGER.info('wc: %d', word_count)
         if not spellcheck_fatal:
             warnings.extend(errors)
@@ -238,7 +301,14 @@ def markdown_to_latex(
     # doclets to body
     phase, errors, warnings = 'doclets2latex', [], []
     LOGGER.info('running %r', phase)
-    headers, renders, errors, warnings = md2latex.doclets_to_latex(doclets, md_filepath, bibliography_output_filepath, labels, template)
+    with profiler.phase(phase) as stats:
+        cache = None if no_cache else md2latex.DocletCache(doclet_cache_filepath)
+        headers, renders, errors, warnings = md2latex.doclets_to_latex(doclets, md_filepath, bibliography_output_filepath, labels, template, cache=cache)
+        if cache is not None:
+            LOGGER.info('%d / %d doclets from cache', cache.hits, cache.hits + cache.misses)
+            cache.save()
+            stats.update(cache_hits=cache.hits, cache_misses=cache.misses)
+        stats.update(doclets=len(doclets), bytes=sum(len(value.encode('utf-8')) for value in renders.values()))
     if debug:
         LOGGER.debug('headers: %s', pprint.pformat(headers, indent=2, width=160))
         LOGGER.debug('renders: %s', pprint.pformat(renders, indent=2, width=160))
@@ -251,12 +321,44 @@ def markdown_to_latex(
     # render
     phase, errors, warnings = 'doclets+latex2texfile', [], []
     LOGGER.info('running %r', phase)
-    errors, warnings = md2latex.render_tex_file(headers, renders, tex_output_filepath)
+    with profiler.phase(phase) as stats:
+        errors, warnings = md2latex.render_tex_file(headers, renders, tex_output_filepath)
+        stats.update(bytes=os.path.getsize(tex_output_filepath))
     log_error_warnings(phase, errors, warnings)
 
     return bibliography_output_filepath, tex_output_filepath, download_url_filepaths, headers
 
 
+def run(args):
+    # type: (Arguments) -> int
+    '''everything main does once the arguments are parsed'''
+    profiler, profile_filepath = make_profiler(args.markdown_filepath, args.output_dirpath, cprofile=args.cprofile)
+    try:
+        bibliography_output_filepath, tex_output_filepath, _, _ = markdown_to_latex(
+            args.markdown_filepath,
+            args.output_dirpath,
+            bibliography_filepaths=args.bibliography_filepaths,
+            template=args.template,
+            wc=args.word_count,
+            spellcheck_fatal=args.spellcheck_fatal,
+            skip_spellcheck=args.skip_spellcheck,
+            auto_label_caption=args.auto_label_caption,
+            debug=args.debug,
+            no_cache=args.no_cache,
+            profiler=profiler,
+            spellcheck_jobs=args.spellcheck_jobs,
+        )
+    finally:
+        # NOTE: failed builds are the ones worth profiling too
+        if args.profile or args.cprofile:
+            profiler.save(profile_filepath)
+    LOGGER.info('.bib at "%s"', os.path.relpath(bibliography_output_filepath, os.getcwd()))
+    LOGGER.info('.tex at "%s"', os.path.relpath(tex_output_filepath, os.getcwd()))
+
+    LOGGER.info('done!')
+    return 0
+
+
 def main():
     # type: () -> int
     parser = Arguments.argparser()
@@ -265,23 +367,7 @@ def main():
         sys.exit(1)
 
     args = Arguments.parse(parser=parser)
-
-    bibliography_output_filepath, tex_output_filepath, _, _ = markdown_to_latex(
-        args.markdown_filepath,
-        args.output_dirpath,
-        bibliography_filepaths=args.bibliography_filepaths,
-        template=args.template,
-        wc=args.word_count,
-        spellcheck_fatal=args.spellcheck_fatal,
-        skip_spellcheck=args.skip_spellcheck,
-        auto_label_caption=args.auto_label_caption,
-        debug=args.debug,
-    )
-    LOGGER.info('.bib at "%s"', os.path.relpath(bibliography_output_filepath, os.getcwd()))
-    LOGGER.info('.tex at "%s"', os.path.relpath(tex_output_filepath, os.getcwd()))
-
-    LOGGER.info('done!')
-    return 0
+    return run(args)
 
 
 if __name__ == '__main__':
@@ -25,6 +25,14 @@ Examples:
         -ss  # skip spellcheck
 
 Updates:
+    2026-10-17 - tools.md2pdf - main is parse + run, run(args) is what doc-server calls
+    2026-10-17 - tools.md2pdf - --spellcheck-jobs passed along to md2latex
+    2026-10-17 - tools.md2pdf - --profile and --cprofile cover the download and tex2pdf phases too
+    2026-10-17 - tools.md2pdf - md2pdf is split into latex_phase and pdf_phase so md2pdf-batch can pipeline them
+    2026-10-17 - tools.md2pdf - pdflatex loads a precompiled preamble per template, --no-fmt to load it the slow way
+    2026-10-17 - tools.md2pdf - added --keep-aux, pdflatex runs in a build dir whose aux files survive between builds, --clean-aux to start over
+    2026-10-17 - tools.md2pdf - pdflatex is skipped when the .tex, .bib, assets, and template match the last build, --no-cache to force
+    2026-10-17 - tools.md2pdf - passes --no-cache through to markdown_to_latex
     2026-04-03 - tools.md2pdf - deleting prior work files helps
     2026-02-06 - tools.md2pdf - initial commit
 '''
@@ -34,6 +42,7 @@ from __future__ import absolute_import, print_function, division, with_statement
 import os
 import sys
 import logging
+import shutil
 from typing import List, Generator, Optional, Tuple
 from dataclasses import dataclass, field, fields
 from argparse import ArgumentParser
@@ -73,6 +82,9 @@ class Arguments(md2latex_tool.Arguments):
     Document this class with any specifics for the process function.
     '''
     skip_pdf: bool = False
+    keep_aux: bool = False
+    clean_aux: bool = False
+    no_fmt: bool = False
 
     @classmethod
     def argparser(cls):
@@ -80,11 +92,14 @@ class Arguments(md2latex_tool.Arguments):
         parser = super().argparser()
         app = parser.add_argument_group('md2pdf')
         app.add_argument('--skip-pdf', '-sp', action='store_true', help='generate .tex only, no run pdf :(')
+        app.add_argument('--keep-aux', action='store_true', help='keep aux files in a build dir between builds so rebuilds converge faster?')
+        app.add_argument('--clean-aux', action='store_true', help='wipe the --keep-aux build dir before building?')
+        app.add_argument('--no-fmt', action='store_true', help='dont precompile the template preamble into a format?')
 
         return parser
 
 
-def md2pdf(
+def latex_phase(
     md_filepath,
     output_dirpath='',
     bibliography_filepaths=None,
@@ -92,14 +107,20 @@ def md2pdf(
     wc=False,
     spellcheck_fatal=False,
     skip_spellcheck=False,
-    skip_pdf=False,
     auto_label_caption=False,
     debug=False,
+    no_cache=False,
+    profiler=None,
+    spellcheck_jobs=1,
 ):
-    # type: (str, str, Optional[List[str]], str, bool, bool, bool, bool, bool, bool) -> Tuple[str, str, str]
+    # type: (str, str, Optional[List[str]], str, bool, bool, bool, bool, bool, bool, Optional[md2latex.PhaseProfiler], int) -> Tuple[str, str, List[Tuple[str, str]], str]
+    '''
+    Returns:
+        Tuple[str, str, List[Tuple[str, str]], str]
+            .bib, .tex, the downloaded/copied assets, and the template the headers settled on
+    '''
     md_filename = filename(md_filepath)
-    pdf_output_filepath = abspath(output_dirpath, f'{md_filename}.pdf')
-
+    profiler = profiler or md2latex.PhaseProfiler()
     LOGGER.info('deleting previous unnecessary work files...')
     md2latex.delete_latex_work_files(output_dirpath, md_filename, extra=None)
 
@@ -114,30 +135,159 @@ def md2pdf(
         skip_spellcheck=skip_spellcheck,
         auto_label_caption=auto_label_caption,
         debug=debug,
+        no_cache=no_cache,
+        profiler=profiler,
+        spellcheck_jobs=spellcheck_jobs,
     )
 
     phase, errors, warnings = 'download', [], []
     LOGGER.info('running %r', phase)
-    md2latex.download_copy_files(download_url_filepaths, output_dirpath)
+    with profiler.phase(phase) as stats:
+        md2latex.download_copy_files(download_url_filepaths, output_dirpath)
+        stats.update(files=len(download_url_filepaths))
     md2latex_tool.log_error_warnings(phase, errors, warnings)
 
-    template = headers.get('template', template)
+    return bibliography_output_filepath, tex_output_filepath, download_url_filepaths, headers.get('template', template)
+
+
+def pdf_phase(
+    md_filename,
+    output_dirpath,
+    template,
+    bibliography_output_filepath,
+    tex_output_filepath,
+    download_url_filepaths,
+    no_cache=False,
+    keep_aux=False,
+    clean_aux=False,
+    no_fmt=False,
+    profiler=None,
+):
+    # type: (str, str, str, str, str, List[Tuple[str, str]], bool, bool, bool, bool, Optional[md2latex.PhaseProfiler]) -> str
+    '''
+    Returns:
+        str
+            the .pdf
+    '''
+    pdf_output_filepath = abspath(output_dirpath, f'{md_filename}.pdf')
+    profiler = profiler or md2latex.PhaseProfiler()
     phase, errors, warnings = 'tex2pdf', [], []
-    if skip_pdf:
-        LOGGER.warning('skipping %r', phase)
-        return bibliography_output_filepath, tex_output_filepath, ''
-    LOGGER.info('running %r', phase)
-    tex2pdf.run_pdflatex(md_filename, output_dirpath, template)
-    md2latex_tool.log_error_warnings(phase, errors, warnings)
+    cleanup_filepaths = [tpl[1] for tpl in download_url_filepaths]
+    manifest_filepath = abspath(output_dirpath, f'.{md_filename}.pdf.json')
+    with profiler.phase(phase) as stats:
+        inputs = tex2pdf.build_inputs(md_filename, output_dirpath, template, extra_filepaths=cleanup_filepaths)
+        passes = 0
+        if not no_cache and not clean_aux and tex2pdf.is_build_current(manifest_filepath, inputs, pdf_output_filepath):
+            LOGGER.info('skipping %r, nothing changed since the last build', phase)
+        elif keep_aux:
+            LOGGER.info('running %r', phase)
+            build_dirpath = abspath(output_dirpath, f'.{md_filename}.build')
+            tex2pdf.prepare_build_dirpath(build_dirpath, template, clean=clean_aux)
+            tex2pdf.sync_build_dirpath([tex_output_filepath, bibliography_output_filepath] + cleanup_filepaths, output_dirpath, build_dirpath)
+            passes = tex2pdf.run_pdflatex(md_filename, build_dirpath, template, clean=False, fmt=not no_fmt)
+            md2latex_tool.log_error_warnings(phase, errors, warnings)
+            shutil.copy2(abspath(build_dirpath, f'{md_filename}.pdf'), pdf_output_filepath)
+            tex2pdf.save_manifest(manifest_filepath, inputs, pdf_output_filepath)
+        else:
+            LOGGER.info('running %r', phase)
+            passes = tex2pdf.run_pdflatex(md_filename, output_dirpath, template, fmt=not no_fmt)
+            md2latex_tool.log_error_warnings(phase, errors, warnings)
+            tex2pdf.save_manifest(manifest_filepath, inputs, pdf_output_filepath)
+        stats.update(passes=passes, bytes=os.path.getsize(pdf_output_filepath) if os.path.isfile(pdf_output_filepath) else 0)
 
     # NOTE: only clean up if everything went well, leave everything behind if it didnt...
     LOGGER.info('deleting unnecessary work files...')
-    cleanup_filepaths = [tpl[1] for tpl in download_url_filepaths]
     md2latex.delete_latex_work_files(output_dirpath, md_filename, extra=cleanup_filepaths)
 
+    return pdf_output_filepath
+
+
+def md2pdf(
+    md_filepath,
+    output_dirpath='',
+    bibliography_filepaths=None,
+    template=md2latex.DEFAULT_TEMPLATE,
+    wc=False,
+    spellcheck_fatal=False,
+    skip_spellcheck=False,
+    skip_pdf=False,
+    auto_label_caption=False,
+    debug=False,
+    no_cache=False,
+    keep_aux=False,
+    clean_aux=False,
+    no_fmt=False,
+    profiler=None,
+    spellcheck_jobs=1,
+):
+    # type: (str, str, Optional[List[str]], str, bool, bool, bool, bool, bool, bool, bool, bool, bool, bool, Optional[md2latex.PhaseProfiler], int) -> Tuple[str, str, str]
+    profiler = profiler or md2latex.PhaseProfiler()
+    bibliography_output_filepath, tex_output_filepath, download_url_filepaths, template = latex_phase(
+        md_filepath,
+        output_dirpath,
+        bibliography_filepaths=bibliography_filepaths,
+        template=template,
+        wc=wc,
+        spellcheck_fatal=spellcheck_fatal,
+        skip_spellcheck=skip_spellcheck,
+        auto_label_caption=auto_label_caption,
+        debug=debug,
+        no_cache=no_cache,
+        profiler=profiler,
+        spellcheck_jobs=spellcheck_jobs,
+    )
+    if skip_pdf:
+        LOGGER.warning('skipping %r', 'tex2pdf')
+        return bibliography_output_filepath, tex_output_filepath, ''
+    pdf_output_filepath = pdf_phase(
+        filename(md_filepath),
+        output_dirpath,
+        template,
+        bibliography_output_filepath,
+        tex_output_filepath,
+        download_url_filepaths,
+        no_cache=no_cache,
+        keep_aux=keep_aux,
+        clean_aux=clean_aux,
+        no_fmt=no_fmt,
+        profiler=profiler,
+    )
     return bibliography_output_filepath, tex_output_filepath, pdf_output_filepath
 
 
+def run(args):
+    # type: (Arguments) -> int
+    '''everything main does once the arguments are parsed'''
+    profiler, profile_filepath = md2latex_tool.make_profiler(args.markdown_filepath, args.output_dirpath, cprofile=args.cprofile)
+    try:
+        bibliography_output_filepath, tex_output_filepath, pdf_output_filepath = md2pdf(
+            args.markdown_filepath,
+            args.output_dirpath,
+            bibliography_filepaths=args.bibliography_filepaths,
+            template=args.template,
+            wc=args.word_count,
+            spellcheck_fatal=args.spellcheck_fatal,
+            skip_spellcheck=args.skip_spellcheck,
+            skip_pdf=args.skip_pdf,
+            auto_label_caption=args.auto_label_caption,
+            debug=args.debug,
+            no_cache=args.no_cache,
+            keep_aux=args.keep_aux,
+            clean_aux=args.clean_aux,
+            no_fmt=args.no_fmt,
+            profiler=profiler,
+            spellcheck_jobs=args.spellcheck_jobs,
+        )
+    finally:
+        if args.profile or args.cprofile:
+            profiler.save(profile_filepath)
+    LOGGER.info('.bib at "%s"', os.path.relpath(bibliography_output_filepath, os.getcwd()))
+    LOGGER.info('.tex at "%s"', os.path.relpath(tex_output_filepath, os.getcwd()))
+    LOGGER.info('.pdf at "%s"', os.path.relpath(pdf_output_filepath, os.getcwd()))
+    LOGGER.info('done!')
+    return 0
+
+
 def main():
     # type: () -> int
     parser = Arguments.argparser()
@@ -146,24 +296,7 @@ def main():
         sys.exit(1)
 
     args = Arguments.parse(parser=parser)
-
-    bibliography_output_filepath, tex_output_filepath, pdf_output_filepath = md2pdf(
-        args.markdown_filepath,
-        args.output_dirpath,
-        bibliography_filepaths=args.bibliography_filepaths,
-        template=args.template,
-        wc=args.word_count,
-        spellcheck_fatal=args.spellcheck_fatal,
-        skip_spellcheck=args.skip_spellcheck,
-        skip_pdf=args.skip_pdf,
-        auto_label_caption=args.auto_label_caption,
-        debug=args.debug,
-    )
-    LOGGER.info('.bib at "%s"', os.path.relpath(bibliography_output_filepath, os.getcwd()))
-    LOGGER.info('.tex at "%s"', os.path.relpath(tex_output_filepath, os.getcwd()))
-    LOGGER.info('.pdf at "%s"', os.path.relpath(pdf_output_filepath, os.getcwd()))
-    LOGGER.info('done!')
-    return 0
+    return run(args)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+Author:         Chris Carl
+Email:          chrisbcarl@outlook.com
+Date:           2026-10-17
+Description:
+
+tools.md2pdf_batch is a tool which runs md2pdf over a whole course worth of Markdown at once.
+markdown to latex runs in a process pool, pdflatex runs with its own concurrency limit as each .tex lands,
+every document builds in its own output directory, and one bad document doesnt take the batch down with it.
+
+Examples:
+    # directories are walked for .md, globs are expanded, files are files
+    md2pdf-batch notes/ papers/*.md `
+        -b tests/collateral/md2latex/bibliography.md `
+        -o files/examples/md2pdf_batch -t chicago -ss `
+        -j 8 -pj 2
+
+Updates:
+    2026-10-17 - tools.md2pdf_batch - initial commit
+'''
+
+# stdlib imports
+from __future__ import absolute_import, print_function, division, with_statement  # , unicode_literals
+import os
+import sys
+import logging
+import time
+import concurrent.futures
+from typing import List, Optional
+from dataclasses import dataclass, field, fields
+from argparse import ArgumentParser
+
+# third party imports
+
+# project imports
+from chriscarl.core.constants import TEMP_DIRPATH
+from chriscarl.core.lib.stdlib.logging import NAME_TO_LEVEL, configure_ez
+from chriscarl.core.lib.stdlib.argparse import ArgparseNiceFormat
+from chriscarl.core.lib.stdlib.os import abspath, is_file, filename
+from chriscarl.tools import md2pdf as md2pdf_tool
+from chriscarl.tools.shed import md2latex
+from chriscarl.tools.shed.md2pdf import BatchResult, resolve_markdown_filepaths, batch_output_dirpaths
+
+SCRIPT_RELPATH = 'chriscarl/tools/md2pdf_batch.py'
+if not hasattr(sys, '_MEIPASS'):
+    SCRIPT_FILEPATH = os.path.abspath(__file__)
+else:
+    SCRIPT_FILEPATH = os.path.abspath(os.path.join(sys._MEIPASS, SCRIPT_RELPATH))  # pylint: disable=no-member
+SCRIPT_DIRPATH = os.path.dirname(SCRIPT_FILEPATH)
+SCRIPT_NAME = os.path.splitext(os.path.basename(__file__))[0]
+THIS_MODULE = sys.modules[__name__]
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(logging.NullHandler())
+
+# argument defaults
+DEFAULT_LOG_FILEPATH = abspath(TEMP_DIRPATH, 'tools.md2pdf_batch.log')
+DEFAULT_JOBS = os.cpu_count() or 1
+DEFAULT_PDF_JOBS = max(1, DEFAULT_JOBS // 2)  # pdflatex and biber are memory and disk hungry, dont match the cpu count
+
+# tool constants
+
+
+@dataclass
+class Arguments:
+    '''
+    Document this class with any specifics for the process function.
+    '''
+    markdown_paths: List[str] = field(default_factory=lambda: [])
+    output_dirpath: str = ''
+    bibliography_filepaths: List[str] = field(default_factory=lambda: [])
+    template: str = md2latex.DEFAULT_TEMPLATE
+    spellcheck_fatal: bool = False
+    skip_spellcheck: bool = False
+    auto_label_caption: bool = False
+    no_cache: bool = False
+    skip_pdf: bool = False
+    keep_aux: bool = False
+    clean_aux: bool = False
+    no_fmt: bool = False
+    jobs: int = DEFAULT_JOBS
+    pdf_jobs: int = DEFAULT_PDF_JOBS
+    # non-app
+    debug: bool = False
+    log_level: str = 'INFO'
+    log_filepath: str = DEFAULT_LOG_FILEPATH
+
+    @classmethod
+    def argparser(cls):
+        # type: () -> ArgumentParser
+        parser = ArgumentParser(prog=SCRIPT_NAME, description=__doc__, formatter_class=ArgparseNiceFormat)
+        app = parser.add_argument_group('md2pdf-batch')
+        app.add_argument('markdown_paths', type=str, nargs='+', help='.md files, directories of them, or globs')
+        app.add_argument('--bibliography-filepaths', '--bibliographys', '-b', type=str, nargs='+', default=[], help='.md w/ bibtexs, shared by every document?')
+        app.add_argument('--output-dirpath', '-o', type=str, default='', help='root of the per-document output dirs, default is next to the inputs')
+        app.add_argument('--template', '-t', type=str, default=md2latex.DEFAULT_TEMPLATE, choices=md2latex.TEMPLATES, help='document style, really')
+        app.add_argument('--spellcheck-fatal', '-sf', action='store_true', help='spellcheck fail is fatal (for that document)')
+        app.add_argument('--skip-spellcheck', '-ss', action='store_true', help='skip-spellcheck entirely')
+        app.add_argument('--auto-label-caption', '-alc', action='store_true', help='auto label and auto caption if stuff is missing?')
+        app.add_argument('--no-cache', action='store_true', help='render and build everything even if it didnt change since the last run?')
+        app.add_argument('--skip-pdf', '-sp', action='store_true', help='generate .tex only, no run pdf :(')
+        app.add_argument('--keep-aux', action='store_true', help='keep aux files in a build dir between builds so rebuilds converge faster?')
+        app.add_argument('--clean-aux', action='store_true', help='wipe the --keep-aux build dirs before building?')
+        app.add_argument('--no-fmt', action='store_true', help='dont precompile the template preamble into a format?')
+
+        batch = parser.add_argument_group('batch')
+        batch.add_argument('--jobs', '-j', type=int, default=DEFAULT_JOBS, help='how many documents go markdown to latex at once?')
+        batch.add_argument('--pdf-jobs', '-pj', type=int, default=DEFAULT_PDF_JOBS, help='how many pdflatex builds at once?')
+
+        misc = parser.add_argument_group('misc')
+        misc.add_argument('--debug', action='store_true', help='chose to print debug info')
+        misc.add_argument('--log-level', type=str, default='INFO', choices=NAME_TO_LEVEL, help='log level?')
+        misc.add_argument('--log-filepath', type=str, default=DEFAULT_LOG_FILEPATH, help='log filepath?')
+        return parser
+
+    def process(self):
+        for i, bibliography_filepath in enumerate(self.bibliography_filepaths):
+            if not is_file(bibliography_filepath):
+                raise OSError(f'bibliography filepath {i} "{bibliography_filepath}" does not exist')
+        if self.jobs < 1 or self.pdf_jobs < 1:
+            raise ValueError(f'--jobs {self.jobs} and --pdf-jobs {self.pdf_jobs} must be at least 1')
+        if self.debug:
+            self.log_level = 'DEBUG'
+        configure_ez(level=self.log_level, filepath=self.log_filepath)
+
+    @classmethod
+    def parse(cls, parser=None, argv=None):
+        # type: (Optional[ArgumentParser], Optional[List[str]]) -> Arguments
+        parser = parser or cls.argparser()
+        ns = parser.parse_args(argv)
+        arguments = cls(**(vars(ns)))
+        arguments.process()
+        return arguments
+
+    def to_dict(self):
+        return {fie.name: getattr(self, fie.name) for fie in fields(self)}
+
+
+def latex_worker(result, bibliography_filepaths, template, spellcheck_fatal, skip_spellcheck, auto_label_caption, no_cache):
+    # type: (BatchResult, List[str], str, bool, bool, bool, bool) -> BatchResult
+    '''runs in the process pool, a failure is recorded on the result instead of raised or exited'''
+    start = time.time()
+    try:
+        bibliography_filepath, tex_filepath, download_url_filepaths, template = md2pdf_tool.latex_phase(
+            result.md_filepath,
+            result.output_dirpath,
+            bibliography_filepaths=bibliography_filepaths,
+            template=template,
+            spellcheck_fatal=spellcheck_fatal,
+            skip_spellcheck=skip_spellcheck,
+            auto_label_caption=auto_label_caption,
+            no_cache=no_cache,
+        )
+        result.bibliography_filepath, result.tex_filepath = bibliography_filepath, tex_filepath
+        result.download_url_filepaths, result.template = download_url_filepaths, template
+    except SystemExit as exe:
+        result.error = f'markdown to latex exited with {exe.code}'
+    except Exception as exe:
+        result.error = f'markdown to latex failed with {type(exe).__name__}: {exe}'
+    result.latex_elapsed = time.time() - start
+    return result
+
+
+def pdf_worker(result, no_cache, keep_aux, clean_aux, no_fmt):
+    # type: (BatchResult, bool, bool, bool, bool) -> BatchResult
+    '''runs in the pdflatex thread pool, pdflatex is a subprocess anyway'''
+    start = time.time()
+    try:
+        result.pdf_filepath = md2pdf_tool.pdf_phase(
+            filename(result.md_filepath),
+            result.output_dirpath,
+            result.template,
+            result.bibliography_filepath,
+            result.tex_filepath,
+            result.download_url_filepaths,
+            no_cache=no_cache,
+            keep_aux=keep_aux,
+            clean_aux=clean_aux,
+            no_fmt=no_fmt,
+        )
+    except SystemExit as exe:
+        result.error = f'latex to pdf exited with {exe.code}'
+    except Exception as exe:
+        result.error = f'latex to pdf failed with {type(exe).__name__}: {exe}'
+    result.pdf_elapsed = time.time() - start
+    return result
+
+
+def md2pdf_batch(
+    md_filepaths,
+    output_dirpath='',
+    bibliography_filepaths=None,
+    template=md2latex.DEFAULT_TEMPLATE,
+    spellcheck_fatal=False,
+    skip_spellcheck=False,
+    skip_pdf=False,
+    auto_label_caption=False,
+    no_cache=False,
+    keep_aux=False,
+    clean_aux=False,
+    no_fmt=False,
+    jobs=DEFAULT_JOBS,
+    pdf_jobs=DEFAULT_PDF_JOBS,
+):
+    # type: (List[str], str, Optional[List[str]], str, bool, bool, bool, bool, bool, bool, bool, bool, int, int) -> List[BatchResult]
+    '''
+    Description:
+        markdown to latex for every document in a process pool, each .tex is handed to the pdflatex pool the moment its done
+    Arguments:
+        jobs: int
+            markdown to latex processes, 1 runs them one at a time in this process
+        pdf_jobs: int
+            pdflatex builds at once
+    Returns:
+        List[BatchResult]
+            in the same order as md_filepaths, check .error
+    '''
+    results = [BatchResult(md_filepath, dirpath) for md_filepath, dirpath in zip(md_filepaths, batch_output_dirpaths(md_filepaths, output_dirpath))]
+    latex_args = (bibliography_filepaths or [], template, spellcheck_fatal, skip_spellcheck, auto_label_caption, no_cache)
+    pdf_args = (no_cache, keep_aux, clean_aux, no_fmt)
+
+    # NOTE: one latex job is a thread rather than a process, no point paying for a pool to run things in order
+    latex_executor_cls = concurrent.futures.ProcessPoolExecutor if jobs > 1 else concurrent.futures.ThreadPoolExecutor
+    with latex_executor_cls(max_workers=jobs) as latex_pool, concurrent.futures.ThreadPoolExecutor(max_workers=pdf_jobs) as pdf_pool:
+        latex_futures = {latex_pool.submit(latex_worker, result, *latex_args): r for r, result in enumerate(results)}
+        pdf_futures = {}
+        for done, future in enumerate(concurrent.futures.as_completed(latex_futures)):
+            r = latex_futures[future]
+            try:
+                results[r] = future.result()
+            except Exception as exe:  # the worker itself died, ex: BrokenProcessPool
+                results[r].error = f'markdown to latex worker died with {type(exe).__name__}: {exe}'
+            LOGGER.info('%d / %d latex "%s"', done + 1, len(results), results[r].md_filepath)
+            if results[r].error or skip_pdf:
+                continue
+            pdf_futures[pdf_pool.submit(pdf_worker, results[r], *pdf_args)] = r
+        for future in concurrent.futures.as_completed(pdf_futures):
+            results[pdf_futures[future]] = future.result()
+
+    return results
+
+
+def log_batch_results(results, cwd=os.getcwd()):
+    # type: (List[BatchResult], str) -> int
+    '''a line per document, returns how many failed'''
+    failures = 0
+    for result in results:
+        relpath = os.path.relpath(result.md_filepath, cwd)
+        if result.error:
+            failures += 1
+            LOGGER.error('FAIL %6.2fs + %6.2fs "%s" - %s', result.latex_elapsed, result.pdf_elapsed, relpath, result.error)
+        else:
+            LOGGER.info('OK   %6.2fs + %6.2fs "%s"', result.latex_elapsed, result.pdf_elapsed, relpath)
+    LOGGER.info(
+        '%d / %d documents built, %0.2f sec markdown to latex, %0.2f sec latex to pdf, summed across documents',
+        len(results) - failures,
+        len(results),
+        sum(result.latex_elapsed for result in results),
+        sum(result.pdf_elapsed for result in results),
+    )
+    return failures
+
+
+def main():
+    # type: () -> int
+    parser = Arguments.argparser()
+    if len(sys.argv) == 1:
+        parser.print_help()
+        sys.exit(1)
+
+    args = Arguments.parse(parser=parser)
+
+    md_filepaths = resolve_markdown_filepaths(args.markdown_paths)
+    if not md_filepaths:
+        LOGGER.error('no markdown in %s', args.markdown_paths)
+        return 1
+    LOGGER.info('%d documents, %d latex jobs, %d pdf jobs', len(md_filepaths), args.jobs, args.pdf_jobs)
+
+    start = time.time()
+    results = md2pdf_batch(
+        md_filepaths,
+        args.output_dirpath,
+        bibliography_filepaths=args.bibliography_filepaths,
+        template=args.template,
+        spellcheck_fatal=args.spellcheck_fatal,
+        skip_spellcheck=args.skip_spellcheck,
+        skip_pdf=args.skip_pdf,
+        auto_label_caption=args.auto_label_caption,
+        no_cache=args.no_cache,
+        keep_aux=args.keep_aux,
+        clean_aux=args.clean_aux,
+        no_fmt=args.no_fmt,
+        jobs=args.jobs,
+        pdf_jobs=args.pdf_jobs,
+    )
+    failures = log_batch_results(results)
+    LOGGER.info('done in %0.2f sec!', time.time() - start)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
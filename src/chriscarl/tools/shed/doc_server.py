@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+Author:         Chris Carl
+Email:          chrisbcarl@outlook.com
+Date:           2026-10-17
+Description:
+
+tools.shed.doc_server is functions that keep md2latex/md2pdf warm in a long-lived process and talk to it
+tool are modules that define usually cli tools or mini applets that I or other people may find interesting or useful.
+
+Updates:
+    2026-10-17 - tools.shed.doc_server - FIX: run_tool calls the tool's run with its own parsed Arguments instead of main, logging handlers are restored after
+    2026-10-17 - tools.shed.doc_server - warm_up builds the shared SpellChecker, not just the project dictionary
+    2026-10-17 - tools.shed.doc_server - initial commit, added serve, send, and run_tool
+'''
+
+# stdlib imports
+from __future__ import absolute_import, print_function, division, with_statement  # , unicode_literals
+import os
+import sys
+import logging
+import time
+import io
+import secrets
+import importlib
+import traceback
+import contextlib
+import multiprocessing.connection
+from typing import List, Optional, Dict, Tuple, Union
+from dataclasses import dataclass, field
+
+# third party imports
+
+# project imports
+from chriscarl.core.constants import TEMP_DIRPATH
+
+SCRIPT_RELPATH = 'chriscarl/tools/shed/doc_server.py'
+if not hasattr(sys, '_MEIPASS'):
+    SCRIPT_FILEPATH = os.path.abspath(__file__)
+else:
+    SCRIPT_FILEPATH = os.path.abspath(os.path.join(sys._MEIPASS, SCRIPT_RELPATH))  # pylint: disable=no-member
+SCRIPT_DIRPATH = os.path.dirname(SCRIPT_FILEPATH)
+SCRIPT_NAME = os.path.splitext(os.path.basename(__file__))[0]
+THIS_MODULE = sys.modules[__name__]
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(logging.NullHandler())
+
+T_ADDRESS = Union[str, Tuple[str, int]]
+
+# NOTE: tools are imported by the server only, the client stays stdlib so it starts instantly
+TOOLS = {
+    'md2latex': 'chriscarl.tools.md2latex',
+    'md2pdf': 'chriscarl.tools.md2pdf',
+}
+PING = '__ping__'
+STOP = '__stop__'
+if sys.platform == 'win32':
+    DEFAULT_ADDRESS = ('127.0.0.1', 48213)  # type: T_ADDRESS
+else:
+    DEFAULT_ADDRESS = os.path.join(TEMP_DIRPATH, 'tools.doc_server.sock')
+DEFAULT_AUTHKEY_FILEPATH = os.path.join(TEMP_DIRPATH, 'tools.doc_server.key')
+
+
+@dataclass
+class Request:
+    '''
+    run tool with argv as if it was invoked from cwd.
+    '''
+    tool: str
+    argv: List[str] = field(default_factory=lambda: [])
+    cwd: str = ''
+
+
+@dataclass
+class Response:
+    '''
+    what the tool would have exited with and everything it said along the way.
+    '''
+    returncode: int
+    output: str = ''
+    elapsed: float = 0.0
+
+
+def get_authkey(filepath=DEFAULT_AUTHKEY_FILEPATH, create=False):
+    # type: (str, bool) -> bytes
+    '''
+    Description:
+        the server and its clients share a secret so nobody else on the box can make us run things.
+        only the server creates it, readable by the user only.
+    '''
+    if create and not os.path.isfile(filepath):
+        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as wb:
+            wb.write(secrets.token_bytes(32))
+    with open(filepath, 'rb') as rb:
+        return rb.read()
+
+
+def run_tool(request):
+    # type: (Request) -> Response
+    '''
+    Description:
+        parse the argv and run the tool in this process exactly like the console script would,
+        capturing stdout, stderr, and the chriscarl logs instead of letting sys.exit kill us.
+        the tools main would configure_ez again, stacking handlers onto the servers loggers that point at this requests buffer,
+        so the tools Arguments are parsed here without touching logging and handed straight to its run.
+    '''
+    start = time.perf_counter()
+    if request.tool not in TOOLS:
+        return Response(2, f'unknown tool {request.tool!r}, choose from {list(TOOLS)}\n', time.perf_counter() - start)
+
+    buffer = io.StringIO()
+    handler = logging.StreamHandler(buffer)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    capture_logger, root_logger = logging.getLogger('chriscarl'), logging.getLogger()
+    # NOTE: whatever the tool does to logging, the next request starts from the same place
+    prior_loggers = [(logger, list(logger.handlers), logger.level) for logger in (capture_logger, root_logger)]
+    prior_argv, prior_cwd = sys.argv, os.getcwd()
+    returncode = 0
+    capture_logger.addHandler(handler)
+    try:
+        sys.argv = [request.tool] + list(request.argv)
+        if request.cwd:
+            os.chdir(request.cwd)
+        with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+            module = importlib.import_module(TOOLS[request.tool])
+            parser = module.Arguments.argparser()
+            if not request.argv:
+                parser.print_help()
+                sys.exit(1)
+            args = module.Arguments.parse(parser=parser, argv=list(request.argv), configure_logging=False)
+            handler.setLevel(args.log_level)
+            returncode = module.run(args) or 0
+    except SystemExit as se:
+        if isinstance(se.code, int):
+            returncode = se.code
+        elif se.code is None:
+            returncode = 0
+        else:
+            buffer.write(f'{se.code}\n')
+            returncode = 1
+    except Exception:
+        buffer.write(traceback.format_exc())
+        returncode = 1
+    finally:
+        for logger, handlers, level in prior_loggers:
+            logger.handlers[:] = handlers
+            logger.setLevel(level)
+        sys.argv = prior_argv
+        os.chdir(prior_cwd)
+    return Response(returncode, buffer.getvalue(), time.perf_counter() - start)
+
+
+def warm_up():
+    # type: () -> Dict[str, float]
+    '''
+    Description:
+        pay for the imports and the spellcheck dictionary once, up front, instead of on the first request.
+    Returns:
+        Dict[str, float]
+            what was warmed and how long it took
+    '''
+    timings = {}
+    for tool, module_name in TOOLS.items():
+        start = time.perf_counter()
+        try:
+            importlib.import_module(module_name)
+        except Exception as ex:
+            LOGGER.warning('could not import %r, it will be retried per request: %s', tool, ex)
+            continue
+        timings[tool] = time.perf_counter() - start
+    start = time.perf_counter()
+    try:
+        from chriscarl.core.lib.third import spellchecker
+        spellchecker.get_spell_checker()
+        timings['spellchecker'] = time.perf_counter() - start
+    except Exception as ex:
+        LOGGER.warning('could not build the spellchecker: %s', ex)
+    return timings
+
+
+def serve(address=DEFAULT_ADDRESS, authkey_filepath=DEFAULT_AUTHKEY_FILEPATH, warm=True):
+    # type: (T_ADDRESS, str, bool) -> int
+    '''
+    Description:
+        accept requests until a STOP request or ctrl+c.
+        requests are handled one at a time, the tools chdir and keep module level state so they cant share the process.
+    Returns:
+        int
+            how many tool requests were served
+    '''
+    authkey = get_authkey(authkey_filepath, create=True)
+    if isinstance(address, str) and os.path.exists(address):
+        if send(Request(PING), address=address, authkey_filepath=authkey_filepath) is not None:
+            raise RuntimeError(f'a server is already listening on "{address}"')
+        LOGGER.info('removing stale socket "%s"', address)
+        os.remove(address)
+    if warm:
+        for name, elapsed in warm_up().items():
+            LOGGER.info('warmed %r in %0.3f sec', name, elapsed)
+
+    served = 0
+    started = time.time()
+    with multiprocessing.connection.Listener(address, authkey=authkey) as listener:
+        LOGGER.info('listening on %r', listener.address)
+        while True:
+            try:
+                conn = listener.accept()
+            except (multiprocessing.AuthenticationError, OSError) as ex:
+                LOGGER.warning('rejected a connection: %s', ex)
+                continue
+            with conn:
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError) as ex:
+                    LOGGER.warning('client went away: %s', ex)
+                    continue
+                if request.tool == PING:
+                    conn.send(Response(0, f'pid {os.getpid()}, up {time.time() - started:0.1f} sec, served {served}\n'))
+                    continue
+                if request.tool == STOP:
+                    conn.send(Response(0, 'stopping\n'))
+                    break
+                LOGGER.info('%s %s', request.tool, ' '.join(request.argv))
+                response = run_tool(request)
+                served += 1
+                LOGGER.info('%s finished with %d in %0.3f sec', request.tool, response.returncode, response.elapsed)
+                try:
+                    conn.send(response)
+                except OSError as ex:
+                    LOGGER.warning('client went away: %s', ex)
+    return served
+
+
+def send(request, address=DEFAULT_ADDRESS, authkey_filepath=DEFAULT_AUTHKEY_FILEPATH):
+    # type: (Request, T_ADDRESS, str) -> Optional[Response]
+    '''
+    Description:
+        hand a request to the server and wait for it to finish.
+    Returns:
+        Optional[Response]
+            None if there is no server to talk to
+    '''
+    try:
+        authkey = get_authkey(authkey_filepath)
+        with multiprocessing.connection.Client(address, authkey=authkey) as conn:
+            conn.send(request)
+            return conn.recv()
+    except (FileNotFoundError, ConnectionRefusedError) as ex:
+        LOGGER.debug('no server at %r: %s', address, ex)
+        return None
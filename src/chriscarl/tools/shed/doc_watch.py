@@ -0,0 +1,693 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+Author:         Chris Carl
+Email:          chrisbcarl@outlook.com
+Date:           2026-10-17
+Description:
+
+tools.shed.doc_watch is functions that support the doc_watch tool, mostly watching the filesystem for changes
+tool are modules that define usually cli tools or mini applets that I or other people may find interesting or useful.
+
+Updates:
+    2026-10-17 - tools.shed.doc_watch - ContentCache supports "in"
+    2026-10-17 - tools.shed.doc_watch - FIX: inotify watches go up during the one walk instead of a second os.walk, an overflow re-watches new directories
+    2026-10-17 - tools.shed.doc_watch - added Debouncer so a burst of saves is processed once
+    2026-10-17 - tools.shed.doc_watch - added iter_md_tables, a line based table scanner that respects code fences
+    2026-10-17 - tools.shed.doc_watch - added ContentCache so clean files are skipped across restarts
+    2026-10-17 - tools.shed.doc_watch - walk is incremental now, only directories whose mtime changed get re-listed, index persists across restarts
+    2026-10-17 - tools.shed.doc_watch - initial commit, added PollingWatcher and InotifyWatcher backends
+'''
+
+# stdlib imports
+from __future__ import absolute_import, print_function, division, with_statement  # , unicode_literals
+import os
+import sys
+import logging
+import re
+import time
+import enum
+import errno
+import select
+import struct
+import json
+import hashlib
+import importlib.metadata
+from typing import List, Optional, Dict, Tuple, Iterable, Generator, Callable
+from dataclasses import dataclass
+
+# third party imports
+
+# project imports
+from chriscarl.core.lib.stdlib.io import read_text_file, write_text_file
+
+SCRIPT_RELPATH = 'chriscarl/tools/shed/doc_watch.py'
+if not hasattr(sys, '_MEIPASS'):
+    SCRIPT_FILEPATH = os.path.abspath(__file__)
+else:
+    SCRIPT_FILEPATH = os.path.abspath(os.path.join(sys._MEIPASS, SCRIPT_RELPATH))  # pylint: disable=no-member
+SCRIPT_DIRPATH = os.path.dirname(SCRIPT_FILEPATH)
+SCRIPT_NAME = os.path.splitext(os.path.basename(__file__))[0]
+THIS_MODULE = sys.modules[__name__]
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(logging.NullHandler())
+
+LINUX = sys.platform.startswith('linux')
+DEFAULT_POLL_INTERVAL = 0.33
+INDEX_VERSION = 1
+# a directory modified this close to when we listed it may get another entry in the same mtime tick, list it again next time
+RACY_NS = 1_000_000_000
+
+
+class Events(enum.Enum):
+    created = enum.auto()
+    modified = enum.auto()
+    deleted = enum.auto()
+    moved = enum.auto()
+
+    def __str__(self):
+        return f'{self.name}'
+
+
+@dataclass
+class WatchEvent:
+    '''
+    a single change to a watched file, moved events remember where they came from.
+    '''
+    event: Events
+    filepath: str
+    src_filepath: str = ''
+
+
+def is_under(path, dirpath):
+    # type: (str, str) -> bool
+    return path == dirpath or path.startswith(f'{dirpath}{os.sep}')
+
+
+class Watcher(object):
+    '''
+    Description:
+        base watcher, knows what to watch and keeps the {filepath: mtime} index up to date.
+        subclasses only have to implement read()
+    Arguments:
+        dirpaths: List[str]
+        patterns: List[str]
+            regexes a filepath must match at least one of
+        exclude: List[str]
+            regexes a filepath must match none of
+        mtimes: Dict[str, float]
+            shared index, usually doc_watch.FILEPATHS_MODIFIED, so writes made by the tool are visible to the watcher
+    '''
+    name = 'base'
+
+    def __init__(self, dirpaths, patterns, exclude=None, mtimes=None):
+        # type: (List[str], List[str], Optional[List[str]], Optional[Dict[str, float]]) -> None
+        self.dirpaths = [os.path.abspath(dirpath) for dirpath in dirpaths]
+        self.patterns = list(patterns)
+        self.exclude = list(exclude or [])
+        self.regexes = [re.compile(pattern) for pattern in self.patterns]
+        self.excludes = [re.compile(pattern) for pattern in self.exclude]
+        self.mtimes = mtimes if mtimes is not None else {}
+        self.dirs = {}  # type: Dict[str, Tuple[int, List[str], List[str]]]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        # type: () -> None
+        pass
+
+    def is_excluded(self, path):
+        # type: (str) -> bool
+        return any(regex.search(path) for regex in self.excludes)
+
+    def matches(self, filepath):
+        # type: (str) -> bool
+        return any(regex.search(filepath) for regex in self.regexes) and not self.is_excluded(filepath)
+
+    def config_hash(self):
+        # type: () -> str
+        return hashlib.md5(json.dumps([self.dirpaths, sorted(self.patterns), sorted(self.exclude)]).encode('utf-8')).hexdigest()
+
+    def list_dir(self, dirpath, mtime_ns):
+        # type: (str, int) -> Tuple[int, List[str], List[str]]
+        filenames, dirnames = [], []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not self.is_excluded(entry.path):
+                            dirnames.append(entry.name)
+                    elif self.matches(entry.path):
+                        filenames.append(entry.name)
+        except (FileNotFoundError, NotADirectoryError, PermissionError) as ex:
+            LOGGER.debug('could not list "%s" bc %s', dirpath, ex)
+        if time.time_ns() - mtime_ns < RACY_NS:
+            mtime_ns = -1
+        self.dirs[dirpath] = (mtime_ns, sorted(filenames), sorted(dirnames))
+        return self.dirs[dirpath]
+
+    def visit_dir(self, dirpath):
+        # type: (str) -> None
+        '''called on every directory walk goes through, before its looked at'''
+        pass
+
+    def walk(self, dirpaths=None):
+        # type: (Optional[List[str]]) -> List[str]
+        '''
+        Description:
+            every matching file under the dirpaths, but only directories whose mtime changed get listed again,
+            everything else is a single stat and a dict lookup.
+        Arguments:
+            dirpaths: Optional[List[str]]
+                just these subtrees, the index outside of them is left alone, defaults to everything watched
+        Returns:
+            List[str]
+        '''
+        roots = self.dirpaths if dirpaths is None else [os.path.abspath(dirpath) for dirpath in dirpaths]
+        filepaths = []
+        visited = set()
+        stack = list(reversed(roots))
+        while stack:
+            dirpath = stack.pop()
+            if dirpath in visited:
+                continue
+            visited.add(dirpath)
+            self.visit_dir(dirpath)
+            try:
+                mtime_ns = os.stat(dirpath).st_mtime_ns
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            entry = self.dirs.get(dirpath)
+            if entry is None or entry[0] != mtime_ns:
+                entry = self.list_dir(dirpath, mtime_ns)
+            _, filenames, dirnames = entry
+            filepaths.extend(os.path.join(dirpath, fname) for fname in filenames)
+            stack.extend(os.path.join(dirpath, dirname) for dirname in reversed(dirnames))
+        for dirpath in set(self.dirs) - visited:
+            if dirpaths is None or any(is_under(dirpath, root) for root in roots):
+                del self.dirs[dirpath]
+        return filepaths
+
+    def forget_tree(self, dirpath):
+        # type: (str) -> None
+        for indexed in [ele for ele in self.dirs if is_under(ele, dirpath)]:
+            del self.dirs[indexed]
+
+    def load_index(self, filepath):
+        # type: (str) -> bool
+        '''pick up where a previous run left off, returns False if there was nothing usable'''
+        try:
+            index = json.loads(read_text_file(filepath))
+        except Exception as ex:
+            LOGGER.debug('no usable index at "%s" bc %s', filepath, ex)
+            return False
+        if index.get('version') != INDEX_VERSION or index.get('config') != self.config_hash():
+            LOGGER.debug('index at "%s" is for a different configuration, ignoring', filepath)
+            return False
+        self.dirs = {dirpath: tuple(entry) for dirpath, entry in index['dirs'].items()}
+        return True
+
+    def save_index(self, filepath):
+        # type: (str) -> None
+        index = dict(version=INDEX_VERSION, config=self.config_hash(), dirs=self.dirs)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        write_text_file(filepath, json.dumps(index))
+
+    def record(self, event, filepath, src_filepath=''):
+        # type: (Events, str, str) -> Optional[WatchEvent]
+        '''keep the mtime index honest, returns None if the event turned out to be a no-op'''
+        if src_filepath:
+            self.mtimes.pop(src_filepath, None)
+        if event == Events.deleted:
+            if filepath not in self.mtimes:
+                return None
+            del self.mtimes[filepath]
+            return WatchEvent(event, filepath)
+        try:
+            mtime = os.path.getmtime(filepath)
+        except FileNotFoundError:
+            # created and deleted before we got to it
+            return self.record(Events.deleted, filepath)
+        self.mtimes[filepath] = mtime
+        return WatchEvent(event, filepath, src_filepath=src_filepath)
+
+    def scan(self):
+        # type: () -> List[WatchEvent]
+        '''
+        Description:
+            the brute force approach, stat everything we know about, walk for anything we don't.
+            files that were in the index but aren't anymore show up as deleted without a stat.
+        Returns:
+            List[WatchEvent]
+        '''
+        events = []
+        filepaths = self.walk()
+        found = set(filepaths)
+        for filepath in list(self.mtimes):
+            if filepath not in found:
+                events.append(self.record(Events.deleted, filepath))
+                continue
+            try:
+                mtime = os.path.getmtime(filepath)
+            except FileNotFoundError:
+                events.append(self.record(Events.deleted, filepath))
+                continue
+            if mtime > self.mtimes[filepath]:
+                self.mtimes[filepath] = mtime
+                events.append(WatchEvent(Events.modified, filepath))
+        for filepath in filepaths:
+            if filepath not in self.mtimes:
+                LOGGER.debug('adding file "%s"', filepath)
+                events.append(self.record(Events.created, filepath))
+        return [event for event in events if event]
+
+    def read(self, timeout=None):
+        # type: (Optional[float]) -> List[WatchEvent]
+        '''block up to timeout seconds (forever if None) until there is at least one event'''
+        raise NotImplementedError()
+
+
+class PollingWatcher(Watcher):
+    '''
+    the old reliable, re-scan every interval. works everywhere, costs a stat per file per interval.
+    '''
+    name = 'poll'
+
+    def __init__(self, dirpaths, patterns, exclude=None, mtimes=None, interval=DEFAULT_POLL_INTERVAL):
+        # type: (List[str], List[str], Optional[List[str]], Optional[Dict[str, float]], float) -> None
+        super().__init__(dirpaths, patterns, exclude=exclude, mtimes=mtimes)
+        self.interval = interval
+
+    def read(self, timeout=None):
+        # type: (Optional[float]) -> List[WatchEvent]
+        start = time.time()
+        while True:
+            events = self.scan()
+            if events:
+                return events
+            remaining = None if timeout is None else timeout - (time.time() - start)
+            if remaining is not None and remaining <= 0:
+                return []
+            time.sleep(self.interval if remaining is None else min(self.interval, remaining))
+
+
+# https://man7.org/linux/man-pages/man7/inotify.7.html
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+INOTIFY_EVENT = struct.Struct('iIII')  # wd, mask, cookie, len, then char name[len]
+
+
+def _libc():
+    import ctypes
+    import ctypes.util
+    libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    return libc, ctypes
+
+
+class InotifyWatcher(Watcher):
+    '''
+    linux inotify via ctypes, the kernel tells us what changed so there's nothing to do while idle.
+    one watch per directory, added as walk goes through it, so scan() is what puts the watches up.
+    new directories get watched as they show up.
+    '''
+    name = 'inotify'
+
+    def __init__(self, dirpaths, patterns, exclude=None, mtimes=None):
+        # type: (List[str], List[str], Optional[List[str]], Optional[Dict[str, float]]) -> None
+        super().__init__(dirpaths, patterns, exclude=exclude, mtimes=mtimes)
+        if not LINUX:
+            raise OSError(f'inotify is linux only, not {sys.platform!r}')
+        self.libc, self.ctypes = _libc()
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            err = self.ctypes.get_errno()
+            raise OSError(err, f'inotify_init1 failed, {os.strerror(err)}')
+        self.wd_to_dirpath = {}  # type: Dict[int, str]
+
+    def close(self):
+        # type: () -> None
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+        self.wd_to_dirpath.clear()
+
+    def add_dir(self, dirpath):
+        # type: (str) -> None
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(dirpath), IN_WATCH_MASK | IN_ONLYDIR)
+        if wd < 0:
+            err = self.ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR):  # gone before we got to it
+                return
+            raise OSError(err, f'inotify_add_watch "{dirpath}" failed, {os.strerror(err)}')
+        self.wd_to_dirpath[wd] = dirpath
+
+    def visit_dir(self, dirpath):
+        # type: (str) -> None
+        # NOTE: watch first, list second, anything created in between still gets an event
+        self.add_dir(dirpath)
+
+    def add_tree(self, dirpath):
+        # type: (str) -> List[str]
+        '''watch dirpath and everything under it, returns the matching files found along the way'''
+        return self.walk([dirpath])
+
+    def parse(self, data):
+        # type: (bytes) -> List[Tuple[int, int, int, str]]
+        raws = []
+        offset = 0
+        while offset + INOTIFY_EVENT.size <= len(data):
+            wd, mask, cookie, length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            raws.append((wd, mask, cookie, name))
+        return raws
+
+    def translate(self, raws):
+        # type: (List[Tuple[int, int, int, str]]) -> List[WatchEvent]
+        events = []  # type: List[Optional[WatchEvent]]
+        moved_from = {}  # type: Dict[int, str]
+        for wd, mask, cookie, name in raws:
+            if mask & IN_Q_OVERFLOW:
+                LOGGER.warning('inotify queue overflowed, re-adding watches and falling back to a full scan')
+                # NOTE: the IN_IGNOREDs may have been dropped too, forget every directory so each one gets listed and re-watched
+                self.dirs.clear()
+                for dirpath in self.dirpaths:
+                    self.add_tree(dirpath)
+                events.extend(self.scan())
+                continue
+            if mask & IN_IGNORED:
+                self.wd_to_dirpath.pop(wd, None)
+                continue
+            dirpath = self.wd_to_dirpath.get(wd)
+            if dirpath is None or not name:  # *_SELF events, the parent watch reports those for us
+                continue
+            path = os.path.join(dirpath, name)
+
+            if mask & IN_ISDIR:
+                if self.is_excluded(path):
+                    continue
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    events.extend(self.record(Events.created, filepath) for filepath in self.add_tree(path))
+                elif mask & (IN_MOVED_FROM | IN_DELETE):
+                    self.forget_tree(path)
+                    prefix = f'{path}{os.sep}'
+                    events.extend(self.record(Events.deleted, filepath) for filepath in list(self.mtimes) if filepath.startswith(prefix))
+                continue
+
+            if not self.matches(path):
+                continue
+            if mask & IN_MOVED_FROM:
+                moved_from[cookie] = path
+            elif mask & IN_MOVED_TO:
+                src_filepath = moved_from.pop(cookie, '')
+                events.append(self.record(Events.moved if src_filepath else Events.created, path, src_filepath=src_filepath))
+            elif mask & IN_DELETE:
+                events.append(self.record(Events.deleted, path))
+            elif mask & IN_CREATE:
+                events.append(self.record(Events.created, path))
+            elif mask & IN_CLOSE_WRITE:
+                events.append(self.record(Events.modified, path))
+
+        # moved out of anything we watch, as good as deleted
+        events.extend(self.record(Events.deleted, filepath) for filepath in moved_from.values())
+        return [event for event in events if event]
+
+    def read(self, timeout=None):
+        # type: (Optional[float]) -> List[WatchEvent]
+        start = time.time()
+        while True:
+            remaining = None if timeout is None else max(0.0, timeout - (time.time() - start))
+            readable, _, _ = select.select([self.fd], [], [], remaining)
+            if not readable:
+                return []
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            events = self.translate(self.parse(data))
+            if events:
+                return events
+
+
+WATCHERS = {
+    PollingWatcher.name: PollingWatcher,
+    InotifyWatcher.name: InotifyWatcher,
+}
+DEFAULT_WATCHER = 'auto'
+
+
+def get_watcher(dirpaths, patterns, exclude=None, mtimes=None, watcher=DEFAULT_WATCHER, interval=DEFAULT_POLL_INTERVAL):
+    # type: (List[str], List[str], Optional[List[str]], Optional[Dict[str, float]], str, float) -> Watcher
+    '''
+    Description:
+        pick the best watcher backend available, auto means inotify if we can, polling if we cant
+    Arguments:
+        watcher: str
+            'auto', 'inotify', or 'poll'
+    '''
+    if watcher not in WATCHERS and watcher != DEFAULT_WATCHER:
+        raise ValueError(f'watcher {watcher!r} not in {[DEFAULT_WATCHER] + list(WATCHERS)}')
+    if watcher in (DEFAULT_WATCHER, InotifyWatcher.name):
+        try:
+            return InotifyWatcher(dirpaths, patterns, exclude=exclude, mtimes=mtimes)
+        except OSError as ex:
+            if watcher == InotifyWatcher.name:
+                raise
+            LOGGER.warning('inotify unavailable, falling back to polling every %0.2f sec bc %s', interval, ex)
+    return PollingWatcher(dirpaths, patterns, exclude=exclude, mtimes=mtimes, interval=interval)
+
+
+DEFAULT_QUIET = 0.25
+DEFAULT_MAX_LATENCY = 2.0
+
+
+class Debouncer(object):
+    '''
+    Description:
+        editors save in bursts (write a temp, rename it over, touch it), so per file, wait until it has been quiet for
+        quiet seconds before letting it through, but never hold a file back more than max_latency since its first event.
+        a burst becomes exactly one run, and we stop reading files the editor is still halfway through writing.
+    Arguments:
+        quiet: float
+            seconds of silence before a file is due, 0 lets everything through immediately
+        max_latency: float
+            seconds since the first event of a burst before a file is due no matter what
+    '''
+
+    def __init__(self, quiet=DEFAULT_QUIET, max_latency=DEFAULT_MAX_LATENCY, clock=time.monotonic):
+        # type: (float, float, Callable[[], float]) -> None
+        self.quiet = quiet
+        self.max_latency = max(quiet, max_latency)
+        self.clock = clock
+        self.pending = {}  # type: Dict[str, Tuple[float, float]]
+
+    def __len__(self):
+        return len(self.pending)
+
+    def add(self, filepath):
+        # type: (str) -> None
+        now = self.clock()
+        first, _ = self.pending.get(filepath, (now, now))
+        self.pending[filepath] = (first, now)
+
+    def discard(self, filepath):
+        # type: (str) -> None
+        self.pending.pop(filepath, None)
+
+    def due_in(self, filepath):
+        # type: (str) -> float
+        first, last = self.pending[filepath]
+        return min(last + self.quiet, first + self.max_latency) - self.clock()
+
+    def timeout(self):
+        # type: () -> Optional[float]
+        '''seconds until the next file is due, None if nothing is pending, good for passing to Watcher.read'''
+        if not self.pending:
+            return None
+        return max(0.0, min(self.due_in(filepath) for filepath in self.pending))
+
+    def pop_due(self):
+        # type: () -> List[str]
+        '''files that are due, in the order their bursts started'''
+        due = [filepath for filepath in self.pending if self.due_in(filepath) <= 0]
+        for filepath in due:
+            del self.pending[filepath]
+        return due
+
+
+PACKAGE_NAME = 'chriscarl.tools.documents'
+CACHE_VERSION = 1
+
+
+def package_version():
+    # type: () -> str
+    try:
+        return importlib.metadata.version(PACKAGE_NAME)
+    except importlib.metadata.PackageNotFoundError:
+        return '0.0.0'
+
+
+def md5_file(filepath):
+    # type: (str) -> str
+    with open(filepath, 'rb') as r:
+        return hashlib.md5(r.read()).hexdigest()
+
+
+class ContentCache(object):
+    '''
+    Description:
+        {func set: {filepath: (size, mtime_ns, md5)}} of the last time a file was processed cleanly, persisted as json.
+        a file whose stat matches is skipped without a read, a file that was only touched costs one read and an md5.
+        everything is dropped if the package version changes, a different func set gets its own entries.
+    Arguments:
+        filepath: str
+            where the cache lives, nothing is persisted if empty
+        funcs: List[str]
+            names of the enabled functions
+    '''
+
+    def __init__(self, filepath, funcs):
+        # type: (str, List[str]) -> None
+        self.filepath = filepath
+        self.key = ','.join(sorted(funcs))
+        self.version = f'{CACHE_VERSION}-{package_version()}'
+        self.caches = {}  # type: Dict[str, Dict[str, Tuple[int, int, str]]]
+        if self.filepath:
+            try:
+                cache = json.loads(read_text_file(self.filepath))
+                if cache.get('version') == self.version:
+                    self.caches = cache['caches']
+                else:
+                    LOGGER.info('cache "%s" is from version %r, starting over', self.filepath, cache.get('version'))
+            except Exception as ex:
+                LOGGER.debug('no usable cache at "%s" bc %s', self.filepath, ex)
+        self.files = self.caches.setdefault(self.key, {})
+
+    def __len__(self):
+        return len(self.files)
+
+    def __contains__(self, filepath):
+        # type: (str) -> bool
+        return filepath in self.files
+
+    def is_fresh(self, filepath):
+        # type: (str) -> bool
+        '''True if the file on disk is exactly what we left behind last time'''
+        entry = self.files.get(filepath)
+        if not entry:
+            return False
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return False
+        size, mtime_ns, digest = entry
+        if stat.st_size != size:
+            return False
+        if stat.st_mtime_ns == mtime_ns:
+            return True
+        # touched, checked out, copied... same bytes though?
+        try:
+            if md5_file(filepath) != digest:
+                return False
+        except OSError:
+            return False
+        self.files[filepath] = (size, stat.st_mtime_ns, digest)
+        return True
+
+    def update(self, filepath):
+        # type: (str) -> None
+        try:
+            stat = os.stat(filepath)
+            self.files[filepath] = (stat.st_size, stat.st_mtime_ns, md5_file(filepath))
+        except OSError:
+            self.discard(filepath)
+
+    def discard(self, filepath):
+        # type: (str) -> None
+        self.files.pop(filepath, None)
+
+    def save(self):
+        # type: () -> None
+        if not self.filepath:
+            return
+        os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
+        write_text_file(self.filepath, json.dumps(dict(version=self.version, caches=self.caches)))
+
+
+REGEX_FENCE_OPEN = re.compile(r'^(`{3,}|~{3,})')
+TABLE_FIRST_CHARS = ' \t|`~'  # a line starting with anything else is prose, nothing to look at
+
+
+@dataclass
+class MarkdownTable:
+    '''
+    a run of consecutive lines that start with | (after indentation), outside of any fenced code block.
+    start/end are 0-based line numbers, end is exclusive. text has the indentation removed.
+    '''
+    start: int
+    end: int
+    indentation: str
+    text: str
+
+
+def iter_md_tables(lines):
+    # type: (Iterable[str]) -> Generator[MarkdownTable, None, None]
+    '''
+    Description:
+        single pass, line at a time table scanner, so it works just as well on an open file as a list of lines.
+        no backtracking, a table ends at the first line that isnt a row, ``` and ~~~ fences are skipped entirely.
+    Arguments:
+        lines: Iterable[str]
+            with or without line endings
+    Returns:
+        Generator[MarkdownTable, None, None]
+    '''
+    fence = ''
+    rows = []  # type: List[str]
+    start = 0
+    indentation = ''
+    lineno = -1
+    for lineno, line in enumerate(lines):
+        if not fence and not rows and line[:1] not in TABLE_FIRST_CHARS:
+            continue
+        line = line.rstrip('\r\n')
+        stripped = line.lstrip(' \t')
+        if fence:
+            closing = stripped.rstrip()
+            if len(closing) >= len(fence) and closing == fence[0] * len(closing):
+                fence = ''
+            continue
+
+        if stripped.startswith('|'):
+            if not rows:
+                start = lineno
+                indentation = line[:len(line) - len(stripped)]
+            rows.append(line[len(indentation):] if line.startswith(indentation) else stripped)
+            continue
+
+        if rows:
+            yield MarkdownTable(start, lineno, indentation, '\n'.join(rows))
+            rows = []
+        mo = REGEX_FENCE_OPEN.match(stripped)
+        if mo:
+            fence = mo.group(1)
+    if rows:
+        yield MarkdownTable(start, lineno + 1, indentation, '\n'.join(rows))
@@ -10,6 +10,7 @@ tools.shed.html2md really just wraps markdownify
 tool are modules that define usually cli tools or mini applets that I or other people may find interesting or useful.
 
 Updates:
+    2026-10-17 - tools.shed.html2md - markdownify is imported on first use
     2026-01-31 - tools.shed.html2md - initial commit
 '''
 
@@ -22,7 +23,7 @@ import re
 from typing import Union
 
 # third party imports
-import markdownify
+# NOTE: markdownify is imported in html_to_markdown, keeps tool startup fast
 
 # project imports
 from chriscarl.core.lib.stdlib.io import read_text_file
@@ -45,6 +46,8 @@ def html_to_markdown(html_or_str):
     if is_file(html_or_str):
         html_or_str = read_text_file(html_or_str)
 
+    import markdownify
+
     text = markdownify.markdownify(
         html_or_str,
         heading_style='ATX',  # headers w/ octothorp
@@ -10,6 +10,13 @@ tools.shed.md2latex is individual funcs that support the larger tool that COULD
 tool are modules that define usually cli tools or mini applets that I or other people may find interesting or useful.
 
 Updates:
+    2026-10-17 - tools.shed.md2latex - doclets_spellcheck checks each doclet on its own through SpellcheckCache, misses in a process pool with jobs
+    2026-10-17 - tools.shed.md2latex - doclets_spellcheck can persist spelling corrections across runs with corrections_filepath
+    2026-10-17 - tools.shed.md2latex - added PhaseProfiler, per-phase wall/cpu time and counts as json, optional cProfile dump per phase
+    2026-10-17 - tools.shed.md2latex - the .fmt copied next to the .tex is a work file too
+    2026-10-17 - tools.shed.md2latex - .bbl.md5 bibliography stamps are work files too
+    2026-10-17 - tools.shed.md2latex - added DocletCache, doclets_to_latex only re-renders doclets whose inputs changed
+    2026-10-17 - tools.shed.md2latex - markdown2, yaml, and the spellchecker are imported where they're used so --help and -ss dont pay for them
     2026-03-02 - tools.shed.md2latex - FIX: unsupported languages default to C++ lstlisting
     2026-02-20 - tools.shed.md2latex - moved out many regex and functions to the main library markdown parser.
     2026-02-15 - tools.shed.md2latex - added --auto-label-caption
@@ -34,18 +41,21 @@ import datetime
 import shutil
 import string
 import re
-from typing import Tuple, List, Optional, Dict
+import json
+import hashlib
+import time
+import contextlib
+import concurrent.futures
+from typing import Tuple, List, Optional, Dict, Any, Generator
 
 # third party imports
-import markdown2
-import yaml
+# NOTE: markdown2 and yaml are imported by the functions that need them, keeps tool startup fast
 
 # project imports
 from chriscarl.core.lib.stdlib.os import is_file, dirpath
 from chriscarl.core.lib.stdlib.subprocess import which
 from chriscarl.core.lib.stdlib.io import read_text_file, write_text_file
 from chriscarl.core.lib.stdlib.urllib import download
-from chriscarl.core.lib.third.spellchecker import spellcheck
 from chriscarl.core.types.str import indent, dedent, find_lineno_index
 from chriscarl.core.functors.parse.str import unicode_replace
 from chriscarl.core.functors.parse import latex, bibtex, markdown
@@ -73,6 +83,7 @@ TEMPLATES = {
     'math': mand.FILEPATH_MD2LATEX_CHICAGO_TEMPLATE,  # chicago with some hardcoding
 }
 DEFAULT_TEMPLATE = list(TEMPLATES)[0]
+SPELLCHECK_PARALLEL_THRESHOLD = 16  # each worker builds its own SpellChecker, not worth it for a handful of edited doclets
 
 
 def assert_executables_exist():
@@ -212,6 +223,8 @@ def markdown_emphasis_to_latex(text):
 
 
 def markdown_list_to_latex(content):
+    import markdown2
+
     # hack to avoid the latex to mathml conversion...
     _old_run = markdown2.Latex.run
     markdown2.Latex.run = (lambda self, text: text)
@@ -268,7 +281,7 @@ def markdown_list_to_latex(content):
     return latex_list
 
 
-LATEX_EXTS_TO_CLEAN = ['.aux', '.bbl', '.bcf', '.blg', '.lof', '.log', '.lot', '.out', '.synctex(busy)', '.synctex.gz', '.run.xml', '.toc']
+LATEX_EXTS_TO_CLEAN = ['.aux', '.bbl', '.bbl.md5', '.bcf', '.blg', '.fmt', '.lof', '.log', '.lot', '.out', '.synctex(busy)', '.synctex.gz', '.run.xml', '.toc']
 
 
 def delete_latex_work_files(dirpath, filename, extra=None):
@@ -331,31 +344,124 @@ def process_labels(bibtex_labels, interdoc_labels):
     return labels, errors, warnings
 
 
-def doclets_spellcheck(doclets, md_filepath):
-    # type: (List[MarkdownDoclet], str) -> Tuple[int, List[str], List[str]]
+class SpellcheckCache(object):
+    '''
+    Description:
+        {md5 of a doclets spellcheckable words: (error words, warning words, word count)} persisted as json,
+        line numbers are relative to the doclet so a doclet moving around the paper is still a hit.
+        the dictionary version is part of the file, a word list change throws the whole thing out.
+        only entries used by the latest run are saved, so it never outgrows the document.
+    Arguments:
+        filepath: str
+            where the cache lives, usually next to the .tex
+        version: str
+            spellchecker.dictionary_version()
+    '''
+
+    def __init__(self, filepath, version):
+        # type: (str, str) -> None
+        self.filepath = filepath
+        self.version = version
+        self.doclets = {}  # type: Dict[str, Any]
+        self.used = {}  # type: Dict[str, Any]
+        self.hits = 0
+        self.misses = 0
+        if not os.path.isfile(filepath):
+            return
+        try:
+            data = json.loads(read_text_file(filepath))
+        except (OSError, ValueError) as ex:
+            LOGGER.warning('ignoring unreadable spellcheck cache "%s": %s', filepath, ex)
+            return
+        if data.get('version') != self.version:
+            LOGGER.debug('dictionary changed, dropping spellcheck cache "%s"', filepath)
+            return
+        self.doclets = data.get('doclets', {})
+
+    def key(self, text):
+        # type: (str) -> str
+        return hashlib.md5(text.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        # type: (str) -> Optional[Tuple[Dict[str, List[tuple]], Dict[str, List[tuple]], int]]
+        value = self.doclets.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.used[key] = value
+        error_words, warning_words, word_count = value
+        # NOTE: json turned the (lineno, line, ...) tuples into lists
+        error_words = {word: [tuple(ele) for ele in occurrences] for word, occurrences in error_words.items()}
+        warning_words = {word: [tuple(ele) for ele in occurrences] for word, occurrences in warning_words.items()}
+        return error_words, warning_words, word_count
+
+    def put(self, key, result):
+        # type: (str, Tuple[Dict[str, List[tuple]], Dict[str, List[tuple]], int]) -> None
+        self.doclets[key] = self.used[key] = result
+
+    def save(self):
+        # type: () -> None
+        os.makedirs(os.path.dirname(self.filepath) or '.', exist_ok=True)
+        write_text_file(self.filepath, json.dumps({'version': self.version, 'doclets': self.used}))
+        LOGGER.debug('spellcheck cache %d hits, %d misses, wrote "%s"', self.hits, self.misses, self.filepath)
+
+
+def doclets_spellcheck(doclets, md_filepath, corrections_filepath='', cache_filepath='', jobs=1):
+    # type: (List[MarkdownDoclet], str, str, str, int) -> Tuple[int, List[str], List[str]]
     '''
     Description:
-        given a list of doclets, analyze just the spellcheckable words
+        given a list of doclets, analyze just the spellcheckable words.
+        each doclet is spellchecked on its own and stitched back together, so an edit only re-checks the doclets it touched.
     Arguments:
         fatal: bool
             promote mispelled words to errors instead of warnings
+        corrections_filepath: str
+            where spelling corrections are remembered between runs, empty means only for this process
+        cache_filepath: str
+            where per-doclet spellchecks are remembered between runs, empty means check every doclet
+        jobs: int
+            processes for the doclets that werent cached, only used past SPELLCHECK_PARALLEL_THRESHOLD of them
     Returns:
         Tuple[List[str], List[str]]
             errors, warnings
     '''
+    from chriscarl.core.lib.third.spellchecker import spellcheck, merge_spellchecks, dictionary_version, CORRECTIONS
+
+    if corrections_filepath:
+        CORRECTIONS.load(corrections_filepath)
+
     errors, warnings = [], []
     original_md_content = read_text_file(md_filepath)
 
     spellcheckable_sections = set(['header', 'any', 'list'])
-    spellcheckable_words = ''
-    for doclet in doclets:
-        if doclet.section in spellcheckable_sections:
-            spellcheckable_words += get_words_only(doclet.content)
+    spellcheckable_words = [get_words_only(doclet.content) for doclet in doclets if doclet.section in spellcheckable_sections]
 
     # if debug:
-    # write_text_file('./ignoreme/spellcheckable_words.txt', spellcheckable_words)
-
-    error_words, warning_words, word_count = spellcheck(spellcheckable_words)
+    # write_text_file('./ignoreme/spellcheckable_words.txt', ''.join(spellcheckable_words))
+
+    cache = SpellcheckCache(cache_filepath, dictionary_version()) if cache_filepath else None
+    results = [cache.get(cache.key(text)) if cache else None for text in spellcheckable_words]  # type: List[Any]
+    uncached = [r for r, result in enumerate(results) if result is None]
+    if cache is not None:
+        LOGGER.info('%d / %d doclets spellchecked from cache', cache.hits, len(spellcheckable_words))
+    if jobs > 1 and len(uncached) >= SPELLCHECK_PARALLEL_THRESHOLD:
+        # NOTE: corrections made by the workers stay in the workers, the cache file still gets every doclet
+        chunksize = -(-len(uncached) // jobs)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+            checked = list(executor.map(spellcheck, [spellcheckable_words[r] for r in uncached], chunksize=chunksize))
+    else:
+        checked = [spellcheck(spellcheckable_words[r]) for r in uncached]
+    for r, result in zip(uncached, checked):
+        results[r] = result
+        if cache is not None:
+            cache.put(cache.key(spellcheckable_words[r]), result)
+    if cache is not None:
+        cache.save()
+
+    error_words, warning_words, word_count = merge_spellchecks(spellcheckable_words, results)
+    if corrections_filepath:
+        CORRECTIONS.save(corrections_filepath)
     if warning_words:
         warnings.append(f'{len(warning_words)} warning words discovered!')
         for word in sorted(warning_words):
@@ -453,11 +559,319 @@ def markdown_refs_to_latex(content, original_md_content, labels, errors, templat
     return content
 
 
-def doclets_to_latex(doclets, md_filepath, bibliography_output_filepath, labels, template):
-    # type: (List[MarkdownDoclet], str, str, Dict[str, Dict[str, str]], str) -> Tuple[Dict[str, str], Dict[str, str], List[str], List[str]]
+DOCLET_CACHE_VERSION = 1
+
+
+def renderer_fingerprint():
+    # type: () -> str
+    '''
+    Description:
+        md5 of the code that renders doclets, so a changed renderer never serves stale latex even without a version bump
+    '''
+    digest = hashlib.md5(str(DOCLET_CACHE_VERSION).encode('utf-8'))
+    for module in [THIS_MODULE, latex, markdown, sys.modules[unicode_replace.__module__]]:
+        with open(module.__file__, 'rb') as rb:
+            digest.update(rb.read())
+    return digest.hexdigest()
+
+
+def citation_refs(text):
+    # type: (str) -> List[str]
+    '''every spelling of every ref cited in the text, the same way markdown_refs_to_latex and the illegal placement check read them'''
+    refs = set()
+    for mo in REGEX_CITATION.finditer(text):
+        citation = mo.group(0)
+        refs.add(mo.group('ref').lower())
+        mo2 = REGEX_CITATION_PAGE.match(citation) or REGEX_CITATION_FULL.match(citation)
+        if mo2:
+            refs.add(mo2.group('ref').lower())
+    return sorted(refs)
+
+
+class DocletCache(object):
+    '''
+    Description:
+        {key: (latex, appendix, starts_appendix)} of doclets that rendered without errors or warnings, persisted as json.
+        the key is everything a render depends on: the doclet itself, the template, the appendix state coming in,
+        the labels it cites (not every label, adding a figure shouldnt re-render the whole paper), and the renderer code.
+        only entries used by the latest run are saved, so it never outgrows the document.
+    Arguments:
+        filepath: str
+            where the cache lives, usually next to the .tex
+    '''
+
+    def __init__(self, filepath):
+        # type: (str) -> None
+        self.filepath = filepath
+        self.fingerprint = renderer_fingerprint()
+        self.doclets = {}  # type: Dict[str, Tuple[str, bool, bool]]
+        self.used = {}  # type: Dict[str, Tuple[str, bool, bool]]
+        self.hits = 0
+        self.misses = 0
+        if not os.path.isfile(filepath):
+            return
+        try:
+            data = json.loads(read_text_file(filepath))
+        except (OSError, ValueError) as ex:
+            LOGGER.warning('ignoring unreadable doclet cache "%s": %s', filepath, ex)
+            return
+        if data.get('fingerprint') != self.fingerprint:
+            LOGGER.debug('renderer changed, dropping doclet cache "%s"', filepath)
+            return
+        self.doclets = {key: tuple(value) for key, value in data.get('doclets', {}).items()}
+
+    def key(self, doclet, labels, template, appendix):
+        # type: (MarkdownDoclet, Dict[str, Dict[str, str]], str, bool) -> str
+        cited = {ref: labels.get(ref) for ref in citation_refs(f'{doclet.content}\n{doclet.caption or ""}')}
+        blob = json.dumps(
+            [template, appendix, doclet.section, doclet.content, doclet.label, doclet.caption, doclet.data, doclet.appendix, cited],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.md5(blob.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        # type: (str) -> Optional[Tuple[str, bool, bool]]
+        value = self.doclets.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.used[key] = value
+        return value
+
+    def put(self, key, content, appendix, starts_appendix):
+        # type: (str, str, bool, bool) -> None
+        self.doclets[key] = self.used[key] = (content, appendix, starts_appendix)
+
+    def save(self):
+        # type: () -> None
+        os.makedirs(os.path.dirname(self.filepath) or '.', exist_ok=True)
+        write_text_file(self.filepath, json.dumps({'fingerprint': self.fingerprint, 'doclets': self.used}))
+        LOGGER.debug('doclet cache %d hits, %d misses, wrote "%s"', self.hits, self.misses, self.filepath)
+
+
+PROFILE_VERSION = 1
+
+
+class PhaseProfiler(object):
+    '''
+    Description:
+        wall and cpu time of each phase of a build, plus whatever the phase counts (doclets, bytes, cache hits),
+        as a json report. cpu is this process, cpu_children is finished subprocesses like pdflatex (always 0 on windows).
+        with cprofile_dirpath, every phase is also run under cProfile and dumped to its own .prof.
+        phases dont nest, only one cProfile can be active at a time.
+    Arguments:
+        cprofile_dirpath: str
+            where the .prof files go, empty means dont profile, just time
+    '''
+
+    def __init__(self, cprofile_dirpath=''):
+        # type: (str) -> None
+        self.cprofile_dirpath = cprofile_dirpath
+        self.phases = []  # type: List[Dict[str, Any]]
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        # type: (str) -> Generator[Dict[str, Any], None, None]
+        '''
+        Description:
+            time the body of the with, the yielded dict is for the phase to fill in its counts
+        Example:
+            >>> with profiler.phase('bibtex') as stats:
+            ...     stats['bytes'] = len(content)
+        '''
+        stats = {}  # type: Dict[str, Any]
+        profile = None
+        if self.cprofile_dirpath:
+            import cProfile
+            profile = cProfile.Profile()
+        wall, cpu, times = time.perf_counter(), time.process_time(), os.times()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield stats
+        finally:
+            if profile is not None:
+                profile.disable()
+            times_after = os.times()
+            record = {
+                'phase': name,
+                'wall': time.perf_counter() - wall,
+                'cpu': time.process_time() - cpu,
+                'cpu_children': (times_after.children_user + times_after.children_system) - (times.children_user + times.children_system),
+            }
+            record.update(stats)
+            if profile is not None:
+                os.makedirs(self.cprofile_dirpath, exist_ok=True)
+                record['cprofile'] = os.path.join(self.cprofile_dirpath, f'{len(self.phases):02d}.{name}.prof')
+                profile.dump_stats(record['cprofile'])
+            self.phases.append(record)
+            LOGGER.debug('%s took %0.3f sec wall, %0.3f sec cpu', name, record['wall'], record['cpu'])
+
+    def report(self):
+        # type: () -> Dict[str, Any]
+        return {
+            'version': PROFILE_VERSION,
+            'wall': sum(ele['wall'] for ele in self.phases),
+            'cpu': sum(ele['cpu'] for ele in self.phases),
+            'cpu_children': sum(ele['cpu_children'] for ele in self.phases),
+            'phases': self.phases,
+        }
+
+    def save(self, filepath):
+        # type: (str) -> None
+        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+        write_text_file(filepath, json.dumps(self.report(), indent=2))
+        LOGGER.info('profile at "%s"', filepath)
+
+
+def doclet_to_latex(doclet, labels, template, appendix, original_md_content, md_relpath):
+    # type: (MarkdownDoclet, Dict[str, Dict[str, str]], str, bool, str, str) -> Tuple[str, bool, bool, List[str], List[str]]
+    '''
+    Description:
+        a single non-yaml doclet to latex
+    Arguments:
+        appendix: bool
+            an appendix was announced and its header hasnt been rendered yet
+    Returns
+        Tuple[str, bool, bool, List[str], List[str]]
+            content, appendix still pending, this doclet starts the appendix, errors, warnings
+    '''
+    errors, warnings = [], []
+    starts_appendix = False
+    section, content, label, caption, data = (doclet.section, doclet.content, doclet.label, doclet.caption, doclet.data)
+
+    if doclet.appendix is True:
+        appendix = True
+
+    if caption:
+        # are there refs IN THE CAPTION?
+        caption = markdown_refs_to_latex(caption, original_md_content, labels, errors, template=template)
+
+    # TODO: auto Fig. Table. Code. etc.
+    if section in set(['comment']):
+        # WARNING: strip the content of latex otherwise biber doesnt fking work...
+        _, content = bibtex.extract_from_and_remove(content)
+        content = '\n'.join(f'% {line}' for line in content.splitlines())
+    elif section == 'header':
+        MD_HEADER_TO_LATEX = {
+            '#': '\\section',
+            '##': '\\subsection',
+            '###': '\\subsubsection',
+            '####': '\\paragraph',
+        }
+        title = data['title']
+        octothorps = data['octothorps']
+        if appendix:
+            content = f'\\newpage\n\\appendix\n\\label{{appendix}}'  # NOTE: NOT a usual title
+            # TODO: only works on the book / report class...
+            # if appendix:
+            #     replacement = f'\\chapter{{{title}}}\\label{{href-{anchor}}}'
+            appendix = False  # turn off
+            starts_appendix = True
+        else:
+            content = f'{MD_HEADER_TO_LATEX[octothorps]}{{{title}}}\\label{{{label}}}'
+    elif section == 'img':
+        IMG_REPLACEMENT = r'''
+        \begin{figure}[htbp]
+            \centerline{\includegraphics[width=<WIDTH>]{<PATH>}}
+            \caption{<ALT>}
+            \label{<LABEL>}
+        \end{figure}
+        '''
+        path = data['path']
+        replacement = IMG_REPLACEMENT.replace('<PATH>', path).replace('<ALT>', caption).replace('<LABEL>', label)
+        if template == 'ieee':
+            replacement = replacement.replace('<WIDTH>', '\\linewidth')
+        else:
+            replacement = replacement.replace('<WIDTH>', '0.66\\linewidth')
+        content = replacement
+    elif section == 'latex':
+        content = dedent(content).strip()  # NOTE: the .strip() is CRITICAL. if you have \begin{math}\n\n\begin{aligned} you're TOAST
+        aligned = content.startswith('\\begin{align')
+        if aligned:
+            # convert it to an equation anyway. regardless if sense or not. \begin{math}\end{math} aint working
+            content = f'\\begin{{equation}}\n{content}\n\\end{{equation}}'
+        else:
+            if not content.startswith('\\begin{equation'):
+                content = f'\\begin{{equation}}\n{content}\n\\end{{equation}}'
+        content = REGEX_LATEX_LABEL.sub('', content)  # just remove the label and stick where it needs to go below:
+        content = content.replace(r'\begin{equation}', f'\\begin{{equation}}\n\\label{{{label}}}')
+        content = '\n'.join(line for line in content.splitlines() if line.strip())
+    elif section == 'literal':
+        content = f'\\begin{{verbatim}}\n{content}\n\\end{{verbatim}}'
+    elif section == 'code':
+        orig_lang = language = latex.lstlisting_supported(data['language'])
+        if not language:
+            language = 'C++'
+            LOGGER.warning('unsupported lstlisting %r, defaulting to %r', orig_lang, language)
+        # FIX: avoid printing squat-u '␣' character instead of spaces between strings - https://tex.stackexchange.com/a/54185
+        content = f'\\begin{{lstlisting}}[language={language}, caption={{{caption}}}, label={{{label}}}, showstringspaces=false]\n{content.strip()}\n\\end{{lstlisting}}'
+    elif section == 'table':
+        rows = markdown.table_to_rows(content)
+        content = latex.rows_to_latex(rows, caption=caption, label=label, aligned='left')
+    elif section == 'latex-inline':
+        # are there $latex$ in the content?
+        content = markdown.REGEX_MARKDOWN_LATEX_INLINE.sub(r'\\(\g<2>\\)', content)
+    elif section == 'literal-inline':
+        # are there `literal` in the content?
+        content = markdown.REGEX_MARKDOWN_LITERAL_INLINE.sub(r'\\lstinline{\g<1>}', content)
+    else:
+        # are there any URL's in the content?
+        for url_mo in reversed(list(REGEX_MARKDOWN_URL.finditer(content))):
+            url = url_mo.groups()[-1][:-1]  # lop off last )
+            content = f'{content[:url_mo.start()]}\\url{{{url}}}{content[url_mo.end():]}'
+        content = REGEX_MARKDOWN_URL.sub(r'\\url{\g<2>}', content)
+        # if postcontent != content:
+        #     content = postcontent
+        # are there any emphasis like bold, italic, underline, etc?
+        # TODO: underline/strikethrough
+        content = markdown_emphasis_to_latex(content)
+
+        if section == 'quote':
+            # TODO: currently sane washing all > beginnings
+            content = '\n'.join(f'\\begin{{quotation}}\n{line[line.rindex(">") + 1:].strip()}\n\\end{{quotation}}' for line in content.splitlines())
+        elif section == 'list':
+            postcontent = markdown_list_to_latex(content)
+            content = postcontent
+
+    # are there refs IN THE CONTENT?
+    if 'inline' in section:
+        pass
+    elif section in set(['code', 'literal', 'math']):
+        mo = REGEX_CITATION.search(content)
+        if mo:
+            possible_citation = mo.groupdict()['ref']
+            if possible_citation.lower() in labels:
+                lineno = list(find_lineno_index(content[mo.start():mo.end()].strip(), original_md_content))[0][0]
+                errors.append(f'illegal citation placement in {section!r} at "{md_relpath}", lineno {lineno}!')
+    else:
+        content = markdown_refs_to_latex(content, original_md_content, labels, errors, template=template)
+    if section in set(['any']):
+        content = latex.latex_escape(content)
+
+    # final uinversal fixes
+    content = unicode_replace(content)
+    content = latex.latex_replace(content)
+    if content.count('\n') > 1:
+        content = dedent(content).strip()
+    content = re.sub(r'(\d)+\%', r'\g<1>\\%', content)  # individual percentages
+
+    if section in set(['latex', 'list', 'header', 'code', 'table', 'quote']):
+        content = f'\n\n{content}\n\n'
+    elif 'inline' in section:
+        content = f' {content} '
+
+    return content, appendix, starts_appendix, errors, warnings
+
+
+def doclets_to_latex(doclets, md_filepath, bibliography_output_filepath, labels, template, cache=None):
+    # type: (List[MarkdownDoclet], str, str, Dict[str, Dict[str, str]], str, Optional[DocletCache]) -> Tuple[Dict[str, str], Dict[str, str], List[str], List[str]]
     '''
     Description:
         doclets to latexified body and appendix body
+        with a cache, doclets that rendered cleanly last time with the same inputs are not rendered again
     Returns
         Tuple[Dict[str, str], Dict[str, str], List[str], List[str]]
             headers, renders, errors, warnings
@@ -473,10 +887,9 @@ def doclets_to_latex(doclets, md_filepath, bibliography_output_filepath, labels,
     appendix = False
     append_appendix = False
     for doclet in doclets:
-        section, content, label, caption, data = (doclet.section, doclet.content, doclet.label, doclet.caption, doclet.data)
-        if section in set(['yaml']):
+        if doclet.section in set(['yaml']):
             if not headers:
-                headers, renders = markdown_header_to_render_dict(content, bibliography_output_filepath, template=template)
+                headers, renders = markdown_header_to_render_dict(doclet.content, bibliography_output_filepath, template=template)
                 template = headers.get('template', template)  # gets overriden if default
                 headers['template'] = template
             else:
@@ -484,127 +897,20 @@ def doclets_to_latex(doclets, md_filepath, bibliography_output_filepath, labels,
                 warnings.append(f'multiple yamls detected at "{md_relpath}", lineno {lineno}! NOT PROCESSING AS HEADER')
             continue
 
-        if doclet.appendix is True:
-            appendix = True
-
-        if caption:
-            # are there refs IN THE CAPTION?
-            caption = markdown_refs_to_latex(caption, original_md_content, labels, errors, template=template)
-
-        # TODO: auto Fig. Table. Code. etc.
-        if section in set(['comment']):
-            # WARNING: strip the content of latex otherwise biber doesnt fking work...
-            _, content = bibtex.extract_from_and_remove(content)
-            content = '\n'.join(f'% {line}' for line in content.splitlines())
-        elif section == 'header':
-            MD_HEADER_TO_LATEX = {
-                '#': '\\section',
-                '##': '\\subsection',
-                '###': '\\subsubsection',
-                '####': '\\paragraph',
-            }
-            title = data['title']
-            octothorps = data['octothorps']
-            if appendix:
-                content = f'\\newpage\n\\appendix\n\\label{{appendix}}'  # NOTE: NOT a usual title
-                # TODO: only works on the book / report class...
-                # if appendix:
-                #     replacement = f'\\chapter{{{title}}}\\label{{href-{anchor}}}'
-                appendix = False  # turn off
-                append_appendix = True
-            else:
-                content = f'{MD_HEADER_TO_LATEX[octothorps]}{{{title}}}\\label{{{label}}}'
-        elif section == 'img':
-            IMG_REPLACEMENT = r'''
-            \begin{figure}[htbp]
-                \centerline{\includegraphics[width=<WIDTH>]{<PATH>}}
-                \caption{<ALT>}
-                \label{<LABEL>}
-            \end{figure}
-            '''
-            path = data['path']
-            replacement = IMG_REPLACEMENT.replace('<PATH>', path).replace('<ALT>', caption).replace('<LABEL>', label)
-            if template == 'ieee':
-                replacement = replacement.replace('<WIDTH>', '\\linewidth')
-            else:
-                replacement = replacement.replace('<WIDTH>', '0.66\\linewidth')
-            content = replacement
-        elif section == 'latex':
-            content = dedent(content).strip()  # NOTE: the .strip() is CRITICAL. if you have \begin{math}\n\n\begin{aligned} you're TOAST
-            aligned = content.startswith('\\begin{align')
-            if aligned:
-                # convert it to an equation anyway. regardless if sense or not. \begin{math}\end{math} aint working
-                content = f'\\begin{{equation}}\n{content}\n\\end{{equation}}'
-            else:
-                if not content.startswith('\\begin{equation'):
-                    content = f'\\begin{{equation}}\n{content}\n\\end{{equation}}'
-            content = REGEX_LATEX_LABEL.sub('', content)  # just remove the label and stick where it needs to go below:
-            content = content.replace(r'\begin{equation}', f'\\begin{{equation}}\n\\label{{{label}}}')
-            content = '\n'.join(line for line in content.splitlines() if line.strip())
-        elif section == 'literal':
-            content = f'\\begin{{verbatim}}\n{content}\n\\end{{verbatim}}'
-        elif section == 'code':
-            orig_lang = language = latex.lstlisting_supported(data['language'])
-            if not language:
-                language = 'C++'
-                LOGGER.warning('unsupported lstlisting %r, defaulting to %r', orig_lang, language)
-            # FIX: avoid printing squat-u '␣' character instead of spaces between strings - https://tex.stackexchange.com/a/54185
-            content = f'\\begin{{lstlisting}}[language={language}, caption={{{caption}}}, label={{{label}}}, showstringspaces=false]\n{content.strip()}\n\\end{{lstlisting}}'
-        elif section == 'table':
-            rows = markdown.table_to_rows(content)
-            content = latex.rows_to_latex(rows, caption=caption, label=label, aligned='left')
-        elif section == 'latex-inline':
-            # are there $latex$ in the content?
-            content = markdown.REGEX_MARKDOWN_LATEX_INLINE.sub(r'\\(\g<2>\\)', content)
-        elif section == 'literal-inline':
-            # are there `literal` in the content?
-            content = markdown.REGEX_MARKDOWN_LITERAL_INLINE.sub(r'\\lstinline{\g<1>}', content)
+        key = cache.key(doclet, labels, template, appendix) if cache is not None else ''
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            content, appendix, starts_appendix = cached
         else:
-            # are there any URL's in the content?
-            for url_mo in reversed(list(REGEX_MARKDOWN_URL.finditer(content))):
-                url = url_mo.groups()[-1][:-1]  # lop off last )
-                content = f'{content[:url_mo.start()]}\\url{{{url}}}{content[url_mo.end():]}'
-            content = REGEX_MARKDOWN_URL.sub(r'\\url{\g<2>}', content)
-            # if postcontent != content:
-            #     content = postcontent
-            # are there any emphasis like bold, italic, underline, etc?
-            # TODO: underline/strikethrough
-            content = markdown_emphasis_to_latex(content)
-
-            if section == 'quote':
-                # TODO: currently sane washing all > beginnings
-                content = '\n'.join(f'\\begin{{quotation}}\n{line[line.rindex(">") + 1:].strip()}\n\\end{{quotation}}' for line in content.splitlines())
-            elif section == 'list':
-                postcontent = markdown_list_to_latex(content)
-                content = postcontent
-
-        # are there refs IN THE CONTENT?
-        if 'inline' in section:
-            pass
-        elif section in set(['code', 'literal', 'math']):
-            mo = REGEX_CITATION.search(content)
-            if mo:
-                possible_citation = mo.groupdict()['ref']
-                if possible_citation.lower() in labels:
-                    lineno = list(find_lineno_index(content[mo.start():mo.end()].strip(), original_md_content))[0][0]
-                    errors.append(f'illegal citation placement in {section!r} at "{md_relpath}", lineno {lineno}!')
-        else:
-            content = markdown_refs_to_latex(content, original_md_content, labels, errors, template=template)
-        if section in set(['any']):
-            content = latex.latex_escape(content)
-
-        # final uinversal fixes
-        content = unicode_replace(content)
-        content = latex.latex_replace(content)
-        content.count('\n')
-        if content.count('\n') > 1:
-            content = dedent(content).strip()
-        content = re.sub(r'(\d)+\%', r'\g<1>\\%', content)  # individual percentages
-
-        if section in set(['latex', 'list', 'header', 'code', 'table', 'quote']):
-            content = f'\n\n{content}\n\n'
-        elif 'inline' in section:
-            content = f' {content} '
+            content, appendix, starts_appendix, doclet_errors, doclet_warnings = doclet_to_latex(
+                doclet, labels, template, appendix, original_md_content, md_relpath
+            )
+            errors.extend(doclet_errors)
+            warnings.extend(doclet_warnings)
+            if cache is not None and not doclet_errors and not doclet_warnings:
+                cache.put(key, content, appendix, starts_appendix)
+        append_appendix = append_appendix or starts_appendix
+
         if append_appendix:
             appendix_body.append(content)
         else:
@@ -618,6 +924,8 @@ def doclets_to_latex(doclets, md_filepath, bibliography_output_filepath, labels,
 
 def markdown_header_to_render_dict(text, bibliography_filepath, template):
     # type: (str, str, str) -> Tuple[Dict[str, str], Dict[str, str]]
+    import yaml
+
     bibliography_filepath = os.path.basename(bibliography_filepath).replace('\\', '/')
 
     headers = yaml.load(text, Loader=yaml.Loader)
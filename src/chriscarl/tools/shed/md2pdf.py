@@ -10,6 +10,7 @@ tools.shed.md2pdf is functions that actually takes Markdown and converts it to a
 tool are modules that define usually cli tools or mini applets that I or other people may find interesting or useful.
 
 Updates:
+    2026-10-17 - tools.shed.md2pdf - added resolve_markdown_filepaths, batch_output_dirpaths, and BatchResult for md2pdf-batch
     2026-02-06 - tools.shed.md2pdf - initial commit
 '''
 
@@ -18,10 +19,14 @@ from __future__ import absolute_import, print_function, division, with_statement
 import os
 import sys
 import logging
+import glob
+from typing import List, Tuple
+from dataclasses import dataclass, field
 
 # third party imports
 
 # project imports
+from chriscarl.core.lib.stdlib.os import abspath, is_file, filename
 
 SCRIPT_RELPATH = 'chriscarl/tools/shed/md2pdf.py'
 if not hasattr(sys, '_MEIPASS'):
@@ -33,3 +38,66 @@ SCRIPT_NAME = os.path.splitext(os.path.basename(__file__))[0]
 THIS_MODULE = sys.modules[__name__]
 LOGGER = logging.getLogger(__name__)
 LOGGER.addHandler(logging.NullHandler())
+
+
+def resolve_markdown_filepaths(paths):
+    # type: (List[str]) -> List[str]
+    '''
+    Description:
+        files as-is, directories walked for .md (skipping hidden dirs), anything else is a glob (** works)
+        duplicates are dropped, order is kept
+    '''
+    filepaths = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames[:] = sorted(dirname for dirname in dirnames if not dirname.startswith('.'))
+                filepaths.extend(os.path.join(dirpath, ele) for ele in sorted(filenames) if ele.lower().endswith('.md'))
+        elif is_file(path):
+            filepaths.append(path)
+        else:
+            matches = sorted(ele for ele in glob.glob(path, recursive=True) if is_file(ele))
+            if not matches:
+                LOGGER.warning('nothing matches "%s"', path)
+            filepaths.extend(matches)
+    return list(dict.fromkeys(abspath(ele) for ele in filepaths))
+
+
+def batch_output_dirpaths(md_filepaths, output_dirpath=''):
+    # type: (List[str], str) -> List[str]
+    '''
+    Description:
+        every document gets a directory of its own so concurrent pdflatex runs never share work files,
+        the tree under output_dirpath mirrors the inputs relative to their common directory
+    Arguments:
+        md_filepaths: List[str]
+        output_dirpath: str
+            defaults to the common directory of the inputs
+    Returns:
+        List[str]
+            <output_dirpath>/<relative dir>/<md filename>
+    '''
+    if not md_filepaths:
+        return []
+    common_dirpath = os.path.commonpath([os.path.dirname(abspath(ele)) for ele in md_filepaths])
+    output_dirpath = abspath(output_dirpath or common_dirpath)
+    return [
+        abspath(output_dirpath, os.path.relpath(os.path.dirname(abspath(ele)), common_dirpath), filename(ele)) for ele in md_filepaths
+    ]
+
+
+@dataclass
+class BatchResult:
+    '''
+    one document through md2pdf-batch, the phase outputs are filled in as the phases finish
+    '''
+    md_filepath: str
+    output_dirpath: str
+    template: str = ''
+    bibliography_filepath: str = ''
+    tex_filepath: str = ''
+    pdf_filepath: str = ''
+    download_url_filepaths: List[Tuple[str, str]] = field(default_factory=lambda: [])
+    latex_elapsed: float = 0.0
+    pdf_elapsed: float = 0.0
+    error: str = ''
@@ -10,6 +10,13 @@ tools.shed.tex2pdf is functions that takes LaTeX and converts them to PDF
 tool are modules that define usually cli tools or mini applets that I or other people may find interesting or useful.
 
 Updates:
+    2026-10-17 - tools.shed.tex2pdf - FIX: -fmt passes run in pdflatex's default interaction mode instead of the batchmode the format was dumped in
+                                      FIX: a failed preamble precompile is retried after FMT_FAILED_TTL, skipping it is a warning
+    2026-10-17 - tools.shed.tex2pdf - the static preamble before \csname endofdump\endcsname is precompiled into a cached mylatexformat .fmt that pdflatex loads instead
+    2026-10-17 - tools.shed.tex2pdf - biber/bibtex is skipped and the .bbl reused when the .bib and the citations in the .aux havent changed
+    2026-10-17 - tools.shed.tex2pdf - added prepare_build_dirpath and sync_build_dirpath so aux files can live across builds
+    2026-10-17 - tools.shed.tex2pdf - pdflatex reruns only until the .log, .aux, .toc, .lof, .lot say its converged instead of a fixed 4-pass chain
+    2026-10-17 - tools.shed.tex2pdf - added build manifests so an unchanged build can skip pdflatex entirely
     2026-08-19 - tools.shed.tex2pdf - amazing what some distance will do to your understanding of your own codebase. added 2 passes of pdf2latex to deal with ??
     2026-04-03 - tools.shed.tex2pdf - if no bibliography contents, dont bother rendering...
     2026-02-06 - tools.shed.tex2pdf - initial commit
@@ -27,12 +34,19 @@ import logging
 import subprocess
 import tempfile
 import time
+import shutil
+import re
+import json
+import hashlib
+import functools
+from typing import Dict, List, Optional
 
 # third party imports
 
 # project imports
+from chriscarl.core.constants import TEMP_DIRPATH
 from chriscarl.core.lib.stdlib.os import abspath, is_file
-from chriscarl.core.lib.stdlib.io import read_text_file
+from chriscarl.core.lib.stdlib.io import read_text_file, write_text_file
 from chriscarl.core.lib.stdlib.subprocess import kill
 from chriscarl.tools.shed import md2latex
 
@@ -48,12 +62,308 @@ LOGGER = logging.getLogger(__name__)
 LOGGER.addHandler(logging.NullHandler())
 
 BIG_BAD = '¿'
+MANIFEST_VERSION = 1
 
 
-def run_pdflatex(md_filename, output_dirpath, template):
-    # run pdflatex 4 times...
-    LOGGER.debug('deleting previous work files...')
-    md2latex.delete_latex_work_files(output_dirpath, md_filename)
+def md5_file(filepath):
+    # type: (str) -> str
+    with open(filepath, 'rb') as rb:
+        return hashlib.md5(rb.read()).hexdigest()
+
+
+def build_inputs(md_filename, output_dirpath, template, extra_filepaths=None):
+    # type: (str, str, str, Optional[List[str]]) -> Dict[str, str]
+    '''
+    Description:
+        everything the pdf step reads, the .tex, the .bib, downloaded and copied assets, and the template (which picks biber or bibtex)
+    Returns:
+        Dict[str, str]
+            {name: md5 or value}
+    '''
+    inputs = {'version': str(MANIFEST_VERSION), 'template': template}
+    filepaths = [abspath(output_dirpath, f'{md_filename}.tex'), abspath(output_dirpath, f'{md_filename}.bib')] + list(extra_filepaths or [])
+    for filepath in filepaths:
+        name = os.path.relpath(filepath, output_dirpath).replace('\\', '/')
+        inputs[name] = md5_file(filepath) if is_file(filepath) else ''
+    return inputs
+
+
+def is_build_current(manifest_filepath, inputs, pdf_filepath):
+    # type: (str, Dict[str, str], str) -> bool
+    '''
+    Description:
+        the last build had exactly these inputs and the pdf it made is still there, untouched
+    '''
+    if not is_file(manifest_filepath) or not is_file(pdf_filepath):
+        return False
+    try:
+        manifest = json.loads(read_text_file(manifest_filepath))
+    except (OSError, ValueError) as ex:
+        LOGGER.debug('ignoring unreadable manifest "%s": %s', manifest_filepath, ex)
+        return False
+    return manifest.get('inputs') == inputs and manifest.get('pdf') == md5_file(pdf_filepath)
+
+
+def save_manifest(manifest_filepath, inputs, pdf_filepath):
+    # type: (str, Dict[str, str], str) -> None
+    write_text_file(manifest_filepath, json.dumps({'inputs': inputs, 'pdf': md5_file(pdf_filepath)}, indent=2, sort_keys=True))
+    LOGGER.debug('wrote "%s"', manifest_filepath)
+
+
+REGEX_RERUN = re.compile(r'(Rerun to get|Label\(s\) may have changed|Citation\(s\) may have changed|Please rerun LaTeX|Rerun LaTeX)')
+REGEX_UNDEFINED = re.compile(r'There were undefined (references|citations)')
+REGEX_AUX_CITATION = re.compile(r'\\citation\{|\\abx@aux@cite\{')
+# everything in the .aux that biber/bibtex reads, in order, since numbered styles number by first citation
+REGEX_AUX_BIBLIOGRAPHY = re.compile(r'^\\(?:citation|bibdata|bibstyle|abx@aux@cite)\{.*$', flags=re.MULTILINE)
+CONVERGENCE_EXTS = ['.aux', '.toc', '.lof', '.lot']
+MAX_PDFLATEX_PASSES = 5
+DEFAULT_TIMEOUT = 60
+# mylatexformat dumps the preamble up to here, and when the format is loaded, skips it. plain pdflatex sees \relax.
+FMT_MARKER = r'\csname endofdump\endcsname'
+FMT_VERSION = 2
+DEFAULT_FMT_DIRPATH = abspath(TEMP_DIRPATH, 'tools.tex2pdf.fmt')
+# a failure can be the environment (mylatexformat not installed yet, a cold tex tree timing out, a full disk), try again after this long
+FMT_FAILED_TTL = 60 * 60
+# a format restores the interaction mode it was dumped in unless told otherwise, this is what plain pdflatex runs in
+PDFLATEX_INTERACTION = 'errorstopmode'
+
+
+def run_cmd(cmd, output_dirpath, timeout=DEFAULT_TIMEOUT):
+    # type: (List[str], str, float) -> None
+    '''run a latex toolchain command in the output dir, sys.exit with its output on failure'''
+    pid = -1
+    fd, stdout = tempfile.mkstemp()
+    os.close(fd)
+    try:
+        LOGGER.info('%s', subprocess.list2cmdline(cmd))
+        with open(stdout, 'w', encoding='utf-8') as w:
+            p = subprocess.Popen(cmd, cwd=output_dirpath, stdout=w, stderr=w, universal_newlines=True)
+            pid = p.pid
+            res = p.wait(timeout=timeout)  # NOTE: biber can actually take like 20 seconds or so
+        if res != 0:
+            with open(stdout, 'r', encoding='utf-8') as r:
+                print(r.read())
+            LOGGER.error('%s, ERROR!', subprocess.list2cmdline(cmd))
+            sys.exit(res)
+    except subprocess.TimeoutExpired:
+        kill(pid)
+        LOGGER.error('%s, TIMEOUT %0.2f sec!\n%s', subprocess.list2cmdline(cmd), timeout, read_text_file(stdout))
+        sys.exit(2)
+    finally:
+        time.sleep(0.1)
+        os.remove(stdout)
+
+
+def convergence_hashes(output_dirpath, md_filename):
+    # type: (str, str) -> Dict[str, str]
+    hashes = {}
+    for ext in CONVERGENCE_EXTS:
+        filepath = abspath(output_dirpath, f'{md_filename}{ext}')
+        hashes[ext] = md5_file(filepath) if is_file(filepath) else ''
+    return hashes
+
+
+def needs_rerun(output_dirpath, md_filename, before):
+    # type: (str, str, Dict[str, str]) -> str
+    '''
+    Description:
+        after a pdflatex pass, would another pass change anything?
+        yes if latex says so, if the toc/lof/lot it just wrote differ from what it read,
+        or if references were undefined and the .aux they come from changed.
+    Arguments:
+        before: Dict[str, str]
+            convergence_hashes from right before the pass
+    Returns:
+        str
+            why another pass is needed, empty if it isnt
+    '''
+    after = convergence_hashes(output_dirpath, md_filename)
+    log_filepath = abspath(output_dirpath, f'{md_filename}.log')
+    log = ''
+    if is_file(log_filepath):
+        with open(log_filepath, 'r', encoding='utf-8', errors='replace') as r:  # NOTE: pdflatex logs arent always utf-8
+            log = r.read()
+    mo = REGEX_RERUN.search(log)
+    if mo:
+        return f'latex says {mo.group(0)!r}'
+    changed = [ext for ext in CONVERGENCE_EXTS if ext != '.aux' and before[ext] != after[ext]]
+    if changed:
+        return f'{", ".join(changed)} changed'
+    if before['.aux'] != after['.aux'] and REGEX_UNDEFINED.search(log):
+        return 'undefined references and the .aux changed'
+    return ''
+
+
+def prepare_build_dirpath(build_dirpath, template, clean=False):
+    # type: (str, str, bool) -> bool
+    '''
+    Description:
+        a build dir keeps .aux, .bbl, .bcf, .toc between builds so the next one converges in a pass.
+        its wiped when asked to or when the template changes, a different preamble makes the old aux files poison.
+    Returns:
+        bool
+            True if it was wiped
+    '''
+    template_filepath = abspath(build_dirpath, '.template')
+    wipe = clean
+    if not wipe and is_file(template_filepath) and read_text_file(template_filepath) != template:
+        LOGGER.info('template changed to %r, cleaning "%s"', template, build_dirpath)
+        wipe = True
+    if wipe and os.path.isdir(build_dirpath):
+        shutil.rmtree(build_dirpath)
+    os.makedirs(build_dirpath, exist_ok=True)
+    write_text_file(template_filepath, template)
+    return wipe
+
+
+def sync_build_dirpath(filepaths, source_dirpath, build_dirpath):
+    # type: (List[str], str, str) -> List[str]
+    '''
+    Description:
+        copy the inputs into the build dir, keeping their path relative to source_dirpath, skipping identical ones
+    Returns:
+        List[str]
+            files that were copied
+    '''
+    copied = []
+    for filepath in filepaths:
+        if not is_file(filepath):
+            continue
+        build_filepath = abspath(build_dirpath, os.path.relpath(filepath, source_dirpath))
+        if is_file(build_filepath) and md5_file(build_filepath) == md5_file(filepath):
+            continue
+        os.makedirs(os.path.dirname(build_filepath), exist_ok=True)
+        shutil.copy2(filepath, build_filepath)
+        copied.append(build_filepath)
+    return copied
+
+
+@functools.lru_cache(maxsize=None)
+def pdflatex_version():
+    # type: () -> str
+    '''a format only loads in the exact pdflatex that dumped it, so the version is part of its key'''
+    try:
+        proc = subprocess.run(['pdflatex', '--version'], capture_output=True, text=True, timeout=DEFAULT_TIMEOUT, check=False)
+    except (OSError, subprocess.TimeoutExpired):
+        return ''
+    return (proc.stdout.splitlines() or [''])[0]
+
+
+def format_name(preamble):
+    # type: (str) -> str
+    '''what build_format calls the .fmt (and its .failed) for this preamble'''
+    digest = hashlib.md5(json.dumps([FMT_VERSION, pdflatex_version(), preamble]).encode('utf-8')).hexdigest()
+    return f'preamble-{digest}'
+
+
+def build_format(tex_filepath, fmt_dirpath=DEFAULT_FMT_DIRPATH, timeout=DEFAULT_TIMEOUT):
+    # type: (str, str, float) -> str
+    '''
+    Description:
+        precompile everything in the .tex before FMT_MARKER (the template's package stack) into a mylatexformat .fmt.
+        formats are keyed by the preamble itself, so a template only gets dumped again when the template changes,
+        and templates that share a file (chicago, math) share a format.
+    Arguments:
+        tex_filepath: str
+        fmt_dirpath: str
+            where formats are cached across documents and builds
+    Returns:
+        str
+            the .fmt filepath, or '' if the .tex has no marker or the format couldnt be built
+    '''
+    content = read_text_file(tex_filepath)
+    index = content.find(FMT_MARKER)
+    if index == -1:
+        LOGGER.debug('no %r in "%s", nothing to precompile', FMT_MARKER, tex_filepath)
+        return ''
+    preamble = content[:index]
+    name = format_name(preamble)
+    fmt_filepath = abspath(fmt_dirpath, f'{name}.fmt')
+    failed_filepath = abspath(fmt_dirpath, f'{name}.failed')
+    if is_file(fmt_filepath):
+        return fmt_filepath
+    if is_file(failed_filepath):
+        age = time.time() - os.path.getmtime(failed_filepath)
+        if age < FMT_FAILED_TTL:
+            LOGGER.warning(
+                'not precompiling the preamble, it failed %d min ago, pdflatex will load it every pass until a retry in %d min, see "%s"',
+                age // 60, (FMT_FAILED_TTL - age) // 60 + 1, failed_filepath
+            )
+            return ''
+        LOGGER.info('retrying the preamble that failed to precompile %d min ago', age // 60)
+
+    LOGGER.info('precompiling the preamble into "%s"', fmt_filepath)
+    os.makedirs(fmt_dirpath, exist_ok=True)
+    # NOTE: build off to the side and move it in, concurrent builds of the same preamble shouldnt see half a format
+    work_dirpath = tempfile.mkdtemp(dir=fmt_dirpath)
+    try:
+        write_text_file(abspath(work_dirpath, f'{name}.tex'), f'{preamble}\n\\begin{{document}}\n\\end{{document}}\n')
+        # NOTE: nonstopmode so a broken preamble cant sit waiting on a terminal, pdflatex_cmd overrides it when the format is loaded
+        cmd = ['pdflatex', '-ini', '-interaction=nonstopmode', f'-jobname={name}', '&pdflatex', 'mylatexformat.ltx', f'{name}.tex']
+        try:
+            proc = subprocess.run(cmd, cwd=work_dirpath, capture_output=True, text=True, timeout=timeout, check=False)
+            returncode, output = proc.returncode, proc.stdout
+        except (OSError, subprocess.TimeoutExpired) as exe:
+            returncode, output = -1, str(exe)
+        work_fmt_filepath = abspath(work_dirpath, f'{name}.fmt')
+        if returncode != 0 or not is_file(work_fmt_filepath):
+            log_filepath = abspath(work_dirpath, f'{name}.log')
+            write_text_file(failed_filepath, read_text_file(log_filepath) if is_file(log_filepath) else output)
+            LOGGER.warning('couldnt precompile the preamble, pdflatex will load it every pass, see "%s"', failed_filepath)
+            return ''
+        os.replace(work_fmt_filepath, fmt_filepath)
+        if is_file(failed_filepath):
+            os.remove(failed_filepath)
+    finally:
+        shutil.rmtree(work_dirpath, ignore_errors=True)
+    return fmt_filepath
+
+
+def pdflatex_cmd(md_filename, fmt=False):
+    # type: (str, bool) -> List[str]
+    '''
+    Description:
+        one pdflatex pass, with fmt it loads {md_filename}.fmt.
+        the interaction mode is spelled out for the format so a failing pass prints the same diagnostics as a plain one.
+    '''
+    if not fmt:
+        return ['pdflatex', md_filename]
+    return ['pdflatex', f'-interaction={PDFLATEX_INTERACTION}', f'-fmt={md_filename}', md_filename]
+
+
+def bibliography_stamp(md_filename, output_dirpath, bibtex_cmd):
+    # type: (str, str, str) -> str
+    '''
+    Description:
+        md5 of everything the bibliography tool would read: the .bib, the citation lines of the .aux, and the .bcf biblatex writes for biber.
+        same stamp, same .bbl.
+    '''
+    aux_content = read_text_file(abspath(output_dirpath, f'{md_filename}.aux'))
+    aux_lines = list(dict.fromkeys(mo.group(0) for mo in REGEX_AUX_BIBLIOGRAPHY.finditer(aux_content)))
+    inputs = [bibtex_cmd, aux_lines]
+    for ext in ['.bib', '.bcf']:
+        filepath = abspath(output_dirpath, f'{md_filename}{ext}')
+        inputs.append(md5_file(filepath) if is_file(filepath) else '')
+    return hashlib.md5(json.dumps(inputs).encode('utf-8')).hexdigest()
+
+
+def run_pdflatex(md_filename, output_dirpath, template, clean=True, fmt=True):
+    # type: (str, str, str, bool, bool) -> int
+    '''
+    Description:
+        pdflatex until the document converges, with the bibliography tool in between if anything is cited
+    Arguments:
+        clean: bool
+            delete the work files first, leave them when they come from a previous build worth reusing
+        fmt: bool
+            load the precompiled preamble from build_format if the .tex has one
+    Returns:
+        int
+            how many pdflatex passes it took
+    '''
+    if clean:
+        LOGGER.debug('deleting previous work files...')
+        md2latex.delete_latex_work_files(output_dirpath, md_filename)
 
     if template == 'ieee':
         bibtex_cmd = 'bibtex'
@@ -64,43 +374,47 @@ def run_pdflatex(md_filename, output_dirpath, template):
     bibtex_filepath = abspath(output_dirpath, f'{md_filename}.bib')
     if is_file(bibtex_filepath):
         bibtex_contents = read_text_file(bibtex_filepath).strip()
+
+    cmd = pdflatex_cmd(md_filename)
+    fmt_filepath = build_format(abspath(output_dirpath, f'{md_filename}.tex')) if fmt else ''
+    if fmt_filepath:
+        # NOTE: formats are found like any other tex input, so a copy next to the .tex is the portable way to point at one
+        local_fmt_filepath = abspath(output_dirpath, f'{md_filename}.fmt')
+        if not is_file(local_fmt_filepath) or os.path.getmtime(local_fmt_filepath) != os.path.getmtime(fmt_filepath):
+            shutil.copy2(fmt_filepath, local_fmt_filepath)
+        cmd = pdflatex_cmd(md_filename, fmt=True)
+
+    passes = 1
+    before = convergence_hashes(output_dirpath, md_filename)
+    run_cmd(cmd, output_dirpath)
+    reason = needs_rerun(output_dirpath, md_filename, before)
+
+    aux_filepath = abspath(output_dirpath, f'{md_filename}.aux')
     if not bibtex_contents:
-        LOGGER.info('no bibliographical content detected, skipping the 4x commands')
-        cmds = [
-            ['pdflatex', md_filename],
-            ['pdflatex', md_filename],  # to catch ?? with figures and such
-        ]
+        LOGGER.info('no bibliographical content detected, skipping %r', bibtex_cmd)
+    elif not is_file(aux_filepath) or not REGEX_AUX_CITATION.search(read_text_file(aux_filepath)):
+        LOGGER.info('nothing cited, skipping %r', bibtex_cmd)
     else:
-        cmds = [
-            # ['latexmk', '-C'],  # clean all aux files
-            ['pdflatex', md_filename],
-            [bibtex_cmd, md_filename],
-            ['pdflatex', md_filename],
-            ['pdflatex', md_filename],
-        ]
-    timeout = 60
-    for c, cmd in enumerate(cmds):
-        pid = -1
-        fd, stdout = tempfile.mkstemp()
-        os.close(fd)
-        try:
-            LOGGER.info('%d / %d - %s', c + 1, len(cmds), subprocess.list2cmdline(cmd))
-            with open(stdout, 'w', encoding='utf-8') as w:
-                p = subprocess.Popen(cmd, cwd=output_dirpath, stdout=w, stderr=w, universal_newlines=True)
-                pid = p.pid
-                res = p.wait(timeout=timeout)  # NOTE: biber can actually take like 20 seconds or so
-            if res != 0:
-                with open(stdout, 'r', encoding='utf-8') as r:
-                    print(r.read())
-                LOGGER.error('%d / %d - %s, ERROR!', c + 1, len(cmds), subprocess.list2cmdline(cmd))
-                sys.exit(res)
-        except subprocess.TimeoutExpired:
-            kill(pid)
-            LOGGER.error('%d / %d - %s, TIMEOUT %0.2f sec!\n%s', c + 1, len(cmds), subprocess.list2cmdline(cmd), timeout, read_text_file(stdout))
-            sys.exit(2)
-        finally:
-            time.sleep(0.1)
-            os.remove(stdout)
+        bbl_filepath = abspath(output_dirpath, f'{md_filename}.bbl')
+        stamp_filepath = abspath(output_dirpath, f'{md_filename}.bbl.md5')
+        stamp = bibliography_stamp(md_filename, output_dirpath, bibtex_cmd)
+        if is_file(bbl_filepath) and is_file(stamp_filepath) and read_text_file(stamp_filepath) == stamp:
+            LOGGER.info('citations and .bib unchanged, reusing the .bbl instead of %r', bibtex_cmd)
+        else:
+            run_cmd([bibtex_cmd, md_filename], output_dirpath)
+            write_text_file(stamp_filepath, stamp)
+            reason = 'the bibliography was rebuilt'
+
+    while reason and passes < MAX_PDFLATEX_PASSES:
+        LOGGER.info('pdflatex again, %s', reason)
+        passes += 1
+        before = convergence_hashes(output_dirpath, md_filename)
+        run_cmd(cmd, output_dirpath)
+        reason = needs_rerun(output_dirpath, md_filename, before)
+    if reason:
+        LOGGER.warning('gave up after %d pdflatex passes, %s', passes, reason)
+    else:
+        LOGGER.info('converged after %d pdflatex passes', passes)
 
     # from chriscarl.core.lib.stdlib.os import abspath
     # from chriscarl.core.lib.stdlib.io import read_text_file_try
@@ -112,3 +426,5 @@ def run_pdflatex(md_filename, output_dirpath, template):
     #         LOGGER.error('%r detected, %d instances! Perhaps bad references?', BIG_BAD, instances)
     # except Exception:
     #     pass
+
+    return passes
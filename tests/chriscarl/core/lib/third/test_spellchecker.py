@@ -9,6 +9,11 @@ Description:
 chriscarl.core.lib.third.spellchecker unit test.
 
 Updates:
+    2026-10-17 - tests.chriscarl.core.lib.third.spellchecker - merged chunk spellchecks
+    2026-10-17 - tests.chriscarl.core.lib.third.spellchecker - compiled dictionary
+    2026-10-17 - tests.chriscarl.core.lib.third.spellchecker - correction cache
+    2026-10-17 - tests.chriscarl.core.lib.third.spellchecker - shared spell checker
+    2026-10-17 - tests.chriscarl.core.lib.third.spellchecker - mask_dictionary_words and benchmark against the regex per word
     2026-01-25 - tests.chriscarl.core.lib.third.spellchecker - initial commit
 '''
 
@@ -18,6 +23,9 @@ import os
 import sys
 import logging
 import unittest
+import time
+import re
+import concurrent.futures
 
 # third party imports
 
@@ -25,6 +33,7 @@ import unittest
 from chriscarl.core import constants
 from chriscarl.core.lib.stdlib.os import abspath
 from chriscarl.core.lib.stdlib.unittest import UnitTest
+from chriscarl.core.lib.stdlib.io import write_text_file
 
 # test imports
 import chriscarl.core.lib.third.spellchecker as lib
@@ -92,6 +101,144 @@ Aliens from the planet Thessia were the last to ehscape.
         ]
         self.assert_null_hypothesis(variables, controls)
 
+    def test_case_2(self):
+        trie = lib.build_dictionary_trie(['edu', 'wi-fi', 'du bois', 'alt', 'alt-right', "d'être", '"others"', 'fig'])
+        variables = [
+            (lib.mask_dictionary_words, ('EDU is not in scheduled, edu is.', trie)),
+            (lib.mask_dictionary_words, ('Wi-Fi, wi fi, WiFi', trie)),
+            (lib.mask_dictionary_words, ('W.E.B. Du Bois and Du  Bois\nDu\nBois', trie)),
+            (lib.mask_dictionary_words, ('the alt-right and the alt text', trie)),
+            (lib.mask_dictionary_words, ("raison d'être, see Fig. 2 for others", trie)),
+        ]
+        controls = [
+            ' is not in scheduled,  is.',
+            ', wi fi, WiFi',
+            'W.E.B.  and Du  Bois\nDu\nBois',
+            'the  and the  text',
+            'raison , see . 2 for ',
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_3(self):
+        # the loop mask_dictionary_words replaced, a regex over the whole document per dictionary word
+        def regex_per_word(content, words):
+            low_content = content.lower()
+            for word in words:
+                for mo in reversed(list(re.finditer(r'\b' + re.escape(word) + r'\b', low_content))):
+                    start, end = mo.start(), mo.end()
+                    low_content = f'{low_content[:start]}{low_content[end:]}'
+                    content = f'{content[:start]}{content[end:]}'
+            return content
+
+        timings = {}
+        for n_words, n_lines in [(100, 200), (1000, 200), (100, 1000), (1000, 1000)]:
+            words = [f'jargon{w}' for w in range(n_words)]
+            content = ''.join(f'Line {l} has Jargon{l % (n_words * 2)} and plain words in it.\n' for l in range(n_lines))
+            start = time.perf_counter()
+            expected = regex_per_word(content, words)
+            regex_time = time.perf_counter() - start
+            start = time.perf_counter()
+            masked = lib.mask_dictionary_words(content, lib.build_dictionary_trie(words))
+            trie_time = time.perf_counter() - start
+            LOGGER.info('%d words x %d lines: regex %0.4f sec, trie %0.4f sec', n_words, n_lines, regex_time, trie_time)
+            self.assertEqual(masked, expected)
+            timings[(n_words, n_lines)] = (regex_time, trie_time)
+        self.assertLess(timings[(1000, 1000)][1], timings[(1000, 1000)][0])
+
+    def test_case_4(self):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            spells = list(executor.map(lambda _: lib.get_spell_checker(), range(8)))
+        spell = spells[0]
+        variables = [
+            (lambda: len(set(id(ele) for ele in spells)), ()),
+            (lambda: spell is lib.get_spell_checker(), ()),
+            (lambda: 'wi-fi' in spell and 'datafication' in spell, ()),
+        ]
+        controls = [
+            1,
+            True,
+            True,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_5(self):
+        filepath = abspath(self.tempdir, 'corrections.json')
+        cache = lib.CorrectionCache(maxsize=3)
+        cache.put('v1', 'fuhn', 'fun')
+        cache.put('v1', 'thessia', None)
+        cache.put('v1', 'ehscape', 'escape')
+        cache.get('v1', 'fuhn')  # fuhn is the most recent now, thessia goes first
+        cache.put('v1', 'wrld', 'world')
+        cache.save(filepath)
+        loaded = lib.CorrectionCache(maxsize=3)
+        loaded.load(filepath)
+
+        variables = [
+            (cache.get, ('v1', 'thessia')),
+            (cache.get, ('v1', 'fuhn')),
+            (cache.get, ('v2', 'fuhn')),
+            (loaded.get, ('v1', 'ehscape')),
+            (lambda: list(loaded.corrections), ()),
+        ]
+        controls = [
+            (False, None),
+            (True, 'fun'),
+            (False, None),
+            (True, 'escape'),
+            [('v1', 'fuhn'), ('v1', 'wrld'), ('v1', 'ehscape')],
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_6(self):
+        sources = {}
+        for key, content in [('non_words', 'pp\n'), ('dictionary', '# comment\nedu\n'), ('acronyms', 'EULA\n'), ('names', 'Du Bois\n')]:
+            sources[key] = abspath(self.tempdir, f'{key}.txt')
+            write_text_file(sources[key], content)
+        filepath = abspath(self.tempdir, 'dictionary.pickle')
+
+        def load(*added):
+            if added:
+                write_text_file(sources['dictionary'], '# comment\nedu\n' + ''.join(f'{ele}\n' for ele in added))
+            return sorted(lib.load_compiled_dictionary(sources=sources, filepath=filepath)['dictionary_low'])
+
+        def load_corrupted():
+            with open(filepath, 'wb') as wb:
+                wb.write(b'not a pickle')
+            return load()
+
+        expected = ["du bois", "du bois'", 'edu', 'eula', "eula's", 'eulas']
+        variables = [
+            (load, ()),
+            (lambda: os.path.isfile(filepath), ()),
+            (load, ()),
+            (load, ('datafication', )),
+            (load_corrupted, ()),
+        ]
+        controls = [
+            expected,
+            True,
+            expected,
+            sorted(expected + ['datafication']),
+            sorted(expected + ['datafication']),
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_7(self):
+        chunks = ['the wrld is fuhn\n', '\n', 'Thessia went home\nthe wrld again\n', 'a WRLD and Wrld\n', 'thessia was here']
+
+        def merged(chunks):
+            return lib.merge_spellchecks(chunks, [lib.spellcheck(ele) for ele in chunks])
+
+        variables = [
+            (merged, (chunks, )),
+            (merged, ([], )),
+        ]
+        controls = [
+            lib.spellcheck(''.join(chunks)),
+            ({}, {}, 0),
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
 
 if __name__ == '__main__':
     tc = TestCase()
@@ -100,5 +247,11 @@ if __name__ == '__main__':
     try:
         tc.test_case_0()
         tc.test_case_1()
+        tc.test_case_2()
+        tc.test_case_3()
+        tc.test_case_4()
+        tc.test_case_5()
+        tc.test_case_6()
+        tc.test_case_7()
     finally:
         tc.tearDown()
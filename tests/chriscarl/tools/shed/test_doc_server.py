@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+Author:         Chris Carl
+Email:          chrisbcarl@outlook.com
+Date:           2026-10-17
+Description:
+
+chriscarl.tools.shed.doc_server unit test.
+
+Updates:
+    2026-10-17 - tests.chriscarl.tools.shed.doc_server - run_tool leaves logging as it found it
+    2026-10-17 - tests.chriscarl.tools.shed.doc_server - initial commit
+'''
+
+# stdlib imports (expected to work)
+from __future__ import absolute_import, print_function, division, with_statement  # , unicode_literals
+import os
+import sys
+import logging
+import unittest
+import threading
+
+# third party imports
+
+# project imports (expected to work)
+from chriscarl.core import constants
+from chriscarl.core.lib.stdlib.os import abspath
+from chriscarl.core.lib.stdlib.unittest import UnitTest
+
+# test imports
+import chriscarl.tools.shed.doc_server as lib
+
+SCRIPT_RELPATH = 'tests/chriscarl/tools/shed/test_doc_server.py'
+if not hasattr(sys, '_MEIPASS'):
+    SCRIPT_FILEPATH = os.path.abspath(__file__)
+else:
+    SCRIPT_FILEPATH = os.path.abspath(os.path.join(sys._MEIPASS, SCRIPT_RELPATH))  # pylint: disable=no-member
+SCRIPT_DIRPATH = os.path.dirname(SCRIPT_FILEPATH)
+SCRIPT_NAME = os.path.splitext(os.path.basename(__file__))[0]
+THIS_MODULE = sys.modules[__name__]
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(logging.NullHandler())
+
+constants.fix_constants(lib)  # deal with namespace sharding the files across directories
+
+
+class TestCase(UnitTest):
+
+    def setUp(self):
+        return super().setUp()
+
+    def tearDown(self):
+        return super().tearDown()
+
+    @unittest.skipIf(sys.platform == 'win32', 'unix sockets')
+    def test_case_0(self):
+        address = abspath(self.tempdir, 'server.sock')
+        authkey_filepath = abspath(self.tempdir, 'server.key')
+        served = []
+        thread = threading.Thread(target=lambda: served.append(lib.serve(address, authkey_filepath=authkey_filepath, warm=False)), daemon=True)
+        thread.start()
+        for _ in range(100):
+            if os.path.exists(address):
+                break
+            thread.join(timeout=0.05)
+
+        def send(tool, *argv):
+            response = lib.send(lib.Request(tool, argv=list(argv), cwd=self.tempdir), address=address, authkey_filepath=authkey_filepath)
+            return response.returncode, response.output.splitlines()[0]
+
+        self.assertEqual(send(lib.PING)[0], 0)
+        self.assertEqual(send('nope', '--help'), (2, f"unknown tool 'nope', choose from {list(lib.TOOLS)}"))
+        self.assertEqual(send(lib.STOP), (0, 'stopping'))
+        thread.join(timeout=5)
+        self.assertEqual(served, [1])
+        self.assertEqual(lib.send(lib.Request(lib.PING), address=address, authkey_filepath=authkey_filepath), None)
+
+
+    def test_case_1(self):
+        md_filepath = abspath(self.tempdir, 'missing.md')
+        loggers = [logging.getLogger('chriscarl'), logging.getLogger()]
+        handlers = [list(logger.handlers) for logger in loggers]
+
+        def run(*argv):
+            response = lib.run_tool(lib.Request('md2latex', argv=list(argv), cwd=self.tempdir))
+            return response.returncode, response.output.splitlines()[0].split()[0], [list(logger.handlers) for logger in loggers] == handlers
+
+        variables = [
+            (run, ('--help', )),
+            (run, ()),
+            (lambda: run(md_filepath)[0::2], ()),
+            (lambda: 'does not exist' in lib.run_tool(lib.Request('md2latex', argv=[md_filepath], cwd=self.tempdir)).output, ()),
+        ]
+        controls = [
+            (0, 'usage:', True),
+            (1, 'usage:', True),
+            (1, True),
+            True,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+if __name__ == '__main__':
+    tc = TestCase()
+    tc.setUp()
+
+    try:
+        tc.test_case_0()
+        tc.test_case_1()
+    finally:
+        tc.tearDown()
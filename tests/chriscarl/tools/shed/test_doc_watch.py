@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+Author:         Chris Carl
+Email:          chrisbcarl@outlook.com
+Date:           2026-10-17
+Description:
+
+chriscarl.tools.shed.doc_watch unit test.
+
+Updates:
+    2026-10-17 - tests.chriscarl.tools.shed.doc_watch - inotify watches from the one walk, overflow re-watches
+    2026-10-17 - tests.chriscarl.tools.shed.doc_watch - debouncer
+    2026-10-17 - tests.chriscarl.tools.shed.doc_watch - iter_md_tables and benchmark against the old regex
+    2026-10-17 - tests.chriscarl.tools.shed.doc_watch - content cache
+    2026-10-17 - tests.chriscarl.tools.shed.doc_watch - incremental walk and index
+    2026-10-17 - tests.chriscarl.tools.shed.doc_watch - initial commit
+'''
+
+# stdlib imports (expected to work)
+from __future__ import absolute_import, print_function, division, with_statement  # , unicode_literals
+import os
+import sys
+import logging
+import unittest
+import time
+import re
+
+# third party imports
+
+# project imports (expected to work)
+from chriscarl.core import constants
+from chriscarl.core.lib.stdlib.os import abspath
+from chriscarl.core.lib.stdlib.unittest import UnitTest
+from chriscarl.core.lib.stdlib.io import write_text_file
+
+# test imports
+import chriscarl.tools.shed.doc_watch as lib
+
+SCRIPT_RELPATH = 'tests/chriscarl/tools/shed/test_doc_watch.py'
+if not hasattr(sys, '_MEIPASS'):
+    SCRIPT_FILEPATH = os.path.abspath(__file__)
+else:
+    SCRIPT_FILEPATH = os.path.abspath(os.path.join(sys._MEIPASS, SCRIPT_RELPATH))  # pylint: disable=no-member
+SCRIPT_DIRPATH = os.path.dirname(SCRIPT_FILEPATH)
+SCRIPT_NAME = os.path.splitext(os.path.basename(__file__))[0]
+THIS_MODULE = sys.modules[__name__]
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(logging.NullHandler())
+
+constants.fix_constants(lib)  # deal with namespace sharding the files across directories
+
+
+class TestCase(UnitTest):
+
+    def setUp(self):
+        return super().setUp()
+
+    def tearDown(self):
+        return super().tearDown()
+
+    def watcher_events(self, watcher_name):
+        filepath = abspath(self.tempdir, 'table.md')
+        write_text_file(filepath, '| a | b |\n')
+        mtimes = {}
+        with lib.get_watcher([self.tempdir], [r'.*\.md$'], mtimes=mtimes, watcher=watcher_name) as watcher:
+            created = watcher.scan()
+            time.sleep(0.05)
+            write_text_file(filepath, '| a | b | c |\n')
+            write_text_file(abspath(self.tempdir, 'ignored.txt'), 'not markdown')
+            modified = watcher.read(timeout=2)
+            os.remove(filepath)
+            deleted = watcher.read(timeout=2)
+        return (
+            [(event.event, event.filepath) for event in created],
+            sorted(set((event.event, event.filepath) for event in modified)),
+            [(event.event, event.filepath) for event in deleted],
+            mtimes,
+        )
+
+    def test_case_0(self):
+        filepath = abspath(self.tempdir, 'table.md')
+        variables = [
+            (self.watcher_events, ('poll', )),
+        ]
+        controls = [
+            (
+                [(lib.Events.created, filepath)],
+                [(lib.Events.modified, filepath)],
+                [(lib.Events.deleted, filepath)],
+                {},
+            ),
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    @unittest.skipUnless(lib.LINUX, 'inotify is linux only')
+    def test_case_1(self):
+        filepath = abspath(self.tempdir, 'table.md')
+        created, modified, deleted, mtimes = self.watcher_events('inotify')
+        self.assertEqual(created, [(lib.Events.created, filepath)])
+        self.assertTrue((lib.Events.modified, filepath) in modified)
+        self.assertEqual(deleted, [(lib.Events.deleted, filepath)])
+        self.assertEqual(mtimes, {})
+
+    def test_case_2(self):
+        os.makedirs(abspath(self.tempdir, 'sub'))
+        filepath = abspath(self.tempdir, 'sub', 'table.md')
+        write_text_file(filepath, '| a | b |\n')
+        index_filepath = abspath(self.tempdir, 'cache', 'index.json')
+        watcher = lib.PollingWatcher([self.tempdir], [r'.*\.md$'], exclude=['cache'])
+        self.assertEqual(watcher.walk(), [filepath])
+        watcher.save_index(index_filepath)
+
+        # a fresh watcher trusts the index, a settled directory is never listed again
+        reloaded = lib.PollingWatcher([self.tempdir], [r'.*\.md$'], exclude=['cache'])
+        self.assertTrue(reloaded.load_index(index_filepath))
+        self.assertEqual(reloaded.dirs, watcher.dirs)
+        self.assertFalse(lib.PollingWatcher([self.tempdir], [r'.*\.txt$']).load_index(index_filepath))
+
+        new_filepath = abspath(self.tempdir, 'sub', 'new.md')
+        write_text_file(new_filepath, '| c | d |\n')
+        self.assertEqual(sorted(reloaded.walk()), sorted([filepath, new_filepath]))
+
+    def test_case_3(self):
+        filepath = abspath(self.tempdir, 'table.md')
+        cache_filepath = abspath(self.tempdir, 'cache', 'cache.json')
+        write_text_file(filepath, '| a | b |\n')
+        cache = lib.ContentCache(cache_filepath, ['md_table_pretty'])
+        self.assertFalse(cache.is_fresh(filepath))
+        cache.update(filepath)
+        cache.save()
+
+        reloaded = lib.ContentCache(cache_filepath, ['md_table_pretty'])
+        self.assertTrue(reloaded.is_fresh(filepath))
+        self.assertFalse(lib.ContentCache(cache_filepath, ['md_table_pretty', 'md_tables_to_csvs']).is_fresh(filepath))
+
+        # touched but identical is still fresh, different content is not
+        os.utime(filepath, ns=(0, 0))
+        self.assertTrue(reloaded.is_fresh(filepath))
+        write_text_file(filepath, '| c | d |\n')
+        self.assertFalse(reloaded.is_fresh(filepath))
+
+    def test_case_4(self):
+        lines = [
+            'prose',
+            '  | a | b |',
+            '  | - | - |',
+            '```',
+            '| not | a table |',
+            '```',
+            '| c |',
+            'prose right after a table',
+            '~~~~',
+            '~~~',
+            '| still | fenced |',
+            '~~~~~',
+            '| d |',
+        ]
+        variables = [
+            (list, (lib.iter_md_tables(lines), )),
+            (list, (lib.iter_md_tables(f'{line}\r\n' for line in lines), )),
+        ]
+        expected = [
+            lib.MarkdownTable(1, 3, '  ', '| a | b |\n| - | - |'),
+            lib.MarkdownTable(6, 7, '', '| c |'),
+            lib.MarkdownTable(12, 13, '', '| d |'),
+        ]
+        controls = [
+            expected,
+            expected,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_5(self):
+        # the regex iter_md_tables replaced, rows without a closing | make it backtrack over the rest of the file for every row
+        regex = re.compile(r'\n(?P<indent>[ \t]*)\|(?P<table>.+?)\|\n\n', flags=re.DOTALL | re.MULTILINE)
+        timings = {}
+        for label, markdown in [
+            ('tables', ''.join(f'paragraph {t}\n\n| a | b |\n| - | - |\n| {t} | x |\n\n' for t in range(5000))),
+            ('unclosed', ''.join(f'| row {t} without a closing pipe\n' for t in range(3000))),
+        ]:
+            start = time.perf_counter()
+            list(regex.finditer(f'plz\n{markdown}\n\nplz'))
+            regex_time = time.perf_counter() - start
+            start = time.perf_counter()
+            list(lib.iter_md_tables(markdown.splitlines(keepends=True)))
+            scanner_time = time.perf_counter() - start
+            LOGGER.info('%s: regex %0.4f sec, iter_md_tables %0.4f sec', label, regex_time, scanner_time)
+            timings[label] = (regex_time, scanner_time)
+        self.assertLess(timings['unclosed'][1], timings['unclosed'][0])
+
+    def test_case_6(self):
+        now = [0.0]
+        debouncer = lib.Debouncer(quiet=0.25, max_latency=1.0, clock=lambda: now[0])
+        self.assertEqual(debouncer.timeout(), None)
+        debouncer.add('burst.md')
+        now[0] = 0.1
+        debouncer.add('single.md')
+        self.assertEqual(debouncer.pop_due(), [])
+
+        # single.md goes quiet, burst.md keeps getting saved
+        dues = []
+        for tick in [0.2, 0.4, 0.6, 0.8, 1.0]:
+            now[0] = tick
+            dues.append(debouncer.pop_due())
+            debouncer.add('burst.md')
+        self.assertEqual(dues, [[], ['single.md'], [], [], ['burst.md']])
+
+        # the save right at 1.0 starts a new burst
+        self.assertAlmostEqual(debouncer.timeout(), 0.25)
+        debouncer.discard('burst.md')
+        self.assertEqual(debouncer.timeout(), None)
+
+    @unittest.skipUnless(lib.LINUX, 'inotify is linux only')
+    def test_case_7(self):
+        os.makedirs(abspath(self.tempdir, 'sub'))
+        with lib.InotifyWatcher([self.tempdir], [r'.*\.md$']) as watcher:
+            # nothing is walked until scan, and scan watches exactly what it walked
+            self.assertEqual((watcher.dirs, watcher.wd_to_dirpath), ({}, {}))
+            watcher.scan()
+            self.assertEqual(sorted(watcher.wd_to_dirpath.values()), sorted(watcher.dirs))
+
+            # a directory made while the queue overflowed, its IN_CREATE is lost
+            os.makedirs(abspath(self.tempdir, 'new'))
+            watcher.translate([(-1, lib.IN_Q_OVERFLOW, 0, '')])
+            try:
+                while os.read(watcher.fd, 64 * 1024):
+                    pass
+            except BlockingIOError:
+                pass
+            filepath = abspath(self.tempdir, 'new', 'table.md')
+            write_text_file(filepath, '| a |\n')
+            events = watcher.read(timeout=2)
+        self.assertTrue((lib.Events.created, filepath) in [(event.event, event.filepath) for event in events])
+
+
+if __name__ == '__main__':
+    tc = TestCase()
+    tc.setUp()
+
+    try:
+        tc.test_case_0()
+        tc.test_case_1()
+        tc.test_case_2()
+        tc.test_case_3()
+        tc.test_case_4()
+        tc.test_case_5()
+        tc.test_case_6()
+        tc.test_case_7()
+    finally:
+        tc.tearDown()
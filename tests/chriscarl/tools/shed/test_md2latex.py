@@ -9,6 +9,9 @@ Description:
 chriscarl.tools.shed.md2latex unit test.
 
 Updates:
+    2026-10-17 - tests.chriscarl.tools.shed.md2latex - per-doclet spellcheck cache
+    2026-10-17 - tests.chriscarl.tools.shed.md2latex - phase profiler
+    2026-10-17 - tests.chriscarl.tools.shed.md2latex - doclet cache
     2026-01-25 - tests.chriscarl.tools.shed.md2latex - initial commit
 '''
 
@@ -18,6 +21,7 @@ import os
 import sys
 import logging
 import unittest
+from types import SimpleNamespace
 
 # third party imports
 
@@ -97,6 +101,107 @@ class TestCase(UnitTest):
         ]
         self.assert_null_hypothesis(variables, controls)
 
+    def test_case_2(self):
+        md_filepath = abspath(self.tempdir, 'paper.md')
+        write_text_file(md_filepath, 'whatever\n')
+        cache_filepath = abspath(self.tempdir, '.paper.doclets.json')
+        labels = {'marx': {'section': 'bib', 'label': 'marx'}, 'fig-a': {'section': 'img', 'label': 'fig-a'}}
+        doclets = [
+            SimpleNamespace(section='any', content='see <marx> for more', label='', caption='', data={}, appendix=False),
+            SimpleNamespace(section='any', content='nothing cited here', label='', caption='', data={}, appendix=False),
+            SimpleNamespace(section='any', content='see <fig-a>', label='', caption='', data={}, appendix=False),
+        ]
+
+        def render(labels):
+            cache = lib.DocletCache(cache_filepath)
+            _, renders, errors, _ = lib.doclets_to_latex(doclets, md_filepath, abspath(self.tempdir, 'paper.bib'), labels, 'chicago', cache=cache)
+            cache.save()
+            return renders['<BODY>'], errors, cache.hits, cache.misses
+
+        uncached = lib.doclets_to_latex(doclets, md_filepath, abspath(self.tempdir, 'paper.bib'), labels, 'chicago')[1]['<BODY>']
+        moved = dict(labels, **{'fig-a': {'section': 'img', 'label': 'fig-b'}})
+        variables = [
+            (render, (labels, )),
+            (render, (labels, )),
+            (render, (dict(labels, unrelated={'section': 'img', 'label': 'unrelated'}), )),
+            (lambda: render(moved)[2:], ()),
+        ]
+        controls = [
+            (uncached, [], 0, 3),
+            (uncached, [], 3, 0),
+            (uncached, [], 3, 0),
+            (2, 1),
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_3(self):
+        cprofile_dirpath = abspath(self.tempdir, 'prof')
+        profiler = lib.PhaseProfiler(cprofile_dirpath=cprofile_dirpath)
+        with profiler.phase('sections') as stats:
+            stats['sections'] = len(sum([[0] * 1000 for _ in range(100)], []))
+        try:
+            with profiler.phase('labels'):
+                sys.exit(1)
+        except SystemExit:
+            pass
+        report = profiler.report()
+
+        variables = [
+            (lambda: [ele['phase'] for ele in report['phases']], ()),
+            (lambda: report['phases'][0]['sections'], ()),
+            (lambda: all(ele['wall'] >= 0 and ele['cpu'] >= 0 for ele in report['phases']), ()),
+            (lambda: sorted(os.listdir(cprofile_dirpath)), ()),
+        ]
+        controls = [
+            ['sections', 'labels'],
+            100000,
+            True,
+            ['00.sections.prof', '01.labels.prof'],
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_4(self):
+        from chriscarl.core.lib.third import spellchecker
+
+        md_filepath = abspath(self.tempdir, 'paper.md')
+        write_text_file(md_filepath, 'the wrld is fuhn\n```\nignored wrld\n```\nThessia went home\n- a fuhn time\n')
+        cache_filepath = abspath(self.tempdir, '.paper.spellcheck.json')
+        doclets = [
+            SimpleNamespace(section='any', content='the wrld is fuhn'),
+            SimpleNamespace(section='code', content='ignored wrld'),
+            SimpleNamespace(section='any', content='Thessia went home'),
+            SimpleNamespace(section='list', content='- a fuhn time'),
+        ]
+
+        def check():
+            return lib.doclets_spellcheck(doclets, md_filepath, cache_filepath=cache_filepath)
+
+        def cached():
+            cache = lib.SpellcheckCache(cache_filepath, spellchecker.dictionary_version())
+            texts = [lib.get_words_only(doclet.content) for doclet in doclets if doclet.section != 'code']
+            return len(cache.doclets), [cache.get(cache.key(text)) is not None for text in texts]
+
+        def edit():
+            doclets[2].content = 'Thessia went hoem'
+            return check() == lib.doclets_spellcheck(doclets, md_filepath)
+
+        uncached = lib.doclets_spellcheck(doclets, md_filepath)
+        variables = [
+            (check, ()),
+            (check, ()),
+            (cached, ()),
+            (edit, ()),
+            (cached, ()),
+        ]
+        controls = [
+            uncached,
+            uncached,
+            (3, [True, True, True]),
+            True,
+            (3, [True, True, True]),
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
 
 if __name__ == '__main__':
     tc = TestCase()
@@ -105,5 +210,8 @@ if __name__ == '__main__':
     try:
         # tc.test_case_0()
         tc.test_case_1()
+        tc.test_case_2()
+        tc.test_case_3()
+        tc.test_case_4()
     finally:
         tc.tearDown()
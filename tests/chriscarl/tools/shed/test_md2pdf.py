@@ -9,6 +9,7 @@ Description:
 chriscarl.tools.shed.md2pdf unit test.
 
 Updates:
+    2026-10-17 - tests.chriscarl.tools.shed.md2pdf - batch inputs and output dirs
     2026-02-06 - tests.chriscarl.tools.shed.md2pdf - initial commit
 '''
 
@@ -25,6 +26,7 @@ import unittest
 from chriscarl.core import constants
 from chriscarl.core.lib.stdlib.os import abspath
 from chriscarl.core.lib.stdlib.unittest import UnitTest
+from chriscarl.core.lib.stdlib.io import write_text_file
 
 # test imports
 import chriscarl.tools.shed.md2pdf as lib
@@ -63,6 +65,34 @@ class TestCase(UnitTest):
         ]
         self.assert_null_hypothesis(variables, controls)
 
+    def test_case_1(self):
+        for relpath in ['a.md', 'notes/b.md', 'notes/c.txt', 'notes/.hidden/d.md', 'papers/a.md']:
+            os.makedirs(os.path.dirname(abspath(self.tempdir, relpath)), exist_ok=True)
+            write_text_file(abspath(self.tempdir, relpath), '# hi\n')
+
+        def resolve(*paths):
+            return [os.path.relpath(ele, self.tempdir).replace(os.sep, '/') for ele in lib.resolve_markdown_filepaths([abspath(self.tempdir, ele) for ele in paths])]
+
+        def output_dirpaths(output_dirpath, *relpaths):
+            dirpaths = lib.batch_output_dirpaths([abspath(self.tempdir, ele) for ele in relpaths], output_dirpath=output_dirpath)
+            return [os.path.relpath(ele, output_dirpath or self.tempdir).replace(os.sep, '/') for ele in dirpaths]
+
+        variables = [
+            (resolve, ('notes', )),
+            (resolve, ('a.md', '**/*.md', 'a.md')),
+            (resolve, ('nothing/*.md', )),
+            (output_dirpaths, (abspath(self.tempdir, 'out'), 'a.md', 'notes/b.md', 'papers/a.md')),
+            (output_dirpaths, ('', 'notes/b.md')),
+        ]
+        controls = [
+            ['notes/b.md'],
+            ['a.md', 'notes/b.md', 'papers/a.md'],
+            [],
+            ['a', 'notes/b', 'papers/a'],
+            ['notes/b'],
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
 
 if __name__ == '__main__':
     tc = TestCase()
@@ -70,5 +100,6 @@ if __name__ == '__main__':
 
     try:
         tc.test_case_0()
+        tc.test_case_1()
     finally:
         tc.tearDown()
@@ -9,6 +9,12 @@ Description:
 chriscarl.tools.shed.tex2pdf unit test.
 
 Updates:
+    2026-10-17 - tests.chriscarl.tools.shed.tex2pdf - -fmt interaction mode, failed precompile expiry
+    2026-10-17 - tests.chriscarl.tools.shed.tex2pdf - precompiled preamble
+    2026-10-17 - tests.chriscarl.tools.shed.tex2pdf - bibliography stamp
+    2026-10-17 - tests.chriscarl.tools.shed.tex2pdf - keep-aux build dir
+    2026-10-17 - tests.chriscarl.tools.shed.tex2pdf - convergence checks
+    2026-10-17 - tests.chriscarl.tools.shed.tex2pdf - build manifest
     2026-02-06 - tests.chriscarl.tools.shed.tex2pdf - initial commit
 '''
 
@@ -18,6 +24,7 @@ import os
 import sys
 import logging
 import unittest
+import time
 
 # third party imports
 
@@ -25,9 +32,11 @@ import unittest
 from chriscarl.core import constants
 from chriscarl.core.lib.stdlib.os import abspath
 from chriscarl.core.lib.stdlib.unittest import UnitTest
+from chriscarl.core.lib.stdlib.io import read_text_file, write_text_file
 
 # test imports
 import chriscarl.tools.shed.tex2pdf as lib
+from chriscarl.tools.shed import md2latex
 
 SCRIPT_RELPATH = 'tests/chriscarl/tools/shed/test_tex2pdf.py'
 if not hasattr(sys, '_MEIPASS'):
@@ -63,6 +72,161 @@ class TestCase(UnitTest):
         ]
         self.assert_null_hypothesis(variables, controls)
 
+    def test_case_1(self):
+        for name, content in [('paper.tex', '\\begin{document}'), ('paper.bib', '@book{marx,}'), ('image.png', 'png'), ('paper.pdf', '%PDF')]:
+            write_text_file(abspath(self.tempdir, name), content)
+        manifest_filepath = abspath(self.tempdir, '.paper.pdf.json')
+        pdf_filepath = abspath(self.tempdir, 'paper.pdf')
+        extras = [abspath(self.tempdir, 'image.png')]
+
+        def is_current(template='ieee'):
+            return lib.is_build_current(manifest_filepath, lib.build_inputs('paper', self.tempdir, template, extra_filepaths=extras), pdf_filepath)
+
+        never_built = is_current()
+        lib.save_manifest(manifest_filepath, lib.build_inputs('paper', self.tempdir, 'ieee', extra_filepaths=extras), pdf_filepath)
+        unchanged = is_current()
+        other_template = is_current('chicago')
+        write_text_file(extras[0], 'png but different')
+        asset_changed = is_current()
+        self.assertEqual([never_built, unchanged, other_template, asset_changed], [False, True, False, False])
+
+    def test_case_2(self):
+
+        def after_pass(log, aux, toc=None):
+            before = lib.convergence_hashes(self.tempdir, 'paper')
+            write_text_file(abspath(self.tempdir, 'paper.log'), log)
+            write_text_file(abspath(self.tempdir, 'paper.aux'), aux)
+            if toc is not None:
+                write_text_file(abspath(self.tempdir, 'paper.toc'), toc)
+            return lib.needs_rerun(self.tempdir, 'paper', before)
+
+        variables = [
+            (after_pass, ('LaTeX Warning: Label(s) may have changed. Rerun to get cross-references right.', '\\newlabel{a}{1}')),
+            (after_pass, ('', '\\newlabel{a}{1}')),
+            (after_pass, ('', '\\newlabel{a}{1}', '\\contentsline{section}{Intro}{1}')),
+            (after_pass, ('', '\\newlabel{a}{1}', '\\contentsline{section}{Intro}{1}')),
+            (after_pass, ('LaTeX Warning: There were undefined references.', '\\newlabel{a}{1}')),
+            (after_pass, ('LaTeX Warning: There were undefined references.', '\\newlabel{b}{1}')),
+        ]
+        controls = [
+            "latex says 'Label(s) may have changed'",
+            '',
+            '.toc changed',
+            '',
+            '',
+            'undefined references and the .aux changed',
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_3(self):
+        build_dirpath = abspath(self.tempdir, '.paper.build')
+        tex_filepath = abspath(self.tempdir, 'paper.tex')
+        write_text_file(tex_filepath, '\\begin{document}')
+        aux_filepath = abspath(build_dirpath, 'paper.aux')
+
+        def build(template, clean=False):
+            wiped = lib.prepare_build_dirpath(build_dirpath, template, clean=clean)
+            copied = lib.sync_build_dirpath([tex_filepath, abspath(self.tempdir, 'missing.bib')], self.tempdir, build_dirpath)
+            kept = os.path.isfile(aux_filepath)
+            write_text_file(aux_filepath, '\\relax')  # what pdflatex would leave behind
+            return wiped, [os.path.basename(filepath) for filepath in copied], kept
+
+        variables = [
+            (build, ('chicago', )),
+            (build, ('chicago', )),
+            (build, ('ieee', )),
+            (build, ('ieee', True)),
+        ]
+        controls = [
+            (False, ['paper.tex'], False),
+            (False, [], True),
+            (True, ['paper.tex'], False),
+            (True, ['paper.tex'], False),
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_4(self):
+        write_text_file(abspath(self.tempdir, 'paper.bib'), '@book{marx, title={Capital}}')
+        write_text_file(abspath(self.tempdir, 'paper.aux'), '\\relax\n\\citation{marx}\n\\bibdata{paper}\n\\newlabel{a}{1}\n')
+        stamp = lib.bibliography_stamp('paper', self.tempdir, 'bibtex')
+
+        def stamp_after(filename, content):
+            write_text_file(abspath(self.tempdir, filename), content)
+            return lib.bibliography_stamp('paper', self.tempdir, 'bibtex') == stamp
+
+        variables = [
+            (stamp_after, ('paper.aux', '\\relax\n\\citation{marx}\n\\bibdata{paper}\n\\newlabel{a}{2}\n')),
+            (stamp_after, ('paper.aux', '\\relax\n\\citation{marx}\n\\citation{marx}\n\\bibdata{paper}\n')),
+            (stamp_after, ('paper.aux', '\\relax\n\\citation{engels}\n\\citation{marx}\n\\bibdata{paper}\n')),
+            (stamp_after, ('paper.aux', '\\relax\n\\citation{marx}\n\\bibdata{paper}\n')),
+            (stamp_after, ('paper.bib', '@book{marx, title={Das Kapital}}')),
+        ]
+        controls = [
+            True,
+            True,
+            False,
+            True,
+            False,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_5(self):
+        fmt_dirpath = abspath(self.tempdir, 'fmt')
+        preamble = '\\documentclass{article}\n\\usepackage{amsmath}\n'
+        write_text_file(abspath(self.tempdir, 'plain.tex'), f'{preamble}\\begin{{document}}\nhi\n\\end{{document}}\n')
+        write_text_file(abspath(self.tempdir, 'a.tex'), f'{preamble}{lib.FMT_MARKER}\n\\title{{a}}\n\\begin{{document}}\na\n\\end{{document}}\n')
+        write_text_file(abspath(self.tempdir, 'b.tex'), f'{preamble}{lib.FMT_MARKER}\n\\title{{b}}\n\\begin{{document}}\nb\n\\end{{document}}\n')
+
+        def marker_count(template):
+            return read_text_file(md2latex.TEMPLATES[template]).count(lib.FMT_MARKER)
+
+        def same_format(*tex_filenames):
+            return len(set(lib.build_format(abspath(self.tempdir, ele), fmt_dirpath=fmt_dirpath) for ele in tex_filenames))
+
+        variables = [
+            (lib.build_format, (abspath(self.tempdir, 'plain.tex'), fmt_dirpath)),
+            (marker_count, ('chicago', )),
+            (marker_count, ('ieee', )),
+            (same_format, ('a.tex', 'b.tex', 'a.tex')),
+        ]
+        controls = [
+            '',
+            1,
+            1,
+            1,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+
+    def test_case_6(self):
+        fmt_dirpath = abspath(self.tempdir, 'fmt')
+        preamble = '\\documentclass{article}\n'
+        tex_filepath = abspath(self.tempdir, 'paper.tex')
+        write_text_file(tex_filepath, f'{preamble}{lib.FMT_MARKER}\n\\begin{{document}}\nhi\n\\end{{document}}\n')
+        failed_filepath = abspath(fmt_dirpath, f'{lib.format_name(preamble)}.failed')
+        os.makedirs(fmt_dirpath)
+        write_text_file(failed_filepath, 'mylatexformat.ltx not found')
+
+        def retried(age):
+            os.utime(failed_filepath, (time.time() - age, time.time() - age))
+            before = os.path.getmtime(failed_filepath)
+            lib.build_format(tex_filepath, fmt_dirpath=fmt_dirpath)
+            # retried means it either worked (marker gone) or failed again just now
+            return not os.path.isfile(failed_filepath) or os.path.getmtime(failed_filepath) > before
+
+        variables = [
+            (lib.pdflatex_cmd, ('paper', )),
+            (lib.pdflatex_cmd, ('paper', True)),
+            (retried, (60, )),
+            (retried, (lib.FMT_FAILED_TTL + 60, )),
+        ]
+        controls = [
+            ['pdflatex', 'paper'],
+            ['pdflatex', f'-interaction={lib.PDFLATEX_INTERACTION}', '-fmt=paper', 'paper'],
+            False,
+            True,
+        ]
+        self.assert_null_hypothesis(variables, controls)
 
 if __name__ == '__main__':
     tc = TestCase()
@@ -70,5 +234,11 @@ if __name__ == '__main__':
 
     try:
         tc.test_case_0()
+        tc.test_case_1()
+        tc.test_case_2()
+        tc.test_case_3()
+        tc.test_case_4()
+        tc.test_case_5()
+        tc.test_case_6()
     finally:
         tc.tearDown()
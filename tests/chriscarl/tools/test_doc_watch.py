@@ -9,6 +9,13 @@ Description:
 chriscarl.tools.doc_watch unit test.
 
 Updates:
+    2026-10-17 - tests.chriscarl.tools.doc_watch - unreadable markdown and sibling -tblNN.md csvs survive
+    2026-10-17 - tests.chriscarl.tools.doc_watch - startup catch-up seeds unseen files
+    2026-10-17 - tests.chriscarl.tools.doc_watch - incremental csvs
+    2026-10-17 - tests.chriscarl.tools.doc_watch - self-write suppression
+    2026-10-17 - tests.chriscarl.tools.doc_watch - transform_md_tables scaling microbenchmark
+    2026-10-17 - tests.chriscarl.tools.doc_watch - transform_md_tables chains funcs
+    2026-10-17 - tests.chriscarl.tools.doc_watch - map_files aggregation
     2026-02-27 - tests.chriscarl.tools.doc_watch - initial commit
 '''
 
@@ -18,6 +25,7 @@ import os
 import sys
 import logging
 import unittest
+import time
 from typing import Any
 
 # third party imports
@@ -26,6 +34,7 @@ from typing import Any
 from chriscarl.core import constants
 from chriscarl.core.lib.stdlib.os import abspath
 from chriscarl.core.lib.stdlib.unittest import UnitTest
+from chriscarl.core.lib.stdlib.io import write_text_file
 
 # test imports
 import chriscarl.tools.doc_watch as lib
@@ -68,6 +77,151 @@ class TestCase(UnitTest):
         ]
         self.assert_null_hypothesis(variables, controls)
 
+    def test_case_1(self):
+
+        def upper(filepaths):
+            return [filepath for filepath in filepaths if filepath.isupper()], []
+
+        def crash(filepaths):
+            raise RuntimeError('boom')
+
+        variables = [
+            (lib.map_files, (['A', 'b', 'A', 'C'], [upper, crash])),
+        ]
+        controls = [
+            [
+                (['A', 'C'], []),
+                ([], [(filepath, f"'crash' crashed! boom, \"{filepath}\"") for filepath in ['A', 'b', 'A', 'C']]),
+            ],
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_2(self):
+
+        def fail(table):
+            raise ValueError('nope')
+
+        markdown = 'text\n\n| a | b |\n| - | - |\n\nmore\n'
+        new_markdown, tables, errors, changers = lib.transform_md_tables(markdown, [str.upper, fail, str.lower, str.upper], extract=True)
+        self.assertEqual(new_markdown, 'text\n\n| A | B |\n| - | - |\n\nmore\n')
+        self.assertEqual(tables, ['| A | B |\n| - | - |'])
+        self.assertEqual([(func, lineno) for func, _, lineno in errors], [(fail, 3)])
+        self.assertEqual(changers, [str.upper, str.lower])
+
+    def benchmark_transform_md_tables(self, tables, repeat=3):
+        # type: (int, int) -> float
+        markdown = ''.join(f'paragraph {t}\n\n| a | b |\n| - | - |\n| {t} | x |\n\n' for t in range(tables))
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            new_markdown, _, _, _ = lib.transform_md_tables(markdown, [str.upper])
+            best = min(best, time.perf_counter() - start)
+        self.assertEqual(len(new_markdown), len(markdown))
+        return best
+
+    def test_case_3(self):
+        # 4x the tables should be ~4x the time, splicing the string per table would be ~16x
+        small = self.benchmark_transform_md_tables(2000)
+        large = self.benchmark_transform_md_tables(8000)
+        LOGGER.info('transform_md_tables: 2000 tables %0.4f sec, 8000 tables %0.4f sec, %0.1fx', small, large, large / small)
+        self.assertLess(large / small, 10)
+
+    def test_case_4(self):
+        filepath = abspath(self.tempdir, 'table.md')
+        write_text_file(filepath, '| a | b |\n')
+        self.assertFalse(lib.is_self_write(filepath))
+        lib.SELF_WRITTEN[filepath] = lib.doc_watch.md5_file(filepath)
+        self.assertTrue(lib.is_self_write(filepath))
+        os.utime(filepath, ns=(0, 0))  # an mtime bump alone is still ours
+        self.assertTrue(lib.is_self_write(filepath))
+        write_text_file(filepath, '| a | b | c |\n')
+        self.assertFalse(lib.is_self_write(filepath))
+        self.assertTrue(filepath not in lib.SELF_WRITTEN)
+
+    def test_case_5(self):
+        filepath = abspath(self.tempdir, 'table.md')
+        first = '| a | b |\n| - | - |\n| 1 | 2 |'
+        second = '| c |\n| - |\n| 3 |'
+
+        def csvs(table_texts):
+            written, skipped, deleted = lib.write_table_csvs(filepath, table_texts)
+            return [sorted(os.path.basename(csv_filepath) for csv_filepath in lst) for lst in (written, skipped, deleted)]
+
+        variables = [
+            (csvs, ([first], )),
+            (csvs, ([first], )),
+            (csvs, ([first, second], )),
+            (csvs, ([first, second.replace('3', '4')], )),
+            (csvs, ([], )),
+        ]
+        controls = [
+            [['table.csv'], [], []],
+            [[], ['table.csv'], []],
+            [['table-tbl00.csv', 'table-tbl01.csv'], [], ['table.csv']],
+            [['table-tbl01.csv'], ['table-tbl00.csv'], []],
+            [[], [], ['table-tbl00.csv', 'table-tbl01.csv']],
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_6(self):
+        seen_filepath, unseen_filepath = abspath(self.tempdir, 'seen.md'), abspath(self.tempdir, 'unseen.md')
+        for filepath in [seen_filepath, unseen_filepath]:
+            write_text_file(filepath, '| a | b |\n')
+        cache = lib.doc_watch.ContentCache(abspath(self.tempdir, 'cache', 'cache.json'), ['record'])
+        cache.update(seen_filepath)
+        time.sleep(0.01)
+        write_text_file(seen_filepath, '| a | b | c |\n')  # changed while we werent watching
+        processed = []
+
+        def record(filepaths):
+            processed.extend(filepaths)
+            return [], []
+
+        def catch_up():
+            processed.clear()
+            lib.catch_up([seen_filepath, unseen_filepath], [record], cwd=self.tempdir, cache=cache)
+            return list(processed), unseen_filepath in cache
+
+        variables = [
+            (catch_up, ()),
+            (catch_up, ()),
+        ]
+        controls = [
+            ([seen_filepath], True),
+            ([], True),
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_7(self):
+        filepath = abspath(self.tempdir, 'table.md')
+        sibling_filepath = abspath(self.tempdir, 'table-tbl01.md')
+        write_text_file(filepath, '| a | b |\n| - | - |\n| 1 | 2 |\n')
+        write_text_file(sibling_filepath, '| c |\n| - |\n| 3 |\n')
+
+        def csvs(*filepaths, fuse=False):
+            [(_, errors)] = lib.map_files(list(filepaths), [lib.md_tables_to_csvs], fuse=fuse)
+            return sorted(os.listdir(abspath(self.tempdir, 'csvs'))), [file for file, _ in errors]
+
+        def unreadable(fuse):
+            if os.path.isfile(filepath):
+                os.remove(filepath)
+                os.makedirs(filepath)  # anything open() chokes on, a locked or vanished file in real life
+            return csvs(filepath, fuse=fuse)
+
+        variables = [
+            (csvs, (filepath, sibling_filepath)),
+            (csvs, (filepath, )),
+            (unreadable, (False, )),
+            (unreadable, (True, )),
+        ]
+        controls = [
+            (['table-tbl01.csv', 'table.csv'], []),
+            (['table-tbl01.csv', 'table.csv'], []),
+            (['table-tbl01.csv', 'table.csv'], [filepath]),
+            (['table-tbl01.csv', 'table.csv'], [filepath]),
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
 
 if __name__ == '__main__':
     tc = TestCase()
@@ -75,5 +229,12 @@ if __name__ == '__main__':
 
     try:
         tc.test_case_0()
+        tc.test_case_1()
+        tc.test_case_2()
+        tc.test_case_3()
+        tc.test_case_4()
+        tc.test_case_5()
+        tc.test_case_6()
+        tc.test_case_7()
     finally:
         tc.tearDown()
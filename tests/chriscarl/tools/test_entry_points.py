@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+Author:         Chris Carl
+Email:          chrisbcarl@outlook.com
+Date:           2026-10-17
+Description:
+
+every console script in pyproject.toml, `--help` has to come back inside an import-time budget
+and without importing the heavy dependencies that only real work needs.
+
+Updates:
+    2026-10-17 - tests.chriscarl.tools.entry_points - md2pdf-batch
+    2026-10-17 - tests.chriscarl.tools.entry_points - initial commit
+'''
+
+# stdlib imports (expected to work)
+from __future__ import absolute_import, print_function, division, with_statement  # , unicode_literals
+import os
+import sys
+import logging
+import unittest
+import subprocess
+import json
+import tomllib
+from typing import Dict, List, Set, Tuple
+
+# third party imports
+
+# project imports (expected to work)
+from chriscarl.core.lib.stdlib.os import abspath
+from chriscarl.core.lib.stdlib.unittest import UnitTest
+
+SCRIPT_RELPATH = 'tests/chriscarl/tools/test_entry_points.py'
+if not hasattr(sys, '_MEIPASS'):
+    SCRIPT_FILEPATH = os.path.abspath(__file__)
+else:
+    SCRIPT_FILEPATH = os.path.abspath(os.path.join(sys._MEIPASS, SCRIPT_RELPATH))  # pylint: disable=no-member
+SCRIPT_DIRPATH = os.path.dirname(SCRIPT_FILEPATH)
+SCRIPT_NAME = os.path.splitext(os.path.basename(__file__))[0]
+THIS_MODULE = sys.modules[__name__]
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(logging.NullHandler())
+
+PYPROJECT_FILEPATH = abspath(SCRIPT_DIRPATH, '..', '..', '..', 'pyproject.toml')
+# seconds of imports on top of a bare interpreter, generous so slow CI boxes dont flake
+IMPORT_BUDGET = 1.0
+IMPORT_BUDGETS = {}  # type: Dict[str, float]
+# modules that only the real work needs, --help importing them is a regression
+DEFERRED_MODULES = {
+    'md2latex': ['markdown2', 'spellchecker'],
+    'md2pdf': ['markdown2', 'spellchecker'],
+    'md2pdf-batch': ['markdown2', 'spellchecker'],
+    'html2md': ['markdownify'],
+    'ipynb': ['chriscarl.core.lib.third.selenium'],
+    'mathml2latex': ['mathml_to_latex'],
+    'doc-server': ['chriscarl.tools.md2latex', 'chriscarl.tools.md2pdf'],
+}
+HELP_SNIPPET = '''
+import sys, json
+sys.argv = [{name!r}, '--help']
+from {module} import {func}
+try:
+    {func}()
+except SystemExit:
+    pass
+print(json.dumps(sorted(sys.modules)))
+'''
+
+
+def get_console_scripts():
+    # type: () -> Dict[str, Tuple[str, str]]
+    with open(PYPROJECT_FILEPATH, 'rb') as rb:
+        pyproject = tomllib.load(rb)
+    scripts = {}
+    for name, target in pyproject['tool']['poetry']['scripts'].items():
+        module, _, func = target.partition(':')
+        scripts[name] = (module, func)
+    return scripts
+
+
+def parse_importtime(stderr):
+    # type: (str) -> Dict[str, int]
+    '''top level modules and their cumulative import time in microseconds'''
+    cumulatives = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line.split('|', 2)
+        if not cumulative.strip().isdigit() or name.startswith('  '):
+            continue
+        cumulatives[name.strip()] = int(cumulative)
+    return cumulatives
+
+
+def import_help(name, module, func):
+    # type: (str, str, str) -> Tuple[float, Set[str], str]
+    '''
+    Returns:
+        Tuple[float, Set[str], str]
+            seconds spent importing beyond a bare interpreter, modules loaded, the help text
+    '''
+    baseline = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'pass'], capture_output=True, text=True, check=True)
+    baseline_modules = set(parse_importtime(baseline.stderr))
+    snippet = HELP_SNIPPET.format(name=name, module=module, func=func)
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', snippet], capture_output=True, text=True, check=True)
+    *help_lines, modules_line = proc.stdout.rstrip().splitlines()
+    cumulatives = parse_importtime(proc.stderr)
+    elapsed = sum(us for mod, us in cumulatives.items() if mod not in baseline_modules) / 1e6
+    return elapsed, set(json.loads(modules_line)), '\n'.join(help_lines)
+
+
+class TestCase(UnitTest):
+
+    def setUp(self):
+        return super().setUp()
+
+    def tearDown(self):
+        return super().tearDown()
+
+    def test_case_0(self):
+        scripts = get_console_scripts()
+        self.assertTrue(set(DEFERRED_MODULES).issubset(scripts))
+        for name, (module, func) in scripts.items():
+            elapsed, loaded, help_text = import_help(name, module, func)
+            LOGGER.info('%s --help imports in %0.3f sec', name, elapsed)
+            self.assertIn('usage:', help_text, name)
+            self.assertEqual(sorted(set(DEFERRED_MODULES.get(name, [])) & loaded), [], f'{name} --help imported deferred modules')
+            budget = IMPORT_BUDGETS.get(name, IMPORT_BUDGET)
+            self.assertLess(elapsed, budget, f'{name} --help spent {elapsed:0.3f} sec importing, budget is {budget:0.3f} sec')
+
+
+if __name__ == '__main__':
+    tc = TestCase()
+    tc.setUp()
+
+    try:
+        tc.test_case_0()
+    finally:
+        tc.tearDown()